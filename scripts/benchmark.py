@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the scaffolder: profiles cold/warm, config and git.
+
+Every profile is scaffolded into a temporary directory "cold" (fresh
+template environment and plan cache, like a new CLI process) and "warm"
+(everything already loaded, like batch mode). Virtualenv creation and
+the pre-commit install are never run; the git benchmark only builds the
+baseline commit.
+
+Results are written as JSON; --compare fails (exit 1) when a benchmark's
+fastest sample (min-of-N, the least noisy statistic) is more than
+--threshold slower than the baseline file's. Benchmarks whose baseline is
+under MIN_GATED_MS are reported but never fail the run, and
+--report-only prints regressions without failing at all.
+
+Usage:
+    python scripts/benchmark.py [--repeat 10] [--output results.json]
+        [--compare benchmarks/baseline.json] [--threshold 1.0] [--report-only]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import (  # noqa: E402
+    config_manager, engine, git_ops, plan, render_cache, templating
+)
+from project_generator.assets import configs  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# Benchmarks faster than this are dominated by scheduler noise
+MIN_GATED_MS = 1.0
+
+CONTEXT = {
+    "__PROJECT_NAME__": "bench_project",
+    "__AUTHOR_NAME__": "Bench",
+    "__PROJECT_DESCRIPTION__": "Benchmark project.",
+}
+
+# Keeps commits reproducible and independent of the user's git config
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+}
+
+
+def reset_caches():
+    """Drops everything a fresh process would have to load again."""
+    engine.env = templating.create_environment()
+    plan.get_plan.cache_clear()
+    templating.bundled_index.cache_clear()
+    templating._source_refs.cache_clear()
+    templating._source_variables.cache_clear()
+    render_cache.get_cache().clear()
+    render_cache._variables.clear()
+
+
+def measure(func, repeat, setup=None):
+    """Runs func repeat times and returns timing statistics in ms."""
+    samples = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "stdev_ms": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "samples": len(samples),
+    }
+
+
+def scaffold(profile_name, cold):
+    """Returns a benchmark body scaffolding one profile into a temp dir."""
+    context = dict(CONTEXT, __PROFILE__=profile_name)
+
+    def run(_):
+        if cold:
+            reset_caches()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            engine.create_structure(tmpdir, context=dict(context), setup_venv=False)
+
+    return run
+
+
+def render(profile_name):
+    """Returns a benchmark body rendering one profile in memory (warm)."""
+    context = dict(CONTEXT, __PROFILE__=profile_name)
+    return lambda _: engine.render_tree(context)
+
+
+def config_roundtrip(tmpdir):
+    """Returns a benchmark body doing a config set + get round-trip."""
+    path = os.path.join(tmpdir, "config.toml")
+
+    def run(_):
+        with patch.object(config_manager, "get_config_path", return_value=Path(path)):
+            config_manager.set_setting("author_name", "Bench")
+            config_manager.get_setting("author_name")
+
+    return run
+
+
+def git_baseline(tmpdir):
+    """Returns setup/body functions for init_git without installing hooks."""
+    files = [
+        (path, data)
+        for path, (data, _) in sorted(engine.render_tree(CONTEXT).items())
+        if data is not None
+    ]
+    counter = iter(range(1_000_000))
+
+    def setup():
+        target = os.path.join(tmpdir, f"repo{next(counter)}")
+        os.makedirs(target)
+        return target
+
+    def run(target):
+        with patch.object(git_ops, "install_hooks"), patch.dict(os.environ, GIT_ENV):
+            git_ops.init_git(target, files=files)
+
+    return setup, run
+
+
+def run_suite(repeat=10, profiles=None):
+    """Runs every benchmark and returns {name: stats}."""
+    profiles = profiles or configs.list_profiles()
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()), tempfile.TemporaryDirectory() as tmpdir:
+        for profile_name in profiles:
+            results[f"scaffold/{profile_name}/cold"] = measure(scaffold(profile_name, True), repeat)
+            results[f"scaffold/{profile_name}/warm"] = measure(scaffold(profile_name, False), repeat)
+            results[f"render/{profile_name}/warm"] = measure(render(profile_name), repeat)
+
+        results["config/roundtrip"] = measure(config_roundtrip(tmpdir), repeat)
+        if shutil.which("git"):
+            setup, run = git_baseline(tmpdir)
+            results["git/baseline"] = measure(run, repeat, setup=setup)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns (name, baseline_ms, current_ms) for every regression.
+
+    Compares fastest samples and skips benchmarks whose baseline is
+    below MIN_GATED_MS.
+    """
+    regressions = []
+    for name, stats in results.items():
+        previous = baseline.get(name)
+        if not previous or previous["min_ms"] < MIN_GATED_MS:
+            continue
+        if stats["min_ms"] > previous["min_ms"] * (1 + threshold):
+            regressions.append((name, previous["min_ms"], stats["min_ms"]))
+    return regressions
+
+
+def print_results(results, baseline=None):
+    """Prints a table of medians, with the baseline alongside if given."""
+    baseline = baseline or {}
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}}  {'median':>10}  {'min':>10}  {'baseline':>10}")
+    for name, stats in results.items():
+        previous = baseline.get(name, {}).get("median_ms")
+        previous = f"{previous:>8.2f}ms" if previous is not None else f"{'-':>10}"
+        print(
+            f"{name:<{width}}  {stats['median_ms']:>8.2f}ms  {stats['min_ms']:>8.2f}ms  {previous}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10, help="Samples per benchmark")
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=configs.list_profiles(),
+        help="Only benchmark this profile (repeatable)"
+    )
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.environ.get("FORGE_BENCH_THRESHOLD", "1.0")),
+        help="Allowed slowdown vs. the baseline's fastest sample (default: 1.0 = twice as slow)"
+    )
+    parser.add_argument(
+        "--report-only",
+        action="store_true",
+        help="Print regressions against --compare without failing"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.repeat, args.profile)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.output:
+        payload = {
+            "version": RESULTS_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nResults written to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            marker = "⚠️" if args.report_only else "❌"
+            print(f"{marker} Regression: {name} {before:.2f}ms -> {after:.2f}ms")
+        if regressions and not args.report_only:
+            return 1
+        if not regressions:
+            print(f"✅ No regressions over {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
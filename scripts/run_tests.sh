@@ -12,3 +12,6 @@ ansible-lint ansible/
 
 echo "Running Pytest..."
 pytest
+
+echo "Running Benchmarks (report only; CI gates on them)..."
+python scripts/benchmark.py --repeat 5 --compare benchmarks/baseline.json --output bench_results.json --report-only
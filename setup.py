@@ -0,0 +1,41 @@
+"""Build hook: precompile the Jinja2 templates into the package.
+
+All metadata lives in pyproject.toml; this file only extends build_py.
+"""
+import importlib.util
+import os
+
+from setuptools import setup
+from setuptools.command.build_py import build_py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class BuildPyWithTemplates(build_py):
+    """Runs build_py, then writes _compiled_templates.zip, the index and static outputs."""
+
+    def run(self):
+        super().run()
+        spec = importlib.util.spec_from_file_location(
+            "_forge_templating",
+            os.path.join(HERE, "src", "project_generator", "templating.py"),
+        )
+        templating = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(templating)
+
+        target = os.path.join(
+            self.build_lib, "project_generator", "_compiled_templates.zip"
+        )
+        templating.compile_templates(target)
+        print(f"compiled templates -> {target}")
+
+        index = os.path.join(self.build_lib, "project_generator", "_template_index.json")
+        templating.write_index(index)
+        print(f"template index -> {index}")
+
+        static = os.path.join(self.build_lib, "project_generator", "_static_templates")
+        templating.write_static(static)
+        print(f"static templates -> {static}")
+
+
+setup(cmdclass={"build_py": BuildPyWithTemplates})
@@ -0,0 +1,153 @@
+"""Stream a scaffold into a tar.gz or zip archive instead of a directory.
+
+Files are rendered one at a time and written straight into the archive,
+so memory stays bounded by the largest single file and nothing touches
+the filesystem. Output is deterministic: entries are sorted, and
+timestamps, owners and modes are fixed, so identical inputs produce
+byte-identical archives that can be cached by hash. The scaffold's
+`.forge/manifest.json` is appended last, so an extracted archive
+supports `--update` like a normal scaffold.
+"""
+import gzip
+import io
+import tarfile
+import zipfile
+
+from jinja2 import TemplatesNotFound
+
+from . import engine, manifest, plan, templating, timing
+from .monorepo import NAME_PATTERN
+
+FORMATS = ("tar.gz", "zip")
+
+# 1980-01-01T00:00:00Z, the earliest timestamp zip can represent
+ARCHIVE_MTIME = 315532800
+
+
+def format_for(path):
+    """Guesses the archive format from a file name (tar.gz by default)."""
+    return "zip" if path.lower().endswith(".zip") else "tar.gz"
+
+
+def iter_entries(context=None):
+    """Yields (path, bytes or None, mode) for a scaffold, sorted by path.
+
+    Directories come with None as their content. Each file is rendered
+    only when it is reached; the manifest entry is yielded last.
+
+    Raises:
+        jinja2.TemplatesNotFound: If the profile references missing templates.
+    """
+    if context is None:
+        context = {}
+    jinja_context = engine.build_jinja_context(context)
+    render_plan = plan.get_plan(jinja_context["profile"], jinja_context["package_manager"])
+    override_dir = templating.get_override_dir()
+    digests = {t: templating.template_digest(t, override_dir) for t in render_plan.templates}
+    missing = [t for t, digest in digests.items() if digest is None]
+    if missing:
+        raise TemplatesNotFound(missing)
+
+    templates = dict(render_plan.files)
+    entries = sorted(
+        [(d, None) for d in render_plan.directories] + [(f, t) for f, t in render_plan.files]
+    )
+    ctx_hash = manifest.context_hash(jinja_context)
+    scaffold_manifest = manifest.new_manifest(jinja_context["profile"], context)
+
+    for path, template_name in entries:
+        if path not in templates:
+            yield path, None, engine.DIR_MODE
+            continue
+        data = engine.render_file(template_name, jinja_context, digests.get(template_name))
+        scaffold_manifest["files"][path] = {
+            "template": template_name,
+            "template_digest": digests.get(template_name),
+            "context_hash": ctx_hash,
+            "content_hash": manifest.content_hash(data),
+        }
+        yield path, data, engine.FILE_MODE
+
+    yield manifest.MANIFEST_PATH, manifest.dumps(scaffold_manifest).encode(), engine.FILE_MODE
+
+
+def check_root(root):
+    """Rejects archive roots that could escape the extraction directory.
+
+    Raises:
+        ValueError: If root is not a single plain directory name.
+    """
+    if root and not NAME_PATTERN.match(root):
+        raise ValueError(
+            f"Invalid archive root {root!r} (one directory name: letters, digits, '.', '_', '-')"
+        )
+
+
+def write_archive(fileobj, context=None, fmt="tar.gz", root=""):
+    """Streams a scaffold into fileobj as a tar.gz or zip archive.
+
+    Args:
+        fileobj: A writable binary file; it does not need to be seekable,
+            so sys.stdout.buffer works.
+        context: Dictionary of placeholders, as for create_structure.
+        fmt: "tar.gz" or "zip".
+        root: Optional directory name to place every entry under.
+
+    Returns:
+        The number of files written.
+
+    Raises:
+        ValueError: If fmt is unknown or root is not a plain directory name.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown archive format {fmt!r} (expected {' or '.join(FORMATS)})")
+    check_root(root)
+    prefix = f"{root}/" if root else ""
+    entries = ((prefix + path, data, mode) for path, data, mode in iter_entries(context))
+
+    with timing.span(f"write {fmt} archive"):
+        if fmt == "zip":
+            return _write_zip(fileobj, entries)
+        return _write_tar_gz(fileobj, entries)
+
+
+def _write_tar_gz(fileobj, entries):
+    """Writes entries as a streamed, reproducible tar.gz."""
+    count = 0
+    # No file name or wall-clock time in the gzip header
+    with gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, mtime=ARCHIVE_MTIME) as gz, \
+            tarfile.open(fileobj=gz, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for path, data, mode in entries:
+            info = tarfile.TarInfo(path)
+            info.mtime = ARCHIVE_MTIME
+            info.mode = mode
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            else:
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+                count += 1
+    return count
+
+
+def _write_zip(fileobj, entries):
+    """Writes entries as a reproducible zip."""
+    count = 0
+    date_time = (1980, 1, 1, 0, 0, 0)
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, data, mode in entries:
+            if data is None:
+                info = zipfile.ZipInfo(path + "/", date_time)
+                # Unix directory mode plus the MS-DOS directory flag
+                info.external_attr = ((0o40000 | mode) << 16) | 0x10
+                archive.writestr(info, b"")
+            else:
+                info = zipfile.ZipInfo(path, date_time)
+                info.external_attr = (0o100000 | mode) << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, data)
+                count += 1
+    return count
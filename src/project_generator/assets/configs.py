@@ -20,8 +20,55 @@ COMMON_FILES = {
     "ansible/inventory.ini": "ansible/inventory.ini.j2",
     "ansible/setup_workstation.yml": "ansible/setup_workstation.yml.j2",
     "docs/AI_INSIGHTS.md": "docs/AI_INSIGHTS.md.j2",
+    ".python-version": ".python-version.j2",
 }
 
+# Supported package managers
+PACKAGE_MANAGERS = ("pip", "poetry", "uv")
+
+# Files only generated for specific package managers
+MANAGER_FILES = {
+    "requirements.txt": ("pip",),
+    "requirements-dev.txt": ("pip",),
+    ".python-version": ("uv",),
+}
+
+# Monorepo root: tooling shared by every package (see monorepo.py)
+MONOREPO_ROOT = {
+    "description": "Monorepo root with shared tooling",
+    "structure": ["ansible/roles", "ansible/group_vars", "ansible/host_vars"],
+    "files": {
+        "README.md": "monorepo/README.md.j2",
+        ".gitignore": ".gitignore.j2",
+        ".pre-commit-config.yaml": ".pre-commit-config.yaml.j2",
+        ".flake8": ".flake8.j2",
+        ".yamllint": ".yamllint.j2",
+        ".aider.conf.yml": ".aider.conf.yml.j2",
+        ".python-version": ".python-version.j2",
+        "requirements-dev.txt": "requirements-dev.txt.j2",
+        "ansible/ansible.cfg": "ansible/ansible.cfg.j2",
+        "ansible/inventory.ini": "ansible/inventory.ini.j2",
+        "ansible/setup_workstation.yml": "ansible/setup_workstation.yml.j2",
+    },
+}
+
+# Monorepo root files regenerated from the package list on every change
+MONOREPO_GENERATED = {
+    ".github/workflows/packages.yml": "monorepo/packages.yml.j2",
+}
+
+# Files and directories a monorepo package leaves to the root
+MONOREPO_SHARED = (
+    ".gitignore",
+    ".pre-commit-config.yaml",
+    ".flake8",
+    ".yamllint",
+    ".aider.conf.yml",
+    ".python-version",
+    "requirements-dev.txt",
+)
+MONOREPO_SHARED_DIRS = (".github", "ansible")
+
 # AI Personas (Behavior Profiles)
 AI_PERSONAS = {
     "standard": "Standard (Adheres to profile defaults)",
@@ -160,10 +207,26 @@ PROFILES = {
 
 
 def get_profile(name="fullstack"):
-    """Returns the configuration for a specific profile."""
-    return PROFILES.get(name, PROFILES["fullstack"])
+    """Returns the configuration for a specific profile.
+
+    Profiles from template packs are loaded on first use; unknown names
+    fall back to fullstack.
+    """
+    if name in PROFILES:
+        return PROFILES[name]
+    from .. import packs
+    return packs.get_profile(name) or PROFILES["fullstack"]
 
 
 def list_profiles():
-    """Returns a list of available profile names."""
-    return list(PROFILES.keys())
+    """Returns a list of available profile names, including template packs'."""
+    from .. import packs
+    return list(PROFILES.keys()) + [n for n in packs.profile_names() if n not in PROFILES]
+
+
+def describe_profile(name):
+    """Returns a profile's description without loading its template pack."""
+    if name in PROFILES:
+        return PROFILES[name].get("description", "")
+    from .. import packs
+    return packs.describe(name)
@@ -0,0 +1,227 @@
+"""Batch mode: scaffold many projects from one manifest in a single process.
+
+A manifest is either TOML::
+
+    [defaults]
+    profile = "web"
+    author = "Platform Team"
+
+    [[project]]
+    target = "repos/billing"
+    manager = "uv"
+
+or JSON Lines, one project object per line. Relative targets are resolved
+against the manifest's directory.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import tomli
+
+from .engine import CONTEXT_NAMES
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of scaffolding one manifest entry."""
+    target: str
+    profile: str
+    ok: bool
+    seconds: float
+    files: int = 0
+    error: str = ""
+    log: str = ""
+    cache_hits: int = 0
+    cache_lookups: int = 0
+
+
+def load_manifest(path):
+    """Reads a TOML or JSONL manifest into a list of project entries.
+
+    Raises:
+        ValueError: If an entry is not an object/table, lacks a target,
+            has unknown keys, or shares its target with an earlier entry.
+            JSONL problems name the line, TOML ones the project number.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if path.endswith(".jsonl"):
+        defaults = {}
+        entries = []
+        for number, line in enumerate(raw.decode().splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                entries.append((f"line {number}", json.loads(line)))
+            except ValueError as e:
+                raise ValueError(f"{path}: line {number}: {e}")
+    else:
+        data = tomli.loads(raw.decode())
+        defaults = data.get("defaults", {})
+        entries = [
+            (f"project #{index}", entry)
+            for index, entry in enumerate(data.get("project", []), start=1)
+        ]
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    projects = []
+    targets = {}
+    for label, entry in entries:
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: {label} is not an object")
+        entry = {**defaults, **entry}
+        if "target" not in entry:
+            raise ValueError(f"{path}: {label} has no 'target'")
+        unknown = set(entry) - set(CONTEXT_NAMES) - {"target"}
+        if unknown:
+            raise ValueError(f"{path}: {label} has unknown keys {sorted(unknown)}")
+        entry["target"] = os.path.normpath(
+            os.path.join(base_dir, os.path.expanduser(entry["target"]))
+        )
+        if entry["target"] in targets:
+            raise ValueError(
+                f"{path}: {label} has the same target as {targets[entry['target']]} "
+                f"({entry['target']})"
+            )
+        targets[entry["target"]] = label
+        entry.setdefault("name", os.path.basename(entry["target"]))
+        projects.append(entry)
+    return projects
+
+
+def build_context(entry):
+    """Maps a manifest entry onto the context keys create_structure reads."""
+    return {CONTEXT_NAMES[k]: v for k, v in entry.items() if k in CONTEXT_NAMES}
+
+
+def scaffold_project(entry, init_git=True, setup_venv=True):
+    """Scaffolds one manifest entry, capturing its output into the result."""
+    from . import engine, git_ops, render_cache
+
+    target = entry["target"]
+    profile = entry.get("profile", "fullstack")
+    log = io.StringIO()
+    cache = render_cache.get_cache()
+    hits, misses = cache.hits, cache.misses
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            os.makedirs(target, exist_ok=True)
+            engine.check_greenfield(target)
+            report = engine.create_structure(
+                target,
+                context=build_context(entry),
+                workers=1,
+                setup_venv=setup_venv
+            )
+            failed = [r for r in report if r.status == engine.ERROR]
+            if init_git and not os.path.exists(os.path.join(target, ".git")):
+                git_ops.init_git(
+                    target, files=engine.baseline_files(target, report)
+                )
+    except (Exception, SystemExit) as e:
+        # check_greenfield and git_ops report problems via sys.exit
+        errors = [line for line in log.getvalue().splitlines() if "❌" in line]
+        error = errors[0].strip() if isinstance(e, SystemExit) and errors else str(e)
+        return ProjectResult(
+            target, profile, False, time.perf_counter() - start,
+            error=error or repr(e), log=log.getvalue()
+        )
+
+    return ProjectResult(
+        target, profile, not failed, time.perf_counter() - start,
+        files=len(report) - len(failed),
+        error=f"{len(failed)} template(s) failed" if failed else "",
+        log=log.getvalue(),
+        cache_hits=cache.hits - hits,
+        cache_lookups=cache.hits + cache.misses - hits - misses
+    )
+
+
+def run_batch(projects, jobs=None, init_git=True, setup_venv=True):
+    """Scaffolds every project, spread across a process pool.
+
+    Templates are warmed once in this process first, so forked workers
+    inherit a populated cache instead of each loading it again.
+    """
+    from . import engine
+    engine.warm_templates()
+
+    if jobs is not None and jobs <= 1:
+        return [scaffold_project(p, init_git, setup_venv) for p in projects]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=engine.warm_templates) as pool:
+        futures = [
+            pool.submit(scaffold_project, p, init_git, setup_venv) for p in projects
+        ]
+        return [f.result() for f in futures]
+
+
+def print_summary(results, elapsed):
+    """Prints a per-project table of timings and failures."""
+    width = max([len(r.target) for r in results] + [6])
+    print(f"\n{'target':<{width}}  {'profile':<10} {'status':<7} {'time':>8}  detail")
+    for r in results:
+        status = "ok" if r.ok else "FAILED"
+        detail = r.error or f"{r.files} files"
+        print(f"{r.target:<{width}}  {r.profile:<10} {status:<7} {r.seconds:>7.2f}s  {detail}")
+
+    failed = sum(not r.ok for r in results)
+    print(
+        f"\n{len(results) - failed}/{len(results)} projects scaffolded in {elapsed:.2f}s"
+        + (f" ({failed} failed)" if failed else "")
+    )
+    lookups = sum(r.cache_lookups for r in results)
+    if lookups:
+        hits = sum(r.cache_hits for r in results)
+        print(f"Render cache: {hits}/{lookups} renders reused ({hits / lookups:.0%})")
+
+
+def main(argv=None):
+    """Entry point for `forge-project batch`."""
+    parser = argparse.ArgumentParser(
+        prog="forge-project batch",
+        description="Scaffold many projects from a TOML or JSONL manifest."
+    )
+    parser.add_argument("manifest", help="Path to manifest.toml or manifest.jsonl")
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 runs in-process)"
+    )
+    parser.add_argument("--no-git", action="store_true", help="Skip git initialization")
+    parser.add_argument("--no-venv", action="store_true", help="Skip virtualenv creation")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print each project's log")
+    args = parser.parse_args(argv)
+
+    try:
+        projects = load_manifest(args.manifest)
+    except (OSError, ValueError, tomli.TOMLDecodeError) as e:
+        print(f"❌ Error reading manifest: {e}")
+        sys.exit(1)
+
+    print(f"Scaffolding {len(projects)} projects from {args.manifest}...")
+    start = time.perf_counter()
+    results = run_batch(
+        projects,
+        jobs=args.jobs,
+        init_git=not args.no_git,
+        setup_venv=not args.no_venv
+    )
+
+    for r in results:
+        if args.verbose or not r.ok:
+            print(f"\n--- {r.target} ---\n{r.log.rstrip()}")
+
+    print_summary(results, time.perf_counter() - start)
+    if not all(r.ok for r in results):
+        sys.exit(1)
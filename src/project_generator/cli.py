@@ -1,13 +1,63 @@
 """CLI Entry point for the project generator."""
 import os
 import argparse
+import shutil
 import sys
-from . import engine, git_ops, config_manager
 
+from . import timing
 
-def main():
+# Submodules are imported on first use so `--config-list`/`--config-set`
+# never pay for jinja2 and the template environment (see __getattr__).
+LAZY_MODULES = ("engine", "git_ops", "config_manager")
+
+
+def __getattr__(name):
+    """Imports engine/git_ops/config_manager on first attribute access."""
+    if name in LAZY_MODULES:
+        # __import__ (unlike importlib) goes through the interpreter's
+        # import path, so these show up in `python -X importtime`
+        qualified = f"{__package__}.{name}"
+        __import__(qualified)
+        module = sys.modules[qualified]
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(name):
+    """Returns a lazily imported submodule (honours patched attributes)."""
+    return getattr(sys.modules[__name__], name)
+
+
+# Subcommand name -> module exposing main(argv)
+SUBCOMMANDS = {
+    "batch": "batch",
+    "doctor": "doctor",
+    "serve": "serve",
+    "add-package": "monorepo",
+    "update": "fleet",
+}
+
+
+def profile_name(value):
+    """argparse type for --profile: any bundled or template pack profile."""
+    from .assets import configs
+
+    profiles = configs.list_profiles()
+    if value not in profiles:
+        raise argparse.ArgumentTypeError(
+            f"unknown profile {value!r} (choose from {', '.join(profiles)})"
+        )
+    return value
+
+
+def build_parser():
+    """Builds the argument parser for the default scaffold command."""
     parser = argparse.ArgumentParser(
-        description="Forge a production-grade AI project structure."
+        description="Forge a production-grade AI project structure.",
+        epilog="Other commands: " + ", ".join(
+            f"forge-project {name} --help" for name in SUBCOMMANDS
+        )
     )
     parser.add_argument(
         "target_dir",
@@ -28,9 +78,9 @@ def main():
     )
     parser.add_argument(
         "--profile",
-        choices=["fullstack", "web", "system", "mvc"],
+        type=profile_name,
         default=None,
-        help="Project profile to use (fullstack, web, system, mvc)"
+        help="Project profile to use (fullstack, web, system, mvc, or one from a template pack)"
     )
     # Global Config Arguments
     parser.add_argument(
@@ -44,39 +94,283 @@ def main():
         help="List current global configuration"
     )
     parser.add_argument("--force", "-f", action="store_true", help="Force overwrite of existing files during update")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of concurrent render/write workers (default: CPU count + 4)"
+    )
+    parser.add_argument(
+        "--durable",
+        action="store_true",
+        help="Flush written files and their directories to disk before finishing"
+    )
+    parser.add_argument(
+        "--link-static",
+        action="store_true",
+        help="Hardlink files that need no rendering from the installed package "
+             "instead of copying them (do not edit them in place)"
+    )
+    parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Render the scaffold in memory and list it without writing anything"
+    )
+    parser.add_argument(
+        "--output-archive",
+        metavar="PATH",
+        help="Stream the scaffold into a tar.gz/zip archive instead of a directory ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=["tar.gz", "zip"],
+        default=None,
+        help="Archive format for --output-archive (default: from the file name, else tar.gz)"
+    )
+    parser.add_argument(
+        "--warm-hooks",
+        nargs="?",
+        const="wait",
+        choices=["wait", "background"],
+        default=None,
+        help="Also build the pre-commit hook environments (pre-commit install-hooks); "
+             "'background' starts the build and returns without waiting"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print how long each phase, template and subprocess took"
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Write a Chrome trace-event file (chrome://tracing, Perfetto) to PATH"
+    )
+    return parser
 
-    # Handle Configuration Commands
+
+def handle_config_commands(args):
+    """Runs --config-list/--config-set; returns True if one was handled."""
     if args.config_list:
+        config_manager = _lazy("config_manager")
         config = config_manager.load_config()
         print(f"Global Config ({config_manager.get_config_path()}):")
         for k, v in config.items():
             print(f"  {k} = {v}")
-        return
+        return True
 
     if args.config_set:
+        config_manager = _lazy("config_manager")
+        updates = {}
         for setting in args.config_set:
             if "=" in setting:
                 key, value = setting.split("=", 1)
-                config_manager.set_setting(key, value)
-                print(f"✅ Updated {key} = {value}")
+                updates[key] = value
             else:
                 print(f"❌ Invalid format: {setting}. Use key=value.")
+        # One load and one write, however many keys are set
+        if updates:
+            config_manager.set_settings(updates)
+        for key, value in updates.items():
+            print(f"✅ Updated {key} = {value}")
+        return True
+
+    return False
+
+
+def print_dry_run(context):
+    """Renders the scaffold in memory and lists what would be written."""
+    tree = _lazy("engine").render_tree(context)
+    total = 0
+    for path, (data, mode) in sorted(tree.items()):
+        if data is None:
+            print(f"  {oct(mode)[2:]}  {'':>8}  {path}/")
+        else:
+            total += len(data)
+            print(f"  {oct(mode)[2:]}  {len(data):>8}  {path}")
+    files = sum(data is not None for data, _ in tree.values())
+    print(f"\n{files} files, {len(tree) - files} directories, {total} bytes (dry run, nothing written)")
+
+
+def write_output_archive(args, context):
+    """Streams the scaffold to --output-archive; status goes to stderr."""
+    from . import archive
+
+    path = args.output_archive
+    fmt = args.archive_format or archive.format_for(path)
+    if path == "-":
+        count = archive.write_archive(sys.stdout.buffer, context, fmt)
+        sys.stdout.buffer.flush()
+    else:
+        with open(path, "wb") as f:
+            count = archive.write_archive(f, context, fmt)
+    print(f"✅ Wrote {count} files to {'stdout' if path == '-' else path} ({fmt})", file=sys.stderr)
+
+
+def post_render_tasks(target_path, report, package_manager, warm_hooks=False):
+    """Builds the task graph run after the scaffold files are written.
+
+    Environment setup and git/hook work are independent branches; the
+    uv lock only orders the baseline commit (so uv.lock is included when
+    it succeeds) without blocking it, and hooks wait for the dependency
+    install so pre-commit comes from the project venv.
+
+    Args:
+        warm_hooks: False, "wait" or "background" (see git_ops.warm_hooks).
+    """
+    from . import tasks
+    engine = _lazy("engine")
+    git_ops = _lazy("git_ops")
+
+    graph = []
+    if package_manager == "pip":
+        environment = engine.PipEnvironment(target_path)
+        graph += [
+            tasks.Task("venv", environment.create, required=False),
+            tasks.Task("deps", environment.install, ("venv",), required=False),
+        ]
+    elif package_manager == "uv":
+        uv_cmd = shutil.which("uv")
+        if uv_cmd is None:
+            print("   ⚠️ Warning: uv not found on PATH; skipping environment setup.")
+        else:
+            def uv_step(phase):
+                return lambda: engine.run_uv_step(target_path, phase, uv_cmd=uv_cmd)
+
+            graph += [
+                tasks.Task("venv", uv_step("venv"), required=False),
+                tasks.Task("lock", uv_step("lock"), ("venv",), False),
+                tasks.Task("deps", uv_step("install"), ("lock",), False),
+            ]
+    env_tasks = {task.name for task in graph}
+
+    if os.path.exists(os.path.join(target_path, ".git")):
+        print("...Skipping Git Init (Already initialized)...")
+        return graph
+
+    graph += [
+        tasks.Task("git init", lambda: git_ops.init_repo(target_path)),
+        tasks.Task(
+            "git baseline",
+            lambda: git_ops.commit_baseline(
+                target_path, engine.baseline_files(target_path, report)
+            ),
+            ("git init",),
+            after=("lock",) if "lock" in env_tasks else ()
+        ),
+        tasks.Task(
+            "hooks",
+            lambda: git_ops.install_hooks(target_path),
+            ("git init",),
+            after=("deps",) if "deps" in env_tasks else ()
+        ),
+    ]
+    if warm_hooks:
+        background = warm_hooks == "background"
+        graph.append(tasks.Task(
+            "hooks warmup",
+            lambda: git_ops.warm_hooks(target_path, background=background),
+            ("hooks",),
+            required=False
+        ))
+    return graph
+
+
+def run_post_render(graph):
+    """Runs the post-render graph, exiting if a required task failed."""
+    from . import tasks
+
+    results = tasks.run_tasks(graph)
+    tasks.print_summary(graph, results)
+    for task in graph:
+        if not task.required and results[task.name].status != tasks.OK:
+            print(f"   ⚠️ Warning: {task.name} {results[task.name].status}.")
+    failed = tasks.failed_required(graph, results)
+    if failed:
+        print(f"❌ Error: {', '.join(failed)} did not complete (see output above).")
+        sys.exit(1)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        qualified = f"{__package__}.{SUBCOMMANDS[argv[0]]}"
+        __import__(qualified)
+        return sys.modules[qualified].main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+
+    # Handle Configuration Commands
+    if handle_config_commands(args):
         return
 
+    with timing.recording(summary=args.timings, trace=args.trace):
+        scaffold(args)
+    if args.timings:
+        from . import render_cache
+        print("   " + render_cache.format_stats(render_cache.get_cache().stats()))
+
+
+def scaffold(args):
+    """Runs the wizard (if interactive), scaffold, and git setup."""
+    with timing.span("import engine"):
+        engine = _lazy("engine")
+
     target_path = os.path.abspath(args.target_dir)
     context = {}
+    speculator = None
+
+    try:
+        # Interactive Mode Check
+        # If no target specified (uses default), update flag is strict False, and TTY
+        # Fix: Compare absolute paths to handle '.' correctly
+        interactive = sys.stdin.isatty() and args.output_archive != "-"
+        if os.path.abspath(args.target_dir) == os.getcwd() and not args.update and interactive:
+            try:
+                from . import wizard
+                speculator = start_speculation(
+                    build_venv=not (args.dry_run or args.output_archive)
+                )
+                # Pass defaults from CLI args if provided
+                with timing.span("wizard"):
+                    context = wizard.run_wizard(
+                        default_profile=args.profile, speculator=speculator
+                    )
+            except ImportError:
+                print("Warning: fit/questionary not found. Skipping interactive mode.")
+
+        if args.manager:
+            context["__PACKAGE_MANAGER__"] = args.manager
+        if args.profile:
+            context["__PROFILE__"] = args.profile
+        if speculator is not None:
+            # Flags may override answers; drop work for the overridden values
+            speculator.update(context)
+
+        generate(args, engine, target_path, context, speculator)
+    finally:
+        if speculator is not None:
+            speculator.cancel()
 
-    # Interactive Mode Check
-    # If no target specified (uses default), update flag is strict False, and TTY
-    # Fix: Compare absolute paths to handle '.' correctly
-    if os.path.abspath(args.target_dir) == os.getcwd() and not args.update and sys.stdin.isatty():
-        try:
-            from . import wizard
-            # Pass defaults from CLI args if provided
-            context = wizard.run_wizard(default_profile=args.profile)
-        except ImportError:
-            print("Warning: fit/questionary not found. Skipping interactive mode.")
+
+def start_speculation(build_venv=True):
+    """Returns a Speculator for the wizard, or None if disabled."""
+    from . import speculate
+
+    return speculate.Speculator(build_venv=build_venv) if speculate.is_enabled() else None
+
+
+def generate(args, engine, target_path, context, speculator=None):
+    """Writes the scaffold (or archive/dry run) and runs post-render tasks."""
+    if args.output_archive:
+        write_output_archive(args, context)
+        return
+
+    if args.dry_run:
+        print(f"Dry run for: {target_path}")
+        print_dry_run(context)
+        return
 
     print(f"Starting AI Project Initialization in: {target_path}")
 
@@ -88,18 +382,34 @@ def main():
         engine.check_greenfield(target_path)
 
     # 2. Build Structure
-    if args.manager:
-        context["__PACKAGE_MANAGER__"] = args.manager
-    if args.profile:
-        context["__PROFILE__"] = args.profile
 
-    engine.create_structure(target_path, update=args.update, context=context, force=args.force)
+    with timing.span("scaffold"):
+        report = engine.create_structure(
+            target_path,
+            update=args.update,
+            context=context,
+            force=args.force,
+            workers=args.workers,
+            setup_venv=False,
+            durable=args.durable,
+            link_static=args.link_static
+        )
 
-    # 3. Git Operations
-    if not os.path.exists(os.path.join(target_path, ".git")):
-        git_ops.init_git(target_path)
-    else:
-        print("...Skipping Git Init (Already initialized)...")
+    # 3. Environment, Git and hooks, concurrently where independent
+    scaffold_context = engine.load_context(target_path)
+    if scaffold_context.get("__LAYOUT__") == "package":
+        print("\n✅ Package updated. Its venv and git repository are the monorepo root's;")
+        print("   run `forge-project add-package --sync` there if its requirements changed.")
+        return
+    package_manager = scaffold_context.get("__PACKAGE_MANAGER__", "pip")
+    if speculator is not None:
+        # A venv build still running would otherwise be duplicated
+        with timing.span("speculation wait"):
+            speculator.wait()
+    with timing.span("post-render"):
+        run_post_render(
+            post_render_tasks(target_path, report, package_manager, args.warm_hooks)
+        )
 
     print("\n✅ Success! Project is ready.")
     print("   - You are currently on the 'develop' branch.")
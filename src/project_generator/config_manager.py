@@ -1,35 +1,96 @@
-"""Global Configuration Manager."""
+"""Global Configuration Manager.
+
+The parsed config is cached in-process and re-read only when the file's
+mtime or size changes, so long-running callers (batch, serve) and code
+that reads several settings pay for one parse. Writes go through a temp
+file and an atomic rename.
+
+This module is all `--config-list` imports, so tomli/tomli_w are only
+imported to actually read/write, and platformdirs only where the user
+directories are not simply the XDG ones.
+"""
 import os
-import tomli
-import tomli_w
-import platformdirs
+import sys
+import threading
 from pathlib import Path
 
 APP_NAME = "forge"
 APP_AUTHOR = "WestAILabs"
 
+# str(path) -> ((mtime_ns, size), parsed config)
+_cache = {}
+
+
+def _user_dir(kind):
+    """Returns Forge's user "config" or "cache" directory.
+
+    On Linux and the BSDs this follows the XDG spec directly, as
+    platformdirs does there; importing platformdirs costs more than the
+    rest of `--config-list` together. Other platforms ask platformdirs.
+    """
+    if sys.platform in ("win32", "darwin") or hasattr(sys, "getandroidapilevel"):
+        import platformdirs
+        return getattr(platformdirs, f"user_{kind}_dir")(APP_NAME, APP_AUTHOR)
+    base = os.environ.get(f"XDG_{kind.upper()}_HOME", "")
+    if not base.strip():
+        base = os.path.expanduser(f"~/.{kind}")
+    return os.path.join(base, APP_NAME)
+
+
+def config_dir(name):
+    """Returns the path of name inside Forge's user config directory."""
+    return os.path.join(_user_dir("config"), name)
+
+
+def cache_dir(name):
+    """Returns the path of name inside Forge's user cache directory."""
+    return os.path.join(_user_dir("cache"), name)
+
 
 def get_config_path():
-    """Returns the path to the config file."""
-    config_dir = platformdirs.user_config_dir(APP_NAME, APP_AUTHOR)
-    os.makedirs(config_dir, exist_ok=True)
-    return Path(config_dir) / "config.toml"
+    """Returns the path to the config file (its directory may not exist yet)."""
+    return Path(_user_dir("config")) / "config.toml"
+
+
+def _stamp(path):
+    """Identifies a version of the file on disk."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_size)
 
 
 def load_config():
-    """Loads the configuration from file."""
+    """Loads the configuration from file (cached until the file changes).
+
+    Returns a copy, so callers may modify it freely.
+    """
     path = get_config_path()
     if not path.exists():
         return {}
+    stamp = _stamp(path)
+    cached = _cache.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        return dict(cached[1])
+
+    import tomli
+
     with open(path, "rb") as f:
-        return tomli.load(f)
+        config = tomli.load(f)
+    _cache[str(path)] = (stamp, config)
+    return dict(config)
 
 
 def save_config(config):
-    """Saves the configuration to file."""
+    """Saves the configuration atomically (temp file + rename)."""
+    import tomli_w
+
     path = get_config_path()
-    with open(path, "wb") as f:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per thread too: serve and batch save from several threads
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
         tomli_w.dump(config, f)
+    tmp_path.replace(path)
+    _cache[str(path)] = (_stamp(path), dict(config))
 
 
 def get_setting(key, default=None):
@@ -38,8 +99,34 @@ def get_setting(key, default=None):
     return config.get(key, default)
 
 
+def get_flag(key, default=True):
+    """Retrieves an on/off setting; "0", "false", "no" and "off" mean off."""
+    value = get_setting(key, default)
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() not in ("0", "false", "no", "off")
+
+
+def get_settings(defaults):
+    """Retrieves several settings with one load.
+
+    Args:
+        defaults: {key: default value}.
+
+    Returns:
+        {key: configured value, or the default}.
+    """
+    config = load_config()
+    return {key: config.get(key, default) for key, default in defaults.items()}
+
+
 def set_setting(key, value):
     """Sets a specific setting."""
+    set_settings({key: value})
+
+
+def set_settings(updates):
+    """Sets several settings with a single load and write."""
     config = load_config()
-    config[key] = value
+    config.update(updates)
     save_config(config)
@@ -0,0 +1,132 @@
+"""`forge-project doctor`: validate every profile's templates in one pass.
+
+For each profile and package manager the render plan is resolved, every
+template it names (and everything those include) is looked up in the
+template index, and the whole scaffold is rendered in memory. Problems
+are collected and reported together instead of surfacing one at a time
+in the middle of a scaffold.
+"""
+import argparse
+import os
+import sys
+
+from .assets import configs
+
+
+def check_plans(profiles, override_dir):
+    """Resolves and renders every (profile, manager) plan.
+
+    Returns:
+        A list of error strings.
+    """
+    from . import engine, plan, templating
+
+    index = templating.bundled_index()
+    errors = []
+    for profile_name in profiles:
+        for manager in configs.PACKAGE_MANAGERS:
+            label = f"{profile_name}/{manager}"
+            try:
+                render_plan = plan.get_plan(profile_name, manager)
+            except ValueError as e:
+                errors.append(f"{label}: {e}")
+                continue
+
+            missing = templating.missing_templates(render_plan.templates, override_dir)
+            for name in missing:
+                errors.append(f"{label}: template {name!r} does not exist")
+            if missing:
+                continue
+
+            for name in render_plan.templates:
+                for ref in index.get(name, {}).get("includes", []):
+                    if ref not in index:
+                        errors.append(f"{label}: {name!r} includes missing {ref!r}")
+
+            context = {"__PROFILE__": profile_name, "__PACKAGE_MANAGER__": manager}
+            try:
+                engine.render_tree(context)
+            except Exception as e:
+                errors.append(f"{label}: render failed: {type(e).__name__}: {e}")
+    return errors
+
+
+def check_unused(profiles, override_dir):
+    """Finds bundled templates no profile uses and stray overrides.
+
+    Returns:
+        A list of warning strings.
+    """
+    from . import plan, templating
+
+    index = templating.bundled_index()
+    used = set()
+    for profile_name in profiles:
+        for manager in configs.PACKAGE_MANAGERS:
+            try:
+                render_plan = plan.get_plan(profile_name, manager)
+            except ValueError:
+                continue
+            for name in render_plan.templates:
+                used.add(name)
+                used.update(index.get(name, {}).get("includes", []))
+
+    # The monorepo root is planned from its own table
+    for name in list(configs.MONOREPO_ROOT["files"].values()) + list(configs.MONOREPO_GENERATED.values()):
+        used.add(name)
+        used.update(index.get(name, {}).get("includes", []))
+
+    warnings = [
+        f"bundled template {name!r} is not used by any profile"
+        for name in sorted(set(index) - used)
+    ]
+    if override_dir and os.path.isdir(override_dir):
+        for root, _, files in os.walk(override_dir):
+            for filename in files:
+                name = os.path.relpath(os.path.join(root, filename), override_dir)
+                if name not in index:
+                    warnings.append(f"override {name!r} does not replace any bundled template")
+    return warnings
+
+
+def main(argv=None):
+    """Entry point for `forge-project doctor`."""
+    parser = argparse.ArgumentParser(
+        prog="forge-project doctor",
+        description="Check that every profile's templates exist and render."
+    )
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=configs.list_profiles(),
+        help="Only check this profile (repeatable, default: all)"
+    )
+    args = parser.parse_args(argv)
+
+    from . import packs, templating
+
+    # Re-discover packs so edits to installed packs are picked up
+    registry = packs.load_registry(refresh=True)
+    profiles = args.profile or configs.list_profiles()
+    override_dir = templating.get_override_dir()
+    index = templating.bundled_index()
+    source = "build" if os.path.exists(templating.INDEX_FILE) else "source tree"
+    print(f"🩺 Template index: {len(index)} templates (from {source})")
+    if os.path.isdir(override_dir):
+        print(f"   Overrides: {override_dir}")
+    for name, pack in sorted(registry.items()):
+        print(f"   Template pack {name}: {', '.join(pack['profiles'])} ({pack['template_dir']})")
+
+    errors = check_plans(profiles, override_dir)
+    warnings = check_unused(configs.list_profiles(), override_dir) if not args.profile else []
+
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    for error in errors:
+        print(f"❌ {error}")
+
+    checked = len(profiles) * len(configs.PACKAGE_MANAGERS)
+    if errors:
+        print(f"\n{len(errors)} problem(s) found across {checked} profile/manager combinations.")
+        sys.exit(1)
+    print(f"\n✅ {checked} profile/manager combinations OK.")
@@ -1,18 +1,63 @@
+import contextlib
 import os
+import shutil
 import sys
 import subprocess
-from jinja2 import Environment, PackageLoader, select_autoescape
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from jinja2 import TemplatesNotFound
 from .assets import configs
+from . import manifest, plan, render_cache, templating, timing, venv_cache
 
-# Setup Jinja2 Environment
-env = Environment(
-    loader=PackageLoader("project_generator", "templates"),
-    autoescape=select_autoescape()
-)
+# Setup Jinja2 Environment (precompiled templates when the package was built)
+env = templating.create_environment()
+
+# Rendering is cheap; writes dominate on slow or network filesystems.
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Modes reported for in-memory trees
+FILE_MODE = 0o644
+DIR_MODE = 0o755
+
+# File result statuses
+CREATED = "created"
+UPDATED = "overwritten"
+UNCHANGED = "unchanged"
+SKIPPED = "skipped"
+ERROR = "error"
+
+
+# Files are rendered under here, then renamed into place
+STAGING_DIR = os.path.join(".forge", "staging")
+
+# Files produced after rendering (e.g. by `uv lock`) that belong in the
+# baseline commit alongside the rendered files
+GENERATED_ARTIFACTS = (manifest.MANIFEST_PATH, "uv.lock")
+
+
+@dataclass
+class FileResult:
+    """Outcome of rendering and writing a single scaffold file."""
+    path: str
+    template: str
+    status: str
+    detail: str = ""
+    content: bytes = None
+    record: dict = None
 
 
 def check_greenfield(path):
-    """Ensures the directory is empty (ignoring the script itself)."""
+    """Ensures the directory is empty (ignoring the script itself).
+
+    A .forge directory holding nothing but the staging area of an
+    interrupted run is removed first.
+    """
+    forge_dir = os.path.join(path, os.path.dirname(STAGING_DIR))
+    with contextlib.suppress(OSError):
+        if os.listdir(forge_dir) == [os.path.basename(STAGING_DIR)]:
+            shutil.rmtree(forge_dir)
     # Filter out common files like .git or this tool's files if they exist
     existing_items = [
         f for f in os.listdir(path) if f not in [".git", "init_project.py"]
@@ -26,132 +71,651 @@ def check_greenfield(path):
         sys.exit(1)
 
 
-def create_structure(base_path, update=False, context=None, force=False):
+def create_structure(
+    base_path, update=False, context=None, force=False, workers=None, setup_venv=True,
+    durable=False, link_static=False
+):
     """Creates folders and files.
 
     Args:
         base_path: The root directory for the project.
         update: If True, do not verify directory is empty and no overwrite.
         context: Dictionary of placeholders to replace in templates.
+            "__LAYOUT__" selects a plan.* layout (monorepo root/package).
+        force: If True, overwrite existing files during an update.
+        workers: Number of concurrent render/write workers
+            (default: DEFAULT_WORKERS, 1 disables the pool).
+        setup_venv: If False, leave virtualenv creation to the caller.
+        durable: If True, fsync the written files before they are moved
+            into place and their directories after (see sync_paths).
+        link_static: If True, hardlink static template outputs from the
+            installed package instead of copying them.
+
+    Returns:
+        A list of FileResult entries, one per scaffold file, in profile order.
     """
     if context is None:
         context = {}
 
-    # Get Profile Config
-    import copy
-    # Get Profile Config
+    # On update, default to the context the project was scaffolded with
+    with timing.span("load manifest"):
+        previous = manifest.load(base_path) if update else None
+    if previous:
+        context = {**previous["context"], **context}
+
+    # Get Profile Config (resolved once per profile/manager and shared)
     profile_name = context.get("__PROFILE__", "fullstack")
-    profile = copy.deepcopy(configs.get_profile(profile_name))
-
-    # AI Persona Logic
-    persona = context.get("__AI_PERSONA__", "standard")
-    project_description = context.get("__PROJECT_DESCRIPTION__", "A production-grade AI project.")
-
-    # Standardize context keys (remove dunders if present)
-    jinja_context = {
-        "project_name": context.get("__PROJECT_NAME__", "ai_project"),
-        "author_name": context.get("__AUTHOR_NAME__", "User"),
-        "license": context.get("__LICENSE__", "MIT"),
-        "python_version": context.get("__PYTHON_VERSION__", "3.10"),
-        "package_manager": context.get("__PACKAGE_MANAGER__", "pip"),
-        "profile": profile_name,
-        "ai_persona": persona,
-        "project_description": project_description,
-    }
+    jinja_context = build_jinja_context(context)
+    render_plan = plan.get_plan(
+        profile_name, jinja_context["package_manager"], context.get("__LAYOUT__", plan.PROJECT)
+    )
+    files = render_plan.files
 
     print(f"...Scaffolding folder structure for profile: {profile_name}...")
 
-    # Create Directories
-    for folder in profile["structure"]:
-        os.makedirs(os.path.join(base_path, folder), exist_ok=True)
+    # Fingerprints decide which files an update needs to re-render; a
+    # template missing from the index fails here, before anything is written
+    with timing.span("fingerprint"):
+        ctx_hash = manifest.context_hash(jinja_context)
+        override_dir = templating.get_override_dir()
+        digests = {t: templating.template_digest(t, override_dir) for t in render_plan.templates}
+        static_sources = {
+            t: templating.static_source(t, override_dir) for t in render_plan.templates
+        }
+    missing = [t for t, digest in digests.items() if digest is None]
+    if missing:
+        print(f"❌ Error: Profile '{profile_name}' references missing templates: {', '.join(missing)}")
+        print("   Run `forge-project doctor` to check every profile.")
+        sys.exit(1)
 
-    # Create Files
-    for filename, template_name in profile["files"].items():
-        # Package Manager Logic: Skip requirements.txt if not using pip
-        if filename in ["requirements.txt", "requirements-dev.txt"] and jinja_context[
-            "package_manager"
-        ] != "pip":
-            continue
+    # Create Directories (minimal set, including parents of nested files)
+    with timing.span("create directories"):
+        for folder in render_plan.directories:
+            os.makedirs(os.path.join(base_path, folder), exist_ok=True)
 
-        file_path = os.path.join(base_path, filename)
-        # Ensure directory exists for nested files (like workflows)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    previous_files = previous["files"] if previous else {}
 
-        if update and not force and os.path.exists(file_path):
-            print(f"   [SKIP] {filename} (Exists) - use --force to overwrite")
-            continue
+    # Files are rendered into a staging directory on the same filesystem
+    # and renamed into place, so no file is ever seen half-written
+    stage_dir = make_stage_dir(base_path)
 
-        content = ""
+    # Render and write files concurrently
+    def job(entry):
+        filename, template_name = entry
+        return _render_and_write(
+            base_path, filename, template_name, jinja_context, update, force,
+            fingerprint=(digests.get(template_name), ctx_hash),
+            previous=previous_files.get(filename),
+            stage_dir=stage_dir,
+            static=static_sources.get(template_name),
+            link_static=link_static
+        )
 
-        # Use Jinja2 template if defined
-        if template_name:
-            try:
-                template = env.get_template(template_name)
-                content = template.render(**jinja_context)
-            except Exception as e:
-                print(f"Error rendering {template_name}: {e}")
-                continue
+    if workers is None:
+        workers = DEFAULT_WORKERS
+    try:
+        with timing.span("render and write", files=len(files), workers=workers):
+            if workers > 1 and len(files) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    report = list(pool.map(job, files))
+            else:
+                report = [job(entry) for entry in files]
+
+        with timing.span("commit files", durable=durable):
+            commit_staged(base_path, stage_dir, report, durable)
+    finally:
+        remove_stage_dir(stage_dir)
+
+    print_report(report)
 
-        with open(file_path, 'w') as f:
-            f.write(content.strip())
+    scaffold_manifest = manifest.new_manifest(profile_name, context)
+    scaffold_manifest["files"] = {r.path: r.record for r in report if r.record}
+    with timing.span("save manifest"):
+        manifest.save(base_path, scaffold_manifest)
 
     # Setup Virtualenv (if using pip)
-    setup_virtualenv(base_path, jinja_context["package_manager"])
+    if setup_venv:
+        with timing.span("virtualenv"):
+            setup_virtualenv(base_path, jinja_context["package_manager"])
 
+    return report
+
+
+# Dunder context key -> (template variable, default)
+CONTEXT_KEYS = {
+    "__PROJECT_NAME__": ("project_name", "ai_project"),
+    "__AUTHOR_NAME__": ("author_name", "User"),
+    "__LICENSE__": ("license", "MIT"),
+    "__PYTHON_VERSION__": ("python_version", "3.10"),
+    "__PACKAGE_MANAGER__": ("package_manager", "pip"),
+    "__PROFILE__": ("profile", "fullstack"),
+    "__AI_PERSONA__": ("ai_persona", "standard"),
+    "__PROJECT_DESCRIPTION__": ("project_description", "A production-grade AI project."),
+}
+
+
+# Short names (batch manifests) -> dunder context keys
+CONTEXT_NAMES = {
+    "name": "__PROJECT_NAME__",
+    "author": "__AUTHOR_NAME__",
+    "profile": "__PROFILE__",
+    "manager": "__PACKAGE_MANAGER__",
+    "persona": "__AI_PERSONA__",
+    "description": "__PROJECT_DESCRIPTION__",
+    "license": "__LICENSE__",
+    "python": "__PYTHON_VERSION__",
+}
+
+
+def build_jinja_context(context):
+    """Maps the dunder context keys onto the variables templates use."""
+    return {name: context.get(key, default) for key, (name, default) in CONTEXT_KEYS.items()}
+
+
+def render_file(template_name, jinja_context, digest=None):
+    """Renders a template to the exact bytes written to disk.
+
+    An empty template name produces an empty file. Output is served from
+    the render cache when the same template version was already rendered
+    with the same values for the variables it reads.
+
+    Args:
+        digest: The template's digest, if the caller already has it.
+    """
+    if not template_name:
+        return b""
+    if digest is None:
+        digest = templating.template_digest(template_name)
+    key = None
+    if digest is not None and not templating.is_volatile(digest):
+        key = render_cache.cache_key(template_name, digest, jinja_context)
+        data = render_cache.get_cache().get(key)
+        if data is not None:
+            return data
+
+    with timing.span(template_name, "render"):
+        content = env.get_template(template_name).render(**jinja_context)
+    data = content.strip().encode("utf-8")
+    if key is not None:
+        render_cache.get_cache().put(key, data)
+    return data
 
-def setup_virtualenv(base_path, package_manager):
-    """Sets up a virtual environment and installs dependencies."""
-    if package_manager != "pip":
-        return
 
-    print("\n📦 Setting up virtual environment (venv)...")
-    venv_path = os.path.join(base_path, "venv")
+def render_tree(context=None):
+    """Renders a scaffold into memory without touching the filesystem.
 
-    # 1. Create venv
+    Args:
+        context: Dictionary of placeholders, as for create_structure.
+
+    Returns:
+        A dict of relative path -> (bytes, mode). Directories to create
+        are included with None as their content.
+
+    Raises:
+        jinja2.TemplateError: If a template is missing (checked before
+            anything is rendered) or fails to render.
+    """
+    if context is None:
+        context = {}
+    jinja_context = build_jinja_context(context)
+    render_plan = plan.get_plan(
+        jinja_context["profile"], jinja_context["package_manager"],
+        context.get("__LAYOUT__", plan.PROJECT)
+    )
+    missing = templating.missing_templates(render_plan.templates)
+    if missing:
+        raise TemplatesNotFound(missing)
+
+    tree = {folder: (None, DIR_MODE) for folder in render_plan.directories}
+    for filename, template_name in render_plan.files:
+        tree[filename] = (render_file(template_name, jinja_context), FILE_MODE)
+    return tree
+
+
+def warm_templates():
+    """Loads every template used by any profile into the environment cache.
+
+    Long-lived callers (batch mode) do this once, before forking workers,
+    so each project renders from already-loaded templates. It is also
+    their pools' initializer, which is cheap in a worker forked warm.
+    """
+    names = {
+        template_name
+        for profile_name in configs.list_profiles()
+        for template_name in configs.get_profile(profile_name)["files"].values()
+        if template_name
+    }
+    for name in sorted(names):
+        env.get_template(name)
+    return len(names)
+
+
+def _render_and_write(
+    base_path, filename, template_name, jinja_context, update, force,
+    fingerprint=(None, None), previous=None, stage_dir=None, static=None,
+    link_static=False
+):
+    """Renders one template and writes it, returning a FileResult.
+
+    With a manifest entry (previous), a file whose template and context
+    are unchanged and whose content is untouched is left alone without
+    rendering, and a locally modified file is only replaced with force.
+    With a stage_dir, the file is written there for commit_staged() to
+    move into place. A static template ((path, content hash) from
+    templating.static_source) is copied instead of rendered.
+    """
+    file_path = os.path.join(base_path, filename)
+    template_digest, ctx_hash = fingerprint
+
+    if previous is not None:
+        state = manifest.file_state(file_path, previous)
+        exists = state != manifest.MISSING
+        current = (previous["template_digest"], previous["context_hash"]) == fingerprint
+        if state == manifest.CLEAN and current:
+            return FileResult(filename, template_name, UNCHANGED, record=previous)
+        if state == manifest.MODIFIED and not force:
+            return FileResult(
+                filename, template_name, SKIPPED, "Modified locally", record=previous
+            )
+    else:
+        exists = os.path.exists(file_path)
+        if update and not force and exists:
+            return FileResult(filename, template_name, SKIPPED, "Exists")
+
+    data = None
+    if static is None:
+        try:
+            data = render_file(template_name, jinja_context, template_digest)
+        except Exception as e:
+            return FileResult(filename, template_name, ERROR, str(e), record=previous)
+
+    target = os.path.join(stage_dir, filename) if stage_dir else file_path
     try:
-        subprocess.run(
-            ["python3", "-m", "venv", venv_path],
-            check=True,
-            capture_output=True
+        with timing.span(filename, "write"):
+            if stage_dir:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+            _write_output(target, data, static, link_static)
+    except OSError as e:
+        return FileResult(filename, template_name, ERROR, str(e), record=previous)
+
+    if static is not None:
+        # Content is not read back; baseline_files() takes it from disk
+        return FileResult(
+            filename, template_name, UPDATED if exists else CREATED,
+            record=manifest.make_entry(
+                target, template_name, template_digest, ctx_hash, None, digest=static[1]
+            )
         )
+
+    # A rename keeps size and mtime, so the staged file's stat stays valid
+    return FileResult(
+        filename, template_name, UPDATED if exists else CREATED, content=data,
+        record=manifest.make_entry(target, template_name, template_digest, ctx_hash, data)
+    )
+
+
+def _write_output(target, data, static, link_static):
+    """Writes rendered bytes, or copies a static template's output."""
+    if static is not None:
+        copy_static(static[0], target, link_static)
+        return
+    # Empty templates just create the file
+    with open(target, 'wb') as f:
+        if data:
+            f.write(data)
+
+
+def copy_static(source, target, link=False):
+    """Copies a prebuilt static output without passing it through Python.
+
+    Uses a hardlink when link is set (and the filesystem allows it),
+    else os.copy_file_range, else shutil.copyfile (sendfile on Linux,
+    fcopyfile on macOS).
+    """
+    if link:
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(source, target)
+
+
+def make_stage_dir(base_path):
+    """Creates a private staging directory inside the project."""
+    parent = os.path.join(base_path, STAGING_DIR)
+    os.makedirs(parent, exist_ok=True)
+    return tempfile.mkdtemp(prefix=f"{os.getpid()}-", dir=parent)
+
+
+def remove_stage_dir(stage_dir):
+    """Deletes a staging directory (and its parent once empty)."""
+    shutil.rmtree(stage_dir, ignore_errors=True)
+    with contextlib.suppress(OSError):
+        os.rmdir(os.path.dirname(stage_dir))
+
+
+def commit_staged(base_path, stage_dir, report, durable=False):
+    """Moves every staged file into place with an atomic rename.
+
+    Replaced files keep their permission bits. With durable, the staged
+    files are flushed in one batch before the renames, and the directories
+    they were renamed into in one batch after them, instead of syncing
+    each file as it is written. A file that cannot be moved is marked as
+    an error in the report.
+    """
+    written = [r for r in report if r.status in (CREATED, UPDATED)]
+    if durable:
+        sync_paths([os.path.join(stage_dir, r.path) for r in written], dirs=False)
+
+    for result in written:
+        staged = os.path.join(stage_dir, result.path)
+        final = os.path.join(base_path, result.path)
+        try:
+            # Never chmod a hardlinked static output (it is package data)
+            if os.path.exists(final) and os.stat(staged).st_nlink == 1:
+                shutil.copymode(final, staged)
+            os.replace(staged, final)
+        except OSError as e:
+            result.status, result.detail, result.record = ERROR, str(e), None
+
+    if durable:
+        sync_paths([os.path.join(base_path, r.path) for r in written], files=False)
+
+
+def sync_paths(paths, files=True, dirs=True):
+    """Flushes just these files and/or their directories to disk.
+
+    Each directory is synced once however many of the paths it holds.
+    Directories that cannot be opened (Windows) are skipped; their
+    entries are durable once the files are.
+    """
+    targets = list(paths) if files else []
+    if dirs:
+        targets += sorted({os.path.dirname(path) for path in paths})
+    for path in targets:
+        with contextlib.suppress(OSError):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+def load_context(base_path):
+    """Returns the context a project was scaffolded with ({} if unknown)."""
+    previous = manifest.load(base_path)
+    return previous["context"] if previous else {}
+
+
+def baseline_files(base_path, report):
+    """Returns (path, bytes) for every scaffold file, for the first commit.
+
+    Rendered content is taken from the report; files the run did not
+    write (skipped on update) and GENERATED_ARTIFACTS are read from disk.
+    """
+    files = []
+    for result in report:
+        if result.status == ERROR:
+            continue
+        data = result.content
+        if data is None:
+            with open(os.path.join(base_path, result.path), "rb") as f:
+                data = f.read()
+        files.append((result.path, data))
+
+    for artifact in GENERATED_ARTIFACTS:
+        path = os.path.join(base_path, artifact)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                files.append((artifact, f.read()))
+    return files
+
+
+def print_report(report):
+    """Prints skipped/failed files and a one-line summary of a scaffold run."""
+    counts = {CREATED: 0, UPDATED: 0, UNCHANGED: 0, SKIPPED: 0, ERROR: 0}
+    for result in report:
+        counts[result.status] += 1
+        if result.status == SKIPPED:
+            print(f"   [SKIP] {result.path} ({result.detail}) - use --force to overwrite")
+        elif result.status == ERROR:
+            print(f"Error rendering {result.template or result.path}: {result.detail}")
+
+    print(
+        f"   {counts[CREATED]} created, {counts[UPDATED]} overwritten, "
+        f"{counts[UNCHANGED]} unchanged, {counts[SKIPPED]} skipped, "
+        f"{counts[ERROR]} failed"
+    )
+
+
+def setup_virtualenv(base_path, package_manager):
+    """Sets up a virtual environment and installs dependencies.
+
+    pip projects get their venv from the venv cache when it is enabled
+    (pip only runs on a cache miss); uv projects are locked and synced
+    with uv. Each install phase is timed.
+
+    Returns:
+        A dict of phase name -> seconds.
+    """
+    timings = {}
+    if package_manager == "uv":
+        setup_uv_environment(base_path, timings)
+    elif package_manager == "pip":
+        setup_pip_environment(base_path, timings)
+    else:
+        return timings
+
+    if timings:
+        print("   ⏱  " + " | ".join(f"{k} {v:.1f}s" for k, v in timings.items()))
+    return timings
+
+
+@contextlib.contextmanager
+def _phase(timings, name):
+    """Records the wall time of a block under timings[name] (and as a span)."""
+    start = time.perf_counter()
+    try:
+        with timing.span(name, "venv"):
+            yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def setup_pip_environment(base_path, timings):
+    """Creates venv/ for a pip project, via the venv cache when enabled."""
+    environment = PipEnvironment(base_path, timings)
+    if environment.create():
+        environment.install()
+
+
+class PipEnvironment:
+    """venv/ for a pip project, set up in two steps: create, then install.
+
+    The steps are separate so a task scheduler can run other work while
+    dependencies install. With the venv cache, a hit is cloned during
+    create (install is then a no-op); a miss is built in the cache and
+    cloned once install finishes. An existing venv (e.g. on --update) is
+    upgraded in place, never replaced.
+    """
+
+    def __init__(self, base_path, timings=None):
+        self.venv_path = os.path.join(base_path, "venv")
+        self.requirement_files = [
+            os.path.join(base_path, req_file)
+            for req_file in ["requirements.txt", "requirements-dev.txt"]
+            if os.path.exists(os.path.join(base_path, req_file))
+        ]
+        self.timings = {} if timings is None else timings
+        self.key = None
+        self.build_path = None
+        self.ready = False
+
+    def create(self):
+        """Creates (or clones) the venv; returns True on success."""
+        print("\n📦 Setting up virtual environment (venv)...")
+        if venv_cache.is_enabled() and not os.path.exists(self.venv_path):
+            self.key = venv_cache.cache_key(self.requirement_files)
+        if self.key is None:
+            return create_venv(self.venv_path, self.timings)
+
+        cached = venv_cache.lookup(self.key)
+        if cached is not None:
+            print(f"   Venv cache hit ({self.key})")
+            with _phase(self.timings, "clone"):
+                venv_cache.clone(cached, self.venv_path)
+            print("   Cloned cached virtual environment.")
+            self.ready = True
+            return True
+
+        print(f"   Venv cache miss ({self.key}), building...")
+        self.build_path = venv_cache.new_build_path(self.key)
+        return create_venv(self.build_path, self.timings)
+
+    def install(self):
+        """Installs the requirements; returns True on success."""
+        if self.ready:
+            return True
+        target = self.build_path or self.venv_path
+        ok = install_requirements(target, self.requirement_files, self.timings)
+        if self.build_path is None:
+            return ok
+
+        # Don't cache a broken venv, but still give the project a copy
+        source = venv_cache.store(self.build_path, self.key) if ok else self.build_path
+        with _phase(self.timings, "clone"):
+            venv_cache.clone(source, self.venv_path)
+        if ok:
+            print("   Cloned cached virtual environment.")
+        else:
+            shutil.rmtree(self.build_path, ignore_errors=True)
+        return ok
+
+
+def create_venv(venv_path, timings=None):
+    """Runs `python3 -m venv`; returns True on success."""
+    if timings is None:
+        timings = {}
+    try:
+        with _phase(timings, "venv"):
+            subprocess.run(
+                ["python3", "-m", "venv", venv_path],
+                check=True,
+                capture_output=True
+            )
     except subprocess.CalledProcessError as e:
         print(f"❌ Error creating venv: {e}")
-        return
+        return False
+    return True
+
+
+def install_requirements(venv_path, requirement_files, timings=None):
+    """Upgrades the build tools and installs requirements into a venv.
 
+    All requirements files are installed in a single pip invocation, so
+    pip resolves the combined dependency set once.
+
+    Returns:
+        True if every step succeeded.
+    """
+    if timings is None:
+        timings = {}
+
+    ok = True
     # Pip path
     pip_cmd = os.path.join(venv_path, "bin", "pip")
 
-    print("   Upgrading pip...")
+    # 1. Upgrade pip and build tools together
+    print("   Upgrading pip and build tools (setuptools, wheel)...")
     try:
-        subprocess.run(
-            [pip_cmd, "install", "--upgrade", "pip"],
-            check=True,
-            capture_output=True
-        )
+        with _phase(timings, "bootstrap"):
+            subprocess.run(
+                [pip_cmd, "install", "--upgrade", "pip", "setuptools", "wheel"],
+                check=True,
+                capture_output=True
+            )
     except subprocess.CalledProcessError:
-        print("   ⚠️ Warning: Failed to upgrade pip.")
+        print("   ⚠️ Warning: Failed to upgrade pip/build tools.")
+        ok = False
 
-    # 2.5 Ensure build tools
-    print("   Ensuring build tools (setuptools, wheel)...")
-    try:
-        subprocess.run(
-            [pip_cmd, "install", "--upgrade", "setuptools", "wheel"],
-            check=True,
-            capture_output=True
+    # 2. Install requirements (one combined resolve)
+    if requirement_files:
+        names = ", ".join(os.path.basename(p) for p in requirement_files)
+        print(f"   Installing {names}...")
+        cmd = [pip_cmd, "install"]
+        for req_path in requirement_files:
+            cmd += ["-r", req_path]
+        with _phase(timings, "install"):
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"   ⚠️ Warning: Failed to install {names}.")
+            print(f"   Output: {proc.stderr}")
+            ok = False
+
+    return ok
+
+
+# uv environment steps: timing phase -> uv arguments
+UV_STEPS = {
+    "venv": ["venv", "venv"],
+    "lock": ["lock"],
+    "install": ["sync", "--frozen", "--no-install-project"],
+}
+
+
+def setup_uv_environment(base_path, timings):
+    """Creates venv/ for a uv project and syncs it from a fresh uv.lock.
+
+    uv installs from its shared global cache (hardlinking where it can),
+    so repeated scaffolds only download each distribution once.
+    """
+    uv_cmd = shutil.which("uv")
+    if uv_cmd is None:
+        print("   ⚠️ Warning: uv not found on PATH; skipping environment setup.")
+        return
+
+    print("\n📦 Setting up virtual environment with uv...")
+    for phase in UV_STEPS:
+        if not run_uv_step(base_path, phase, timings, uv_cmd):
+            return
+
+
+def run_uv_step(base_path, phase, timings=None, uv_cmd=None):
+    """Runs one UV_STEPS entry in the project; returns True on success.
+
+    uv_cmd is the resolved uv executable; it is looked up on PATH if omitted.
+    """
+    if timings is None:
+        timings = {}
+    if uv_cmd is None:
+        uv_cmd = shutil.which("uv")
+    if uv_cmd is None:
+        print("   ⚠️ Warning: uv not found on PATH; skipping environment setup.")
+        return False
+
+    cmd = [uv_cmd] + UV_STEPS[phase]
+    uv_env = dict(os.environ, UV_PROJECT_ENVIRONMENT="venv")
+    with _phase(timings, phase):
+        proc = subprocess.run(
+            cmd, cwd=base_path, env=uv_env, capture_output=True, text=True
         )
-    except subprocess.CalledProcessError:
-        print("   ⚠️ Warning: Failed to install build tools.")
-
-    # 3. Install requirements
-    for req_file in ["requirements.txt", "requirements-dev.txt"]:
-        req_path = os.path.join(base_path, req_file)
-        if os.path.exists(req_path):
-            print(f"   Installing {req_file}...")
-            proc = subprocess.run(
-                [pip_cmd, "install", "-r", req_path],
-                capture_output=True,
-                text=True
-            )
-            if proc.returncode != 0:
-                print(f"   ⚠️ Warning: Failed to install {req_file}.")
-                print(f"   Output: {proc.stderr}")
+    if proc.returncode != 0:
+        print(f"   ⚠️ Warning: `{' '.join(cmd[1:])}` failed.")
+        print(f"   Output: {proc.stderr}")
+        return False
+    return True
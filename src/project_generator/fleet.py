@@ -0,0 +1,517 @@
+"""Fleet mode: `forge-project update --all ROOT` re-applies templates to every
+project scaffolded under ROOT.
+
+Projects are found by their .forge/manifest.json, which records the
+profile and context they were scaffolded with, so each is updated exactly
+as `forge-project --update` would (untouched files get the new templates,
+locally modified ones are skipped without --force). Only with
+--adopt-legacy are projects from before the manifest included: they are
+recognised by the files every profile generates, their profile is
+inferred from the directories they have, and they are adopted (missing
+files written, a manifest recorded) rather than overwritten.
+
+Updates run in a process pool. Progress is appended to a state file in
+the user cache as each project finishes, keyed by the root, the template
+versions and --force, so an interrupted run picks up where it stopped,
+and a run with failures retries only those.
+"""
+import argparse
+import contextlib
+import difflib
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+
+# Files every profile generates; a directory with both and no manifest is
+# a project scaffolded before manifests existed
+LEGACY_MARKERS = ("AI_DIRECTIVES.md", "GEMINI.md")
+
+# Directories never searched for projects (beyond hidden ones)
+SKIP_DIRS = {"venv", "node_modules", "__pycache__"}
+
+STATE_VERSION = 1
+
+# Status of a legacy project's file recorded in its new manifest
+ADOPTED = "adopted"
+
+
+@dataclass
+class FileChange:
+    """One file an update wrote, skipped or failed to render."""
+    path: str
+    status: str
+    added: int = 0
+    removed: int = 0
+    detail: str = ""
+
+
+@dataclass
+class UpdateResult:
+    """Outcome of updating one project."""
+    path: str
+    profile: str
+    ok: bool
+    seconds: float
+    adopted: bool = False
+    counts: dict = field(default_factory=dict)
+    changes: list = field(default_factory=list)
+    error: str = ""
+    log: str = ""
+
+
+def find_projects(root, adopt_legacy=False):
+    """Returns the project directories under root (root included), sorted.
+
+    Hidden directories, venvs and node_modules are not searched. Projects
+    inside projects (monorepo packages) are found too. Directories with
+    the LEGACY_MARKERS but no manifest only count with adopt_legacy.
+    """
+    from . import manifest
+
+    found = []
+    stack = [os.path.abspath(root)]
+    while stack:
+        path = stack.pop()
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        names = {entry.name for entry in entries}
+        if os.path.isfile(os.path.join(path, manifest.MANIFEST_PATH)) or (
+            adopt_legacy and all(marker in names for marker in LEGACY_MARKERS)
+        ):
+            found.append(path)
+        stack.extend(
+            entry.path for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+            and not entry.name.startswith(".")
+            and entry.name not in SKIP_DIRS
+        )
+    return sorted(found)
+
+
+def infer_context(path):
+    """Infers the context of a project that has no manifest.
+
+    The profile is the one whose directory structure the project matches
+    best; the package manager comes from its lock files.
+    """
+    from .assets import configs
+
+    def score(profile_name):
+        structure = set(configs.get_profile(profile_name)["structure"])
+        present = sum(os.path.isdir(os.path.join(path, d)) for d in structure)
+        return present - (len(structure) - present)
+
+    profile = max(configs.PROFILES, key=score)
+    if os.path.exists(os.path.join(path, "uv.lock")):
+        manager = "uv"
+    elif os.path.exists(os.path.join(path, "poetry.lock")):
+        manager = "poetry"
+    else:
+        manager = "pip"
+    context = {
+        "__PROJECT_NAME__": os.path.basename(path),
+        "__PROFILE__": profile,
+        "__PACKAGE_MANAGER__": manager,
+    }
+    try:
+        with open(os.path.join(path, ".python-version")) as f:
+            context["__PYTHON_VERSION__"] = f.read().strip()
+    except OSError:
+        pass
+    return context
+
+
+def _read(path):
+    """Returns a file's bytes, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _line_counts(old, new):
+    """Counts lines added and removed between two versions of a file."""
+    added = removed = 0
+    for line in difflib.unified_diff(
+        old.decode(errors="replace").splitlines(),
+        new.decode(errors="replace").splitlines(),
+        lineterm="", n=0
+    ):
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    return added, removed
+
+
+def snapshot(path, context):
+    """Reads the files a project's plan covers, for the diff summary."""
+    from . import engine, plan
+
+    jinja_context = engine.build_jinja_context(context)
+    try:
+        render_plan = plan.get_plan(
+            jinja_context["profile"], jinja_context["package_manager"],
+            context.get("__LAYOUT__", plan.PROJECT)
+        )
+    except ValueError:
+        return {}
+    return {name: _read(os.path.join(path, name)) for name, _ in render_plan.files}
+
+
+def update_project(path, force=False, adopt_legacy=False):
+    """Updates one project in place, capturing its output into the result.
+
+    A project without a manifest fails unless adopt_legacy is set.
+    """
+    from . import engine, manifest
+
+    start = time.perf_counter()
+    log = io.StringIO()
+    previous = manifest.load(path)
+    adopted = previous is None
+    if adopted and not adopt_legacy:
+        return UpdateResult(
+            path, "unknown", False, time.perf_counter() - start,
+            error=f"no {manifest.MANIFEST_PATH} (pass --adopt-legacy to adopt it)"
+        )
+    context = infer_context(path) if adopted else {}
+    profile = (previous or {}).get("profile") or context.get("__PROFILE__", "fullstack")
+
+    before = snapshot(path, previous["context"] if previous else context)
+    try:
+        with contextlib.redirect_stdout(log):
+            report = engine.create_structure(
+                path, update=True, context=context, force=force, workers=1,
+                setup_venv=False
+            )
+    except (Exception, SystemExit) as e:
+        errors = [line for line in log.getvalue().splitlines() if "❌" in line]
+        error = errors[0].strip() if isinstance(e, SystemExit) and errors else str(e)
+        return UpdateResult(
+            path, profile, False, time.perf_counter() - start, adopted,
+            error=error or repr(e), log=log.getvalue()
+        )
+
+    if adopted:
+        report = adopt(path, report)
+
+    counts = {}
+    changes = []
+    for result in report:
+        counts[result.status] = counts.get(result.status, 0) + 1
+        if result.status == engine.UNCHANGED:
+            continue
+        change = FileChange(result.path, result.status, detail=result.detail)
+        if result.status in (engine.CREATED, engine.UPDATED):
+            new = result.content
+            if new is None:
+                new = _read(os.path.join(path, result.path)) or b""
+            change.added, change.removed = _line_counts(before.get(result.path) or b"", new)
+        changes.append(change)
+
+    failed = counts.get(engine.ERROR, 0)
+    return UpdateResult(
+        path, profile, not failed, time.perf_counter() - start, adopted,
+        counts=counts, changes=changes,
+        error=f"{failed} template(s) failed" if failed else "",
+        log=log.getvalue()
+    )
+
+
+def adopt(path, report):
+    """Records existing files that match their template in a new manifest.
+
+    An update of a project without a manifest leaves its existing files
+    alone; the ones identical to what the template renders today are
+    recorded as if Forge had written them, so later template changes
+    reach them. Returns the report with those files marked ADOPTED.
+    """
+    from . import engine, manifest, templating
+
+    scaffold_manifest = manifest.load(path)
+    if scaffold_manifest is None:
+        return report
+    jinja_context = engine.build_jinja_context(scaffold_manifest["context"])
+    ctx_hash = manifest.context_hash(jinja_context)
+    adopted = []
+    for result in report:
+        if result.status == engine.SKIPPED and result.path not in scaffold_manifest["files"]:
+            file_path = os.path.join(path, result.path)
+            digest = templating.template_digest(result.template) if result.template else None
+            try:
+                rendered = engine.render_file(result.template, jinja_context, digest)
+            except Exception:
+                rendered = None
+            data = _read(file_path)
+            if data is not None and data == rendered:
+                scaffold_manifest["files"][result.path] = manifest.make_entry(
+                    file_path, result.template, digest, ctx_hash, data
+                )
+                result = engine.FileResult(result.path, result.template, ADOPTED)
+        adopted.append(result)
+    manifest.save(path, scaffold_manifest)
+    return adopted
+
+
+def run_key(root, force):
+    """Identifies a fleet run: the root, the template versions and --force.
+
+    Template versions cover bundled templates, their overrides (with
+    their includes) and every template pack.
+
+    A state file written under another key (templates changed since the
+    interruption, say) is not resumed from.
+    """
+    from . import packs, templating
+
+    names = list(templating.bundled_index())
+    for pack_name, template_dir in packs.template_dirs().items():
+        for dirpath, _, filenames in os.walk(template_dir):
+            names += [
+                pack_name + packs.DELIMITER
+                + os.path.relpath(os.path.join(dirpath, f), template_dir).replace(os.sep, "/")
+                for f in filenames
+            ]
+    override_dir = templating.get_override_dir()
+    digests = {}
+    for name in sorted(names):
+        digest = templating.template_digest(name, override_dir)
+        # Rendered fresh every time anyway; a random digest would never resume
+        digests[name] = "volatile" if templating.is_volatile(digest) else digest
+    payload = json.dumps(
+        [STATE_VERSION, os.path.abspath(root), bool(force), digests], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def get_state_path(root):
+    """Returns the state file for fleet runs over root."""
+    from . import config_manager
+
+    name = hashlib.sha256(os.path.abspath(root).encode()).hexdigest()[:16]
+    return os.path.join(config_manager.cache_dir("fleet"), f"{name}.jsonl")
+
+
+def load_state(path, key):
+    """Returns {project path: result dict} of a run to resume, or {}.
+
+    The state is JSON Lines: a header with the run key, then one line per
+    finished project. A line cut short by an interruption is ignored.
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return {}
+    done = {}
+    for number, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if number == 0:
+            if record.get("key") != key:
+                return {}
+            continue
+        if record.get("ok"):
+            done[record["path"]] = record
+    return done
+
+
+class StateWriter:
+    """Appends finished projects to the state file, one flushed line each."""
+
+    def __init__(self, path, key, done):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"key": key}) + "\n")
+            for record in done.values():
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, path)
+        self._file = open(path, "a")
+
+    def record(self, result):
+        """Appends a result (without its log)."""
+        data = asdict(result)
+        data.pop("log")
+        self._file.write(json.dumps(data) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def run_updates(projects, jobs=None, force=False, on_result=None, adopt_legacy=False):
+    """Updates every project, at most jobs at a time.
+
+    Args:
+        on_result: Called with each UpdateResult as it finishes.
+
+    Returns:
+        The results, in completion order.
+
+    Raises:
+        KeyboardInterrupt: After cancelling the projects not started yet.
+    """
+    from . import engine
+
+    results = []
+    if jobs is not None and jobs <= 1:
+        for path in projects:
+            results.append(update_project(path, force, adopt_legacy))
+            if on_result:
+                on_result(results[-1])
+        return results
+
+    engine.warm_templates()
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=engine.warm_templates)
+    try:
+        futures = [pool.submit(update_project, path, force, adopt_legacy) for path in projects]
+        for future in as_completed(futures):
+            results.append(future.result())
+            if on_result:
+                on_result(results[-1])
+    except KeyboardInterrupt:
+        # Don't wait for the queue to drain; the state file has what finished
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return results
+
+
+def format_result(result, root):
+    """Formats one project's diff summary line."""
+    from . import engine
+
+    path = os.path.relpath(result.path, root)
+    if not result.ok and not result.counts:
+        return f"❌ {path} ({result.profile}): {result.error}"
+    changes = [c for c in result.changes if c.status in (engine.CREATED, engine.UPDATED)]
+    parts = [
+        f"{result.counts[status]} {status}"
+        for status in (engine.CREATED, engine.UPDATED, ADOPTED, engine.SKIPPED, engine.ERROR)
+        if result.counts.get(status)
+    ]
+    if changes:
+        added = sum(c.added for c in changes)
+        removed = sum(c.removed for c in changes)
+        parts.append(f"+{added} -{removed}")
+    summary = ", ".join(parts) or "up to date"
+    icon = "❌" if not result.ok else ("✏️ " if changes else "✅")
+    note = " [adopted, no manifest]" if result.adopted else ""
+    return f"{icon} {path} ({result.profile}): {summary}{note}"
+
+
+def print_changes(result):
+    """Lists the files an update touched."""
+    for change in result.changes:
+        detail = f" +{change.added} -{change.removed}" if change.added or change.removed else ""
+        if change.detail:
+            detail += f" ({change.detail})"
+        print(f"     {change.status:<11} {change.path}{detail}")
+
+
+def main(argv=None):
+    """Entry point for `forge-project update`."""
+    from . import engine
+
+    parser = argparse.ArgumentParser(
+        prog="forge-project update",
+        description="Re-apply the current templates to every project under a directory."
+    )
+    parser.add_argument(
+        "--all",
+        metavar="ROOT",
+        required=True,
+        help="Update every scaffolded project found under ROOT"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Projects updated at once (default: CPU count, 1 runs in-process)"
+    )
+    parser.add_argument(
+        "--force", "-f",
+        action="store_true",
+        help="Also overwrite files modified locally"
+    )
+    parser.add_argument(
+        "--adopt-legacy",
+        action="store_true",
+        help=f"Also update directories with {' and '.join(LEGACY_MARKERS)} but no "
+             "manifest, adopting them as Forge projects"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the progress of an interrupted run and update every project"
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="List each project's changed files")
+    args = parser.parse_args(argv)
+
+    root = os.path.abspath(args.all)
+    if not os.path.isdir(root):
+        print(f"❌ Error: {root} is not a directory.")
+        sys.exit(1)
+
+    projects = find_projects(root, args.adopt_legacy)
+    if not projects:
+        print(f"No scaffolded projects found under {root}.")
+        if not args.adopt_legacy:
+            print("   Projects without a .forge/manifest.json need --adopt-legacy.")
+        return
+
+    key = run_key(root, args.force)
+    state_path = get_state_path(root)
+    done = {} if args.restart else load_state(state_path, key)
+    done = {path: record for path, record in done.items() if path in projects}
+    pending = [path for path in projects if path not in done]
+    print(f"Updating {len(pending)} of {len(projects)} projects under {root}...")
+    if done:
+        print(f"   Resuming: {len(done)} already updated (--restart to redo them).")
+
+    writer = StateWriter(state_path, key, done)
+    finished = []
+
+    def on_result(result):
+        finished.append(result)
+        writer.record(result)
+        print(f"[{len(finished)}/{len(pending)}] {format_result(result, root)}")
+        if args.verbose:
+            print_changes(result)
+        if not result.ok and result.log:
+            print(f"\n--- {result.path} ---\n{result.log.rstrip()}\n")
+
+    start = time.perf_counter()
+    try:
+        run_updates(
+            pending, jobs=args.jobs, force=args.force, on_result=on_result,
+            adopt_legacy=args.adopt_legacy
+        )
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Interrupted after {len(finished)} projects; run the same command to resume.")
+        sys.exit(130)
+    finally:
+        writer.close()
+
+    failed = [r for r in finished if not r.ok]
+    changed = [r for r in finished if r.ok and r.counts.keys() & {engine.CREATED, engine.UPDATED}]
+    print(
+        f"\n{len(finished) - len(failed)}/{len(finished)} projects updated in "
+        f"{time.perf_counter() - start:.2f}s: {len(changed)} changed"
+        + (f", {len(failed)} failed (re-run to retry them)" if failed else "")
+    )
+    if failed:
+        sys.exit(1)
+    os.remove(state_path)
@@ -1,44 +1,210 @@
 """Git operations for the project generator."""
+import os
+import shutil
 import sys
 import subprocess
 
+from . import hook_cache, timing
 
-def run_command(command, cwd=None):
-    """Runs a shell command and handles errors."""
+BASELINE_MESSAGE = "Initial commit: Complete AI project scaffold"
+
+
+def run_command(command, cwd=None, input=None, env=None):
+    """Runs a command and handles errors.
+
+    Strings run through the shell; lists are executed directly.
+
+    Returns:
+        The command's stdout as bytes.
+    """
+    display = command if isinstance(command, str) else " ".join(command)
+    kwargs = {"input": input} if input is not None else {}
+    if env is not None:
+        kwargs["env"] = env
     try:
-        subprocess.run(
-            command,
-            check=True,
-            shell=True,
-            cwd=cwd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        print(f"✔ Executed: {command}")
+        with timing.span(display, "subprocess"):
+            proc = subprocess.run(
+                command,
+                check=True,
+                shell=isinstance(command, str),
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                **kwargs
+            )
+        print(f"✔ Executed: {display}")
+        return proc.stdout
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error executing: {command}")
+        print(f"❌ Error executing: {display}")
         print(e.stderr.decode())
         sys.exit(1)
 
 
-def init_git(base_path):
-    """Initializes Git, commits baseline, and creates develop branch."""
+def init_git(base_path, files=None):
+    """Initializes Git, commits baseline, and creates develop branch.
+
+    Args:
+        base_path: The project root.
+        files: (path, bytes) pairs making up the scaffold, as returned by
+            engine.baseline_files(). When given, the baseline commit is
+            streamed through `git fast-import` instead of staging the
+            working tree.
+    """
     print("...Initializing Git and Branching Strategy...")
 
-    # 1. Init
-    run_command("git init", cwd=base_path)
+    # 1. Init with develop checked out (main is created by the commit)
+    init_repo(base_path)
+
+    # 2. Commit to main, and point develop at the same commit
+    with timing.span("git baseline"):
+        if files is None:
+            stage_and_commit(base_path)
+        else:
+            commit_baseline(base_path, files)
+
+    # 3. Install Pre-commit hooks
+    with timing.span("pre-commit hooks"):
+        install_hooks(base_path)
+
+
+def init_repo(base_path):
+    """Creates an empty repository with develop as the initial branch."""
+    run_command(["git", "init", "-q", "--initial-branch=develop"], cwd=base_path)
+
+
+def commit_baseline(base_path, files):
+    """Writes main/develop from in-memory files with a single fast-import.
+
+    The index is then populated from HEAD, so the working tree (already
+    written by the engine) shows up clean.
+    """
+    ident = run_command(["git", "var", "GIT_COMMITTER_IDENT"], cwd=base_path)
+    stream = fast_import_stream(files, ident.decode().strip(), BASELINE_MESSAGE)
+    run_command(["git", "fast-import", "--quiet"], cwd=base_path, input=stream)
+    run_command(["git", "reset", "-q"], cwd=base_path)
+
+
+def stage_and_commit(base_path):
+    """Fallback when no file list is available: stage the working tree."""
+    run_command(["git", "add", "-A"], cwd=base_path)
+    run_command(["git", "commit", "-q", "-m", BASELINE_MESSAGE], cwd=base_path)
+    run_command(["git", "branch", "main"], cwd=base_path)
+
+
+def fast_import_stream(files, ident, message):
+    """Builds a fast-import stream committing files to main and develop.
 
-    # 2. Add files
-    run_command("git add .", cwd=base_path)
+    Args:
+        files: (path, bytes) pairs.
+        ident: "Name <email> <epoch> <tz>", as printed by `git var`.
+        message: The commit message.
+    """
+    chunks = []
+    for mark, (_, data) in enumerate(files, start=1):
+        chunks.append(b"blob\nmark :%d\ndata %d\n%s\n" % (mark, len(data), data))
 
-    # 3. Commit to Main
-    run_command(
-        'git commit -m "Initial commit: Complete AI project scaffold"', cwd=base_path
+    message = message.encode()
+    commit_mark = len(files) + 1
+    chunks.append(
+        b"commit refs/heads/main\nmark :%d\ncommitter %s\ndata %d\n%s\n"
+        % (commit_mark, ident.encode(), len(message), message)
     )
+    for mark, (path, _) in enumerate(files, start=1):
+        chunks.append(b"M 100644 :%d %s\n" % (mark, _quote_path(path)))
+    chunks.append(b"\nreset refs/heads/develop\nfrom :%d\n\n" % commit_mark)
+    return b"".join(chunks)
 
-    # 4. Create and Switch to Develop branch
-    run_command("git checkout -b develop", cwd=base_path)
 
-    # 5. Install Pre-commit hooks
+def _quote_path(path):
+    """C-style quotes a path for fast-import when it needs it."""
+    if path.startswith('"') or "\n" in path or "\\" in path:
+        escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{escaped}"'.encode()
+    return path.encode()
+
+
+def install_hooks(base_path):
+    """Installs pre-commit (into the project venv when there is one) and its git hook.
+
+    With the hook cache enabled, the hook is installed against the
+    shared, version-keyed PRE_COMMIT_HOME (see hook_cache.py).
+    """
     print("...Installing Pre-commit hooks...")
-    run_command("pip install pre-commit && pre-commit install", cwd=base_path)
+    pre_commit = ensure_pre_commit(base_path)
+    env = hook_environment(base_path, pre_commit)
+    run_command([pre_commit, "install"], cwd=base_path, env=env)
+    if env is not None:
+        hook_cache.patch_hook_script(base_path, env["PRE_COMMIT_HOME"])
+
+
+def warm_hooks(base_path, background=False):
+    """Builds every hook environment now instead of on the first commit.
+
+    With background, `pre-commit install-hooks` is started detached and
+    this returns immediately; its output goes to .git/forge-hooks-warmup.log.
+    """
+    pre_commit = venv_pre_commit(base_path) or "pre-commit"
+    env = hook_environment(base_path, pre_commit)
+    if not background:
+        print("...Warming pre-commit hook environments...")
+        run_command([pre_commit, "install-hooks"], cwd=base_path, env=env)
+        return
+
+    log_path = os.path.join(base_path, ".git", "forge-hooks-warmup.log")
+    with open(log_path, "wb") as log:
+        subprocess.Popen(
+            [pre_commit, "install-hooks"],
+            cwd=base_path,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True
+        )
+    print(f"...Warming pre-commit hook environments in the background (log: {log_path})...")
+
+
+def venv_pre_commit(base_path):
+    """Returns the project venv's pre-commit executable, if installed."""
+    path = os.path.join(base_path, "venv", "bin", "pre-commit")
+    return path if os.path.exists(path) else None
+
+
+def ensure_pre_commit(base_path):
+    """Returns a pre-commit command, installing pre-commit if needed.
+
+    The project venv normally has it already (requirements-dev.txt);
+    otherwise it is installed into the venv, and only projects without
+    a venv (e.g. poetry) fall back to the pip on PATH.
+    """
+    pre_commit = venv_pre_commit(base_path)
+    if pre_commit:
+        return pre_commit
+
+    venv_bin = os.path.join(base_path, "venv", "bin")
+    python = os.path.join(venv_bin, "python")
+    if os.path.exists(os.path.join(venv_bin, "pip")):
+        run_command([python, "-m", "pip", "install", "pre-commit"], cwd=base_path)
+    elif os.path.exists(python) and shutil.which("uv"):
+        # uv venvs have no pip of their own
+        run_command(["uv", "pip", "install", "--python", python, "pre-commit"], cwd=base_path)
+    else:
+        run_command(["pip", "install", "pre-commit"], cwd=base_path)
+        return "pre-commit"
+    return venv_pre_commit(base_path) or "pre-commit"
+
+
+def hook_environment(base_path, pre_commit):
+    """Returns the environment pointing pre-commit at the shared cache.
+
+    Returns None (inherit the environment) when the cache is disabled
+    or the pre-commit version cannot be determined.
+    """
+    if not hook_cache.is_enabled():
+        return None
+    version = hook_cache.parse_version(run_command([pre_commit, "--version"], cwd=base_path))
+    if version is None:
+        return None
+    home = hook_cache.home_for(version)
+    os.makedirs(home, exist_ok=True)
+    return hook_cache.environment(home)
@@ -0,0 +1,74 @@
+"""Shared cache of pre-commit hook environments.
+
+pre-commit builds one environment per hook repository and revision in
+PRE_COMMIT_HOME. Forge points every project at one directory per
+pre-commit version, so a hook built for one scaffold is reused by the
+next (and a pre-commit upgrade starts a fresh cache instead of sharing
+one across incompatible store layouts). The path is also exported from
+the project's git hook script, so commits read the same cache.
+"""
+import os
+import re
+import shlex
+
+# Written into .git/hooks/pre-commit so commits find the shared cache
+HOOK_LINE = "export PRE_COMMIT_HOME=${{PRE_COMMIT_HOME:-{}}}  # forge shared hook cache\n"
+
+
+def get_cache_dir():
+    """Returns the directory holding the per-version hook caches."""
+    from . import config_manager
+
+    return config_manager.cache_dir("pre-commit")
+
+
+def is_enabled():
+    """Returns False if the user disabled the cache (`hook_cache = false`).
+
+    An explicit PRE_COMMIT_HOME in the environment also wins.
+    """
+    from . import config_manager
+
+    if os.environ.get("PRE_COMMIT_HOME"):
+        return False
+    return config_manager.get_flag("hook_cache")
+
+
+def parse_version(output):
+    """Extracts the version from `pre-commit --version` output."""
+    if isinstance(output, bytes):
+        output = output.decode(errors="replace")
+    match = re.search(r"\d+(\.\d+)+\S*", output or "")
+    return match.group(0) if match else None
+
+
+def home_for(version):
+    """Returns the PRE_COMMIT_HOME for a pre-commit version."""
+    return os.path.join(get_cache_dir(), version)
+
+
+def environment(home):
+    """Returns os.environ with PRE_COMMIT_HOME set to home."""
+    return dict(os.environ, PRE_COMMIT_HOME=home)
+
+
+def patch_hook_script(base_path, home):
+    """Makes the installed git hook default to the shared cache.
+
+    Returns:
+        True if the hook script was found and now exports the cache.
+    """
+    hook = os.path.join(base_path, ".git", "hooks", "pre-commit")
+    try:
+        with open(hook) as f:
+            lines = f.readlines()
+    except OSError:
+        return False
+
+    lines = [line for line in lines if "forge shared hook cache" not in line]
+    # Keep the shebang first
+    position = 1 if lines and lines[0].startswith("#!") else 0
+    lines.insert(position, HOOK_LINE.format(shlex.quote(home)))
+    with open(hook, "w") as f:
+        f.writelines(lines)
+    return True
@@ -0,0 +1,141 @@
+"""Scaffold manifest used to make `--update` incremental.
+
+`.forge/manifest.json` is committed with the project and records, for
+every file Forge wrote, the template and context it came from and a hash
+of the bytes written. `.forge/stat-cache.json` is local (git-ignored) and
+remembers each file's size/mtime at the time its hash was last verified,
+so unchanged files are recognised without being read.
+"""
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = os.path.join(".forge", "manifest.json")
+STAT_CACHE_PATH = os.path.join(".forge", "stat-cache.json")
+VERSION = 1
+
+# File states reported by file_state()
+MISSING = "missing"
+CLEAN = "clean"
+MODIFIED = "modified"
+
+
+def content_hash(data):
+    """Hashes file content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def context_hash(jinja_context):
+    """Hashes a render context independently of key order."""
+    return hashlib.sha256(
+        json.dumps(jinja_context, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def new_manifest(profile, context):
+    """Returns an empty manifest for a scaffold."""
+    return {"version": VERSION, "profile": profile, "context": context, "files": {}}
+
+
+def load(base_path):
+    """Loads the manifest and merges in the local stat cache.
+
+    Returns:
+        The manifest dict, or None if the project has none (or an
+        unreadable/incompatible one).
+    """
+    try:
+        with open(os.path.join(base_path, MANIFEST_PATH)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != VERSION:
+        return None
+
+    try:
+        with open(os.path.join(base_path, STAT_CACHE_PATH)) as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        stats = {}
+    for path, entry in manifest["files"].items():
+        stat = stats.get(path)
+        if stat and stat.get("content_hash") == entry["content_hash"]:
+            entry["size"], entry["mtime_ns"] = stat["size"], stat["mtime_ns"]
+    return manifest
+
+
+def save(base_path, manifest):
+    """Writes the manifest (deterministic, no stat data) and the stat cache."""
+    os.makedirs(os.path.join(base_path, ".forge"), exist_ok=True)
+    stats = {}
+    for path, entry in sorted(manifest["files"].items()):
+        if "mtime_ns" in entry:
+            stats[path] = {
+                "size": entry["size"],
+                "mtime_ns": entry["mtime_ns"],
+                "content_hash": entry["content_hash"],
+            }
+
+    _write_text(os.path.join(base_path, MANIFEST_PATH), dumps(manifest))
+    _write_text(os.path.join(base_path, STAT_CACHE_PATH), _to_json(stats))
+
+
+def dumps(manifest):
+    """Serializes the committed part of a manifest (no stat data)."""
+    files = {
+        path: {
+            k: entry[k] for k in ("template", "template_digest", "context_hash", "content_hash")
+        }
+        for path, entry in sorted(manifest["files"].items())
+    }
+    return _to_json(dict(manifest, files=files))
+
+
+def _to_json(data):
+    """Formats JSON the way manifest files are stored."""
+    return json.dumps(data, indent=1, sort_keys=True) + "\n"
+
+
+def _write_text(path, text):
+    """Writes a file via a temp file and rename."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def make_entry(file_path, template, template_digest, ctx_hash, data, digest=None):
+    """Builds the manifest entry for a file that was just written.
+
+    Pass the content's digest instead of data when it is already known.
+    """
+    st = os.stat(file_path)
+    return {
+        "template": template,
+        "template_digest": template_digest,
+        "context_hash": ctx_hash,
+        "content_hash": digest or content_hash(data),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+    }
+
+
+def file_state(file_path, entry):
+    """Classifies a file against its manifest entry.
+
+    The file is only read when its size/mtime differ from the cached stat;
+    if its hash still matches, the entry's stat data is refreshed in place.
+    """
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        return MISSING
+
+    if entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+        return CLEAN
+
+    with open(file_path, "rb") as f:
+        if content_hash(f.read()) != entry["content_hash"]:
+            return MODIFIED
+    entry["size"], entry["mtime_ns"] = st.st_size, st.st_mtime_ns
+    return CLEAN
@@ -0,0 +1,301 @@
+"""`forge-project add-package`: many packages sharing one venv and toolchain.
+
+The first add-package turns the root (default: the current directory)
+into a monorepo: the shared tooling in configs.MONOREPO_ROOT, one venv
+and one git repository. Each package is scaffolded under the packages
+directory without the files the root provides (plan.PACKAGE layout),
+and is listed in .forge/monorepo.json.
+
+After every change the root's generated files are refreshed from that
+list: requirements.txt is the deduplicated union of every package's
+requirements, so the shared venv (and its venv cache key) only changes
+when a new distinct dependency appears, and the CI workflow gets one
+path filter per package.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+
+from .assets import configs
+
+MONOREPO_FILE = os.path.join(".forge", "monorepo.json")
+VERSION = 1
+DEFAULT_PACKAGES_DIR = "services"
+
+# Package names double as directory names and CI filter keys
+NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+REQUIREMENTS_HEADER = (
+    "# Generated by forge-project add-package from each package's requirements.txt.\n"
+    "# Edit those, then run `forge-project add-package --sync`.\n"
+)
+
+
+def load(root):
+    """Returns the monorepo state, or None if root is not a monorepo."""
+    try:
+        with open(os.path.join(root, MONOREPO_FILE)) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get("version") == VERSION else None
+
+
+def save(root, state):
+    """Writes the monorepo state atomically."""
+    path = os.path.join(root, MONOREPO_FILE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def check_packages_dir(root, packages_dir):
+    """Returns packages_dir normalized, if it is a directory inside root.
+
+    Raises:
+        ValueError: If it is absolute, the root itself, or leads outside it.
+    """
+    root = os.path.abspath(root)
+    path = os.path.abspath(os.path.join(root, packages_dir))
+    if os.path.isabs(packages_dir) or path == root or os.path.commonpath([root, path]) != root:
+        raise ValueError(
+            f"--packages-dir must be a directory inside the monorepo root, got {packages_dir!r}"
+        )
+    return os.path.relpath(path, root)
+
+
+def new_state(packages_dir=DEFAULT_PACKAGES_DIR):
+    """Returns the state of a monorepo without packages."""
+    return {"version": VERSION, "packages_dir": packages_dir, "packages": {}}
+
+
+def merged_requirements(root, state):
+    """Returns every package's requirement lines, deduplicated and sorted."""
+    seen = {}
+    for name in sorted(state["packages"]):
+        path = os.path.join(root, state["packages"][name]["path"], "requirements.txt")
+        try:
+            with open(path) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            requirement = re.sub(r"(^|\s)#.*$", "", line).strip()
+            if requirement:
+                seen.setdefault(requirement.lower(), requirement)
+    return sorted(seen.values(), key=str.lower)
+
+
+def render_workflow(state, python_version):
+    """Renders the shared CI workflow with one path filter per package."""
+    from . import engine
+
+    template_name = configs.MONOREPO_GENERATED[".github/workflows/packages.yml"]
+    packages = [
+        {"name": name, "path": state["packages"][name]["path"]}
+        for name in sorted(state["packages"])
+    ]
+    content = engine.env.get_template(template_name).render(
+        packages=packages,
+        packages_dir=state["packages_dir"],
+        python_version=python_version,
+    )
+    return content.strip().encode("utf-8")
+
+
+def sync_root(root, state, python_version):
+    """Rewrites the root's generated files; returns the paths that changed."""
+    requirements = merged_requirements(root, state)
+    generated = {
+        "requirements.txt": (REQUIREMENTS_HEADER + "\n".join(requirements)).encode("utf-8"),
+        ".github/workflows/packages.yml": render_workflow(state, python_version),
+    }
+    changed = []
+    for path, data in generated.items():
+        full_path = os.path.join(root, path)
+        try:
+            with open(full_path, "rb") as f:
+                if f.read() == data:
+                    continue
+        except OSError:
+            pass
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(data)
+        changed.append(path)
+    return changed
+
+
+def init_root(root, context, packages_dir=DEFAULT_PACKAGES_DIR):
+    """Scaffolds the shared tooling into an empty root; returns the new state."""
+    from . import engine, plan
+
+    engine.check_greenfield(root)
+    engine.create_structure(
+        root, context={**context, "__LAYOUT__": plan.ROOT}, setup_venv=False
+    )
+    state = new_state(packages_dir)
+    save(root, state)
+    return state
+
+
+def add_package(root, state, name, context):
+    """Scaffolds a package and records it in the state.
+
+    Raises:
+        ValueError: If the name is invalid or already taken.
+    """
+    from . import engine, plan
+
+    if not NAME_PATTERN.match(name):
+        raise ValueError(f"Invalid package name {name!r} (letters, digits, '.', '_', '-')")
+    if name in state["packages"]:
+        raise ValueError(f"Package {name!r} already exists")
+    path = os.path.join(state["packages_dir"], name)
+    package_path = os.path.join(root, path)
+    if os.path.exists(package_path) and os.listdir(package_path):
+        raise ValueError(f"{path} already exists and is not empty")
+
+    os.makedirs(package_path, exist_ok=True)
+    report = engine.create_structure(
+        package_path,
+        context={**context, "__PROJECT_NAME__": name, "__LAYOUT__": plan.PACKAGE},
+        setup_venv=False
+    )
+    state["packages"][name] = {
+        "path": path,
+        "profile": context.get("__PROFILE__", "fullstack"),
+    }
+    save(root, state)
+    return report
+
+
+def post_render_tasks(root, setup_env, init_git):
+    """Builds the task graph for the shared venv and (new) repository."""
+    from . import engine, git_ops, tasks
+
+    graph = []
+    if setup_env:
+        environment = engine.PipEnvironment(root)
+        graph += [
+            tasks.Task("venv", environment.create, required=False),
+            tasks.Task("deps", environment.install, ("venv",), required=False),
+        ]
+    if init_git:
+        graph += [
+            tasks.Task("git init", lambda: git_ops.init_repo(root)),
+            tasks.Task("git baseline", lambda: git_ops.stage_and_commit(root), ("git init",)),
+            tasks.Task(
+                "hooks",
+                lambda: git_ops.install_hooks(root),
+                ("git init",),
+                after=("deps",) if setup_env else ()
+            ),
+        ]
+    return graph
+
+
+def parse_args(argv=None):
+    """Parses and checks add-package arguments (root made absolute)."""
+    parser = argparse.ArgumentParser(
+        prog="forge-project add-package",
+        description="Add a package to a monorepo (creating the monorepo on first use)."
+    )
+    parser.add_argument("name", nargs="?", help="Package name (its directory name)")
+    parser.add_argument("--root", default=".", help="Monorepo root (default: current directory)")
+    parser.add_argument(
+        "--profile",
+        default="fullstack",
+        help="Profile for the package (default: fullstack)"
+    )
+    parser.add_argument("--description", help="Package description")
+    parser.add_argument(
+        "--packages-dir",
+        default=DEFAULT_PACKAGES_DIR,
+        help=f"Directory packages go in, when creating the monorepo (default: {DEFAULT_PACKAGES_DIR})"
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Only refresh the root requirements, CI workflow and venv"
+    )
+    parser.add_argument("--no-venv", action="store_true", help="Skip the shared venv update")
+    parser.add_argument("--no-git", action="store_true", help="Skip git initialization")
+    args = parser.parse_args(argv)
+    if not args.name and not args.sync:
+        parser.error("a package name is required (or --sync)")
+    if args.profile not in configs.list_profiles():
+        parser.error(f"unknown profile {args.profile!r}")
+    args.root = os.path.abspath(args.root)
+    try:
+        args.packages_dir = check_packages_dir(args.root, args.packages_dir)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """Entry point for `forge-project add-package`."""
+    args = parse_args(argv)
+
+    from . import config_manager, engine
+    from .cli import run_post_render
+
+    root = args.root
+    state = load(root)
+    new_root = state is None
+    if new_root and args.sync:
+        print(f"❌ Error: {root} is not a monorepo (no {MONOREPO_FILE}).")
+        sys.exit(1)
+
+    if new_root:
+        settings = config_manager.get_settings({
+            "author_name": "User", "python_version": "3.10", "license": "MIT",
+        })
+        print(f"Creating monorepo in: {root}")
+        os.makedirs(root, exist_ok=True)
+        state = init_root(root, {
+            "__PROJECT_NAME__": os.path.basename(root),
+            "__AUTHOR_NAME__": settings["author_name"],
+            "__PYTHON_VERSION__": settings["python_version"],
+            "__LICENSE__": settings["license"],
+            "__PACKAGE_MANAGER__": "pip",
+        }, args.packages_dir)
+
+    root_context = engine.load_context(root)
+    if args.name:
+        context = {
+            key: value for key, value in root_context.items()
+            if key not in ("__PROJECT_NAME__", "__LAYOUT__")
+        }
+        context["__PROFILE__"] = args.profile
+        if args.description:
+            context["__PROJECT_DESCRIPTION__"] = args.description
+        print(f"Adding package {args.name} ({args.profile})")
+        try:
+            add_package(root, state, args.name, context)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+
+    changed = sync_root(root, state, root_context.get("__PYTHON_VERSION__", "3.10"))
+    for path in changed:
+        print(f"   Updated {path}")
+
+    # The shared venv only needs work when the merged requirements changed
+    venv_current = os.path.exists(os.path.join(root, "venv")) and "requirements.txt" not in changed
+    if venv_current and not args.no_venv:
+        print("   Shared environment already has every requirement.")
+    init_git = new_root and not args.no_git and not os.path.exists(os.path.join(root, ".git"))
+    run_post_render(post_render_tasks(root, not (args.no_venv or venv_current), init_git))
+
+    if args.name:
+        print(f"\n✅ Package {args.name} is ready in {state['packages'][args.name]['path']}")
+        if not init_git:
+            print("   Commit it together with the updated root files (git add -A).")
@@ -0,0 +1,236 @@
+"""Template packs: profiles and templates shipped outside this package.
+
+A pack is either an installed distribution exposing an entry point in
+the `forge.template_packs` group, or a directory under the packs dir
+(`<config dir>/packs/<name>/`) holding a pack.toml and templates/.
+
+An entry point resolves to an object (usually a module) with PROFILES,
+a dict shaped like configs.PROFILES, and TEMPLATE_DIR. pack.toml holds
+the same data:
+
+    [profiles.data-platform]
+    description = "Spark jobs and dbt models"
+    structure = ["jobs", "models"]
+
+    [profiles.data-platform.files]
+    "README.md" = "README.md.j2"
+
+Template names in a pack are relative to its template directory; the
+engine sees them as "<pack>:<name>", so a pack template includes its
+partials as "<pack>:partials/x.j2".
+
+Discovering packs means importing or parsing each of them, so what the
+wizard and list_profiles() need (pack names, template directories,
+profile descriptions and file lists) is cached in a registry file keyed
+by the mtimes of the sys.path directories (installing or removing a
+distribution changes them) and of every pack.toml. A pack itself is
+only loaded once one of its profiles is used.
+"""
+import functools
+import hashlib
+import json
+import os
+import sys
+
+ENTRY_POINT_GROUP = "forge.template_packs"
+
+# Separates the pack name from a template name ("acme:README.md.j2")
+DELIMITER = ":"
+
+# Bump to invalidate registries written by older versions
+REGISTRY_VERSION = 1
+
+_registry = None
+
+
+def get_packs_dir():
+    """Returns the directory holding directory-based packs."""
+    from . import config_manager
+
+    return config_manager.config_dir("packs")
+
+
+def get_registry_path():
+    """Returns the path of the cached pack registry."""
+    from . import config_manager
+
+    return config_manager.cache_dir("template-packs.json")
+
+
+def _pack_files(packs_dir=None):
+    """Returns {pack name: pack.toml path} for directory packs."""
+    packs_dir = packs_dir or get_packs_dir()
+    try:
+        names = sorted(os.listdir(packs_dir))
+    except OSError:
+        return {}
+    found = {}
+    for name in names:
+        path = os.path.join(packs_dir, name, "pack.toml")
+        if os.path.isfile(path):
+            found[name] = path
+    return found
+
+
+def registry_key():
+    """Fingerprints the installed distributions and pack directories.
+
+    Only stats files, so checking the registry is cheap.
+    """
+    stamps = [REGISTRY_VERSION]
+    for entry in sys.path:
+        try:
+            stamps.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            continue
+    for name, path in _pack_files().items():
+        st = os.stat(path)
+        stamps.append([name, st.st_mtime_ns, st.st_size])
+    return hashlib.sha256(json.dumps(stamps).encode()).hexdigest()
+
+
+def _summary(source, ref, template_dir, profiles):
+    """Builds a registry entry from a loaded pack."""
+    return {
+        "source": source,
+        "ref": ref,
+        "template_dir": os.path.abspath(template_dir),
+        "profiles": {
+            name: {
+                "description": profile.get("description", ""),
+                "files": sorted(profile.get("files", {})),
+            }
+            for name, profile in profiles.items()
+        },
+    }
+
+
+def _load_entry_point(name, ref):
+    """Imports an entry point pack; returns (template dir, profiles)."""
+    from importlib.metadata import EntryPoint
+
+    pack = EntryPoint(name, ref, ENTRY_POINT_GROUP).load()
+    return pack.TEMPLATE_DIR, pack.PROFILES
+
+
+def _load_directory(path):
+    """Parses a directory pack; returns (template dir, profiles)."""
+    import tomli
+
+    with open(path, "rb") as f:
+        data = tomli.load(f)
+    return os.path.join(os.path.dirname(path), "templates"), data.get("profiles", {})
+
+
+def build_registry():
+    """Loads every pack and summarizes it.
+
+    A pack that fails to load is reported and left out.
+    """
+    from importlib.metadata import entry_points
+
+    packs = {}
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            packs[ep.name] = _summary("entry_point", ep.value, *_load_entry_point(ep.name, ep.value))
+        except Exception as e:
+            print(f"⚠️  Skipping template pack {ep.name!r}: {type(e).__name__}: {e}")
+    for name, path in _pack_files().items():
+        if name in packs:
+            print(f"⚠️  Skipping template pack directory {name!r}: an installed pack has that name")
+            continue
+        try:
+            packs[name] = _summary("directory", path, *_load_directory(path))
+        except Exception as e:
+            print(f"⚠️  Skipping template pack {name!r}: {type(e).__name__}: {e}")
+    return packs
+
+
+def load_registry(refresh=False):
+    """Returns {pack name: summary}, from the cache while it is current."""
+    global _registry
+    if _registry is not None and not refresh:
+        return _registry
+
+    key = registry_key()
+    path = get_registry_path()
+    if not refresh:
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached.get("key") == key:
+                _registry = cached["packs"]
+                return _registry
+        except (OSError, ValueError, KeyError):
+            pass
+
+    _registry = build_registry()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"key": key, "packs": _registry}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+    return _registry
+
+
+def _find(profile_name):
+    """Returns the name of the pack providing a profile, or None."""
+    for pack_name, pack in load_registry().items():
+        if profile_name in pack["profiles"]:
+            return pack_name
+    return None
+
+
+def profile_names():
+    """Returns the profile names provided by packs."""
+    return [name for pack in load_registry().values() for name in pack["profiles"]]
+
+
+def describe(profile_name):
+    """Returns a pack profile's description without loading the pack."""
+    pack_name = _find(profile_name)
+    if pack_name is None:
+        return ""
+    return load_registry()[pack_name]["profiles"][profile_name]["description"]
+
+
+def template_dirs():
+    """Returns {pack name: template directory}, for the template loader."""
+    return {name: pack["template_dir"] for name, pack in load_registry().items()}
+
+
+@functools.lru_cache(maxsize=None)
+def load_pack(pack_name):
+    """Loads a pack's profiles, with template names qualified by the pack."""
+    pack = load_registry()[pack_name]
+    if pack["source"] == "entry_point":
+        _, profiles = _load_entry_point(pack_name, pack["ref"])
+    else:
+        _, profiles = _load_directory(pack["ref"])
+
+    qualified = {}
+    for name, profile in profiles.items():
+        files = {
+            path: f"{pack_name}{DELIMITER}{template}" if template else ""
+            for path, template in profile.get("files", {}).items()
+        }
+        qualified[name] = dict(profile, files=files)
+    return qualified
+
+
+def get_profile(profile_name):
+    """Returns a pack profile (loading its pack), or None if no pack has it."""
+    pack_name = _find(profile_name)
+    if pack_name is None:
+        return None
+    return load_pack(pack_name).get(profile_name)
+
+
+def template_path(name):
+    """Returns the file behind a "<pack>:<template>" name, or None."""
+    pack_name, _, template = name.partition(DELIMITER)
+    template_dir = template_dirs().get(pack_name)
+    if not template_dir or not template:
+        return None
+    path = os.path.join(template_dir, template)
+    return path if os.path.isfile(path) else None
@@ -0,0 +1,120 @@
+"""Immutable render plans: what a (profile, package manager) pair generates.
+
+Profiles in assets/configs.py are plain dicts that list directories
+(sometimes twice) and every file any manager might need. A RenderPlan
+resolves that once into a minimal directory set and the ordered files
+for one manager; plans are validated when built and cached for the
+lifetime of the process, so callers share them instead of copying.
+"""
+import functools
+import os
+from dataclasses import dataclass
+
+from .assets import configs
+
+# Layouts: a standalone project, a monorepo package, or a monorepo root
+PROJECT = "project"
+PACKAGE = "package"
+ROOT = "root"
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """The directories and (filename, template) pairs to generate."""
+    profile: str
+    package_manager: str
+    directories: tuple
+    files: tuple
+    layout: str = PROJECT
+
+    @property
+    def templates(self):
+        """Distinct template names used by the plan, in file order."""
+        return tuple(dict.fromkeys(t for _, t in self.files if t))
+
+
+@functools.lru_cache(maxsize=None)
+def get_plan(profile_name="fullstack", package_manager="pip", layout=PROJECT):
+    """Returns the cached plan for a profile and package manager.
+
+    Unknown profiles fall back to fullstack, as configs.get_profile does.
+    A monorepo PACKAGE leaves the tooling in configs.MONOREPO_SHARED to
+    the root; the ROOT layout plans configs.MONOREPO_ROOT instead of the
+    profile.
+
+    Raises:
+        ValueError: If the manager or layout is unknown or the profile
+            is malformed.
+    """
+    if package_manager not in configs.PACKAGE_MANAGERS:
+        raise ValueError(
+            f"Unknown package manager {package_manager!r} "
+            f"(expected one of {', '.join(configs.PACKAGE_MANAGERS)})"
+        )
+    if layout not in (PROJECT, PACKAGE, ROOT):
+        raise ValueError(f"Unknown layout {layout!r}")
+    profile = configs.MONOREPO_ROOT if layout == ROOT else configs.get_profile(profile_name)
+    structure = profile["structure"]
+    if layout == PACKAGE:
+        structure = [d for d in structure if not _is_shared(d)]
+
+    files = []
+    for filename, template_name in profile["files"].items():
+        # Package Manager Logic: e.g. requirements.txt only for pip
+        managers = configs.MANAGER_FILES.get(filename)
+        if managers and package_manager not in managers:
+            continue
+        if layout == PACKAGE and _is_shared(filename):
+            continue
+        _validate_path(profile_name, filename)
+        if template_name and not template_name.endswith(".j2"):
+            raise ValueError(
+                f"Profile {profile_name!r}: template for {filename!r} "
+                f"must be a .j2 file, got {template_name!r}"
+            )
+        files.append((filename, template_name))
+
+    for folder in structure:
+        _validate_path(profile_name, folder)
+
+    return RenderPlan(
+        profile=profile_name,
+        package_manager=package_manager,
+        directories=tuple(plan_directories(structure, [f for f, _ in files])),
+        files=tuple(files),
+        layout=layout,
+    )
+
+
+def _is_shared(path):
+    """True if a monorepo package takes this path from the root."""
+    normalized = os.path.normpath(path)
+    return normalized in configs.MONOREPO_SHARED or any(
+        normalized == d or normalized.startswith(d + os.sep) for d in configs.MONOREPO_SHARED_DIRS
+    )
+
+
+def plan_directories(structure, filenames):
+    """Returns the minimal sorted set of directories to create.
+
+    Duplicates are dropped, parents of nested files are included, and any
+    directory that is an ancestor of another one is left to os.makedirs.
+    """
+    wanted = {os.path.normpath(d) for d in structure}
+    wanted.update(os.path.dirname(os.path.normpath(f)) for f in filenames)
+    wanted.discard("")
+    wanted.discard(".")
+    ancestors = set()
+    for folder in wanted:
+        parent = os.path.dirname(folder)
+        while parent:
+            ancestors.add(parent)
+            parent = os.path.dirname(parent)
+    return sorted(wanted - ancestors)
+
+
+def _validate_path(profile_name, path):
+    """Rejects paths that would escape the project root."""
+    normalized = os.path.normpath(path)
+    if os.path.isabs(path) or normalized == ".." or normalized.startswith(".." + os.sep):
+        raise ValueError(f"Profile {profile_name!r}: {path!r} is outside the project")
@@ -0,0 +1,117 @@
+"""In-process cache of rendered templates, shared across projects.
+
+Most templates read few context variables, and many (ansible.cfg, the
+feature template, CI workflows) read none at all. The template index
+records which variables each template and its includes read, so a
+rendered file is cached under the template's digest plus the values of
+just those variables. Batch workers, the HTTP service and update runs
+then render each distinct output once per process, however many
+projects ask for it. The cache is an LRU bounded by entry count and
+total size.
+"""
+import threading
+from collections import OrderedDict
+
+from . import templating
+
+MAX_ENTRIES = 4096
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """A thread-safe LRU of rendered bytes with hit/miss counters."""
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the cached bytes for key, or None (counting the lookup)."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        """Stores data, evicting the least recently used entries past the bounds."""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = data
+            self.size += len(data)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns the counters as a JSON-friendly dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+
+_cache = RenderCache()
+
+# (template name, digest) -> variables it reads, or None for "all"
+_variables = {}
+
+
+def get_cache():
+    """Returns the process-wide render cache."""
+    return _cache
+
+
+def variables_for(template_name, digest):
+    """Returns (and memoizes) the variables a template version reads."""
+    key = (template_name, digest)
+    if key not in _variables:
+        _variables[key] = templating.template_variables(template_name)
+    return _variables[key]
+
+
+def cache_key(template_name, digest, jinja_context):
+    """Keys a render by template version and the variables it reads."""
+    variables = variables_for(template_name, digest)
+    if variables is None:
+        values = tuple(sorted(jinja_context.items()))
+    else:
+        values = tuple((name, jinja_context.get(name)) for name in variables)
+    return (template_name, digest, values)
+
+
+def format_stats(stats):
+    """Formats stats() as a one-line summary."""
+    lookups = stats["hits"] + stats["misses"]
+    if not lookups:
+        return "Render cache: no lookups"
+    return (
+        f"Render cache: {stats['hits']}/{lookups} hits ({stats['hit_rate']:.0%}), "
+        f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB"
+    )
@@ -0,0 +1,403 @@
+"""`forge-project serve`: a local HTTP service that renders scaffolds.
+
+One long-lived process loads the templates and resolves every profile
+up front, then forks a pool of render workers that inherit them, so a
+request costs a render instead of a Python start-up. Endpoints:
+
+    POST /scaffold[?format=tar.gz|zip&root=NAME]
+        Body: a JSON object of create_structure context keys, e.g.
+        {"__PROFILE__": "web", "__PROJECT_NAME__": "billing"}.
+        Returns the scaffold as an archive (see archive.py).
+    GET /healthz
+    GET /metrics
+        Request counts, in-flight/queued requests and latency percentiles.
+
+The server speaks just enough HTTP/1.1 for these endpoints and closes
+the connection after each response; run it behind the portal, not on a
+public interface.
+"""
+import argparse
+import asyncio
+import collections
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, quote, urlsplit
+
+from .archive import check_root
+from .assets import configs
+from .engine import CONTEXT_KEYS as ENGINE_KEYS
+
+# Context keys a request may set (the ones create_structure reads)
+CONTEXT_KEYS = tuple(ENGINE_KEYS)
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_HEADER_BYTES = 16 * 1024
+
+# Seconds a client gets to send its headers, then its body
+READ_TIMEOUT = 30
+
+CONTENT_TYPES = {"tar.gz": "application/gzip", "zip": "application/zip"}
+
+# Characters kept in the plain filename= of Content-Disposition
+UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class RequestError(Exception):
+    """A request the server rejects with a 4xx/5xx status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def warm():
+    """Loads every template and resolves every plan (runs before forking)."""
+    from . import engine, plan
+
+    engine.warm_templates()
+    for profile_name in configs.list_profiles():
+        for manager in configs.PACKAGE_MANAGERS:
+            plan.get_plan(profile_name, manager)
+
+
+def render_archive(context, fmt="tar.gz", root=""):
+    """Renders a scaffold archive in a worker.
+
+    Returns:
+        (archive bytes, render cache hits, render cache lookups) - the
+        counts are this request's share of the worker's cache.
+    """
+    from . import archive, render_cache
+
+    cache = render_cache.get_cache()
+    hits, misses = cache.hits, cache.misses
+    buf = io.BytesIO()
+    archive.write_archive(buf, context, fmt, root)
+    return buf.getvalue(), cache.hits - hits, cache.hits + cache.misses - hits - misses
+
+
+def validate_context(context):
+    """Checks a request body against the keys and values create_structure accepts."""
+    if not isinstance(context, dict):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+    unknown = sorted(set(context) - set(CONTEXT_KEYS))
+    if unknown:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"unknown context keys: {unknown}")
+    if not all(isinstance(v, str) for v in context.values()):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "context values must be strings")
+    if context.get("__PROFILE__", "fullstack") not in configs.list_profiles():
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"unknown profile {context['__PROFILE__']!r}")
+    if context.get("__PACKAGE_MANAGER__", "pip") not in configs.PACKAGE_MANAGERS:
+        raise RequestError(
+            HTTPStatus.BAD_REQUEST, f"unknown package manager {context['__PACKAGE_MANAGER__']!r}"
+        )
+    return context
+
+
+class Metrics:
+    """Request counters and a rolling window of scaffold latencies."""
+
+    def __init__(self, window=1000):
+        self.started = time.time()
+        self.requests = 0
+        self.statuses = collections.Counter()
+        self.latencies = collections.deque(maxlen=window)
+        self.in_flight = 0
+        self.queued = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+
+    def record(self, status, seconds, scaffold=False):
+        """Counts a finished request; scaffold latencies feed the percentiles."""
+        self.requests += 1
+        self.statuses[int(status)] += 1
+        if scaffold:
+            self.latencies.append(seconds)
+
+    def snapshot(self):
+        """Returns the metrics as a JSON-friendly dict."""
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            if not ordered:
+                return None
+            index = min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))
+            return round(ordered[index] * 1000, 3)
+
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "render_cache": {
+                "hits": self.cache_hits,
+                "lookups": self.cache_lookups,
+                "hit_rate": (
+                    round(self.cache_hits / self.cache_lookups, 4) if self.cache_lookups else None
+                ),
+            },
+            "scaffold_latency_ms": {
+                "count": len(ordered),
+                "p50": percentile(50),
+                "p90": percentile(90),
+                "p99": percentile(99),
+                "max": percentile(100),
+            },
+        }
+
+
+class ScaffoldService:
+    """Routes requests and limits how many renders run and wait at once.
+
+    Args:
+        executor: Pool the renders run in.
+        max_concurrent: Renders allowed in flight at once.
+        max_queue: Requests allowed to wait for a slot; beyond that the
+            server answers 503 instead of queueing.
+    """
+
+    def __init__(self, executor, max_concurrent, max_queue):
+        self.executor = executor
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.metrics = Metrics()
+
+    async def handle(self, reader, writer):
+        """Serves one connection (one request)."""
+        start = time.perf_counter()
+        scaffold = False
+        try:
+            method, target, body = await read_request(reader)
+            url = urlsplit(target)
+            scaffold = url.path == "/scaffold"
+            status, headers, payload = await self.route(method, url, body)
+        except RequestError as e:
+            status, headers, payload = e.status, {}, _json({"error": str(e)})
+        except Exception as e:
+            status, headers, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {}, _json(
+                {"error": f"{type(e).__name__}: {e}"}
+            )
+
+        elapsed = time.perf_counter() - start
+        headers.setdefault("Content-Type", "application/json")
+        headers["X-Forge-Elapsed-Ms"] = f"{elapsed * 1000:.1f}"
+        try:
+            response = encode_response(status, headers, payload)
+        except ValueError as e:
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            response = encode_response(status, {"Content-Type": "application/json"}, _json(
+                {"error": f"bad response header: {e}"}
+            ))
+        self.metrics.record(status, elapsed, scaffold=scaffold and status == HTTPStatus.OK)
+        try:
+            await write_response(writer, response)
+        except ConnectionError:
+            pass
+
+    async def route(self, method, url, body):
+        """Dispatches a parsed request to its endpoint."""
+        if url.path == "/healthz" and method == "GET":
+            return HTTPStatus.OK, {}, _json({"status": "ok"})
+        if url.path == "/metrics" and method == "GET":
+            return HTTPStatus.OK, {}, _json(self.metrics.snapshot())
+        if url.path == "/scaffold":
+            if method != "POST":
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+            return await self.scaffold(parse_qs(url.query), body)
+        raise RequestError(HTTPStatus.NOT_FOUND, f"no route for {method} {url.path}")
+
+    async def scaffold(self, query, body):
+        """Renders the requested scaffold in the worker pool."""
+        fmt = query.get("format", ["tar.gz"])[0]
+        if fmt not in CONTENT_TYPES:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"unknown format {fmt!r}")
+        root = query.get("root", [""])[0]
+        try:
+            check_root(root)
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(e))
+        try:
+            context = validate_context(json.loads(body or b"{}"))
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"invalid JSON: {e}")
+
+        if self.slots.locked() and self.metrics.queued >= self.max_queue:
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, "server busy, retry later")
+
+        self.metrics.queued += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.metrics.queued -= 1
+        self.metrics.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            data, hits, lookups = await loop.run_in_executor(
+                self.executor, render_archive, context, fmt, root
+            )
+        finally:
+            self.metrics.in_flight -= 1
+            self.slots.release()
+        self.metrics.cache_hits += hits
+        self.metrics.cache_lookups += lookups
+
+        extension = "zip" if fmt == "zip" else "tar.gz"
+        name = str(context.get("__PROJECT_NAME__", "ai_project"))
+        return HTTPStatus.OK, {
+            "Content-Type": CONTENT_TYPES[fmt],
+            "Content-Disposition": content_disposition(f"{name}.{extension}"),
+        }, data
+
+
+def content_disposition(filename):
+    """Returns an attachment header value safe for any project name.
+
+    filename= gets an ASCII stand-in; the real name travels percent-encoded
+    in filename* (RFC 5987), so nothing from the request reaches the header
+    unescaped.
+    """
+    fallback = UNSAFE_FILENAME.sub("_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+async def read_request(reader, timeout=READ_TIMEOUT):
+    """Reads one request; returns (method, target, body).
+
+    The headers and the body each have to arrive within timeout seconds,
+    so an idle or trickling client cannot hold the connection open.
+    """
+    try:
+        head = await _read(reader.readuntil(b"\r\n\r\n"), timeout, "headers")
+    except asyncio.LimitOverrunError:
+        raise RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large")
+
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+
+    value = headers.get("content-length", "0")
+    if not re.fullmatch(r"[0-9]+", value):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"bad Content-Length {value!r}")
+    length = int(value)
+    if length > MAX_BODY_BYTES:
+        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body too large")
+    body = await _read(reader.readexactly(length), timeout, "body") if length else b""
+    return method.upper(), target, body
+
+
+async def _read(read, timeout, what):
+    """Awaits one read, turning a short or slow read into a RequestError."""
+    try:
+        return await asyncio.wait_for(read, timeout)
+    except asyncio.IncompleteReadError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"incomplete {what}")
+    except asyncio.TimeoutError:
+        raise RequestError(HTTPStatus.REQUEST_TIMEOUT, f"timed out reading {what}")
+
+
+def encode_response(status, headers, payload):
+    """Serializes a complete response.
+
+    Raises:
+        ValueError: If a header contains a line break or a character
+            outside latin-1 (UnicodeEncodeError is a ValueError).
+    """
+    status = HTTPStatus(status)
+    head = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    headers = dict(headers, **{"Content-Length": str(len(payload)), "Connection": "close"})
+    for key, value in headers.items():
+        if "\r" in f"{key}{value}" or "\n" in f"{key}{value}":
+            raise ValueError(f"line break in {key} header")
+        head.append(f"{key}: {value}")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload
+
+
+async def write_response(writer, response):
+    """Writes an encoded response and closes the connection."""
+    writer.write(response)
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def _json(data):
+    """Encodes a JSON response body."""
+    return json.dumps(data).encode() + b"\n"
+
+
+async def serve(host, port, executor, max_concurrent, max_queue, ready=None):
+    """Runs the server until cancelled.
+
+    Args:
+        ready: Optional callback receiving the bound (host, port) once
+            the server is listening (useful with port 0).
+    """
+    service = ScaffoldService(executor, max_concurrent, max_queue)
+    server = await asyncio.start_server(
+        service.handle, host, port, limit=MAX_HEADER_BYTES
+    )
+    address = server.sockets[0].getsockname()[:2]
+    if ready:
+        ready(address)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Entry point for `forge-project serve`."""
+    parser = argparse.ArgumentParser(
+        prog="forge-project serve",
+        description="Serve scaffold archives over HTTP from a warm process."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Render worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        help="Renders in flight at once (default: --workers)"
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=64,
+        help="Requests allowed to wait for a render slot before 503 (default: 64)"
+    )
+    args = parser.parse_args(argv)
+
+    print("...Warming templates and profiles...")
+    warm()
+    executor = ProcessPoolExecutor(max_workers=args.workers, initializer=warm)
+
+    def ready(address):
+        print(f"🚀 Serving scaffolds on http://{address[0]}:{address[1]} ({args.workers} workers)")
+
+    try:
+        asyncio.run(serve(
+            args.host, args.port, executor,
+            args.max_concurrent or args.workers, args.max_queue, ready
+        ))
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        executor.shutdown(cancel_futures=True)
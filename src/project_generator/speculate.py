@@ -0,0 +1,249 @@
+"""Speculative work started while the wizard is still prompting.
+
+The wizard asks its questions one at a time, and most of the scaffold
+does not depend on the later answers. A Speculator is told about every
+answer (and the defaults standing in for the rest) and starts, in the
+background, whatever those answers already determine:
+
+- loading the templates of the profile the answers point at;
+- rendering templates whose variables (per the template index) are all
+  answered, into the render cache, so create_structure() gets hits;
+- building the pip venv for the profile's requirements in the venv
+  cache, so the project's venv is cloned instead of installed (unless
+  the run will not create a venv: dry runs and archives).
+
+Work is keyed by its inputs: a render that a later answer makes
+irrelevant is simply never looked up, a render that has not started yet
+is cancelled, and a venv build for requirements that no longer apply
+(another profile, a non-pip manager) is terminated. Speculation is
+silent and never fails the scaffold; the real run redoes anything that
+was missed.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# The venv build's requirement files, in PipEnvironment order
+REQUIREMENT_FILES = ("requirements.txt", "requirements-dev.txt")
+
+# Renders run beside the prompts; a couple of threads keep up with typing
+WORKERS = 2
+
+
+def is_enabled():
+    """Returns False if the user disabled speculation (`speculate = false`)."""
+    from . import config_manager
+
+    return config_manager.get_flag("speculate")
+
+
+class Speculator:
+    """Runs the background work that the wizard's answers so far allow.
+
+    Args:
+        workers: Threads rendering templates.
+        build_venv: False when the run creates no venv (--dry-run,
+            --output-archive), so no venv is built speculatively either.
+    """
+
+    def __init__(self, workers=WORKERS, build_venv=True):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="speculate")
+        # render cache key -> future (cancelled futures are dropped)
+        self._renders = {}
+        self._loaded = set()
+        self._venv = None
+        self.build_venv = build_venv
+        self.cancelled = False
+
+    def update(self, answers, guesses=None):
+        """Starts the work determined by answers and cancels stale work.
+
+        Args:
+            answers: The dunder context keys answered so far.
+            guesses: Values (usually the prompt defaults) assumed for
+                unanswered keys when choosing which plan to speculate on.
+        """
+        from . import engine, plan, render_cache, templating
+
+        if self.cancelled:
+            return
+        context = {**(guesses or {}), **answers}
+        jinja_context = engine.build_jinja_context(context)
+        try:
+            render_plan = plan.get_plan(
+                jinja_context["profile"], jinja_context["package_manager"]
+            )
+        except ValueError:
+            return
+
+        unknown = {
+            name for key, (name, _) in engine.CONTEXT_KEYS.items() if key not in answers
+        }
+        override_dir = templating.get_override_dir()
+        wanted = {}
+        for template_name in render_plan.templates:
+            if templating.static_source(template_name, override_dir):
+                continue
+            digest = templating.template_digest(template_name, override_dir)
+            if digest is None or templating.is_volatile(digest):
+                continue
+            variables = render_cache.variables_for(template_name, digest)
+            if variables is None or unknown.intersection(variables):
+                if template_name not in self._loaded:
+                    self._loaded.add(template_name)
+                    self._pool.submit(_load, template_name)
+                continue
+            key = render_cache.cache_key(template_name, digest, jinja_context)
+            wanted[key] = (template_name, digest)
+
+        for key, future in list(self._renders.items()):
+            if key not in wanted and future.cancel():
+                del self._renders[key]
+        for key, (template_name, digest) in wanted.items():
+            if key not in self._renders:
+                self._renders[key] = self._pool.submit(
+                    _render, template_name, jinja_context, digest
+                )
+
+        self._update_venv(answers, jinja_context, render_plan)
+
+    def _update_venv(self, answers, jinja_context, render_plan):
+        """Starts, keeps or terminates the speculative venv build."""
+        from . import engine, venv_cache
+
+        requirements = None
+        if (
+            self.build_venv
+            and "__PROFILE__" in answers
+            and jinja_context["package_manager"] == "pip"
+            and venv_cache.is_enabled()
+        ):
+            templates = dict(render_plan.files)
+            try:
+                requirements = tuple(
+                    (name, engine.render_file(templates[name], jinja_context))
+                    for name in REQUIREMENT_FILES if name in templates
+                )
+            except Exception:
+                requirements = None
+
+        if self._venv is not None:
+            if requirements == self._venv.requirements:
+                return
+            self._venv.cancel()
+            self._venv = None
+        if requirements:
+            self._venv = VenvBuild(requirements)
+            self._venv.start()
+
+    def wait(self, timeout=None):
+        """Waits for started renders and the venv build to finish."""
+        for future in list(self._renders.values()):
+            if not future.cancelled():
+                future.exception(timeout)
+        if self._venv is not None:
+            self._venv.join(timeout)
+
+    def cancel(self):
+        """Drops pending work and stops the venv build; safe to call twice."""
+        self.cancelled = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._venv is not None:
+            self._venv.cancel()
+
+
+class VenvBuild(threading.Thread):
+    """Builds a venv cache entry for given requirement file contents.
+
+    Runs in a daemon thread with its subprocesses started directly, so a
+    cancelled build is terminated instead of outliving the scaffold.
+    """
+
+    def __init__(self, requirements):
+        super().__init__(name="speculate-venv", daemon=True)
+        self.requirements = requirements
+        self.status = "pending"
+        self._proc = None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def run(self):
+        from . import venv_cache
+
+        scratch = tempfile.mkdtemp(prefix="forge-speculate-")
+        build_path = None
+        try:
+            paths = []
+            for name, data in self.requirements:
+                path = os.path.join(scratch, name)
+                with open(path, "wb") as f:
+                    f.write(data)
+                paths.append(path)
+            key = venv_cache.cache_key(paths)
+            if key is None or venv_cache.lookup(key):
+                self.status = "cached" if key else "skipped"
+                return
+
+            self.status = "building"
+            build_path = venv_cache.new_build_path(key)
+            pip = os.path.join(build_path, "bin", "pip")
+            install = [pip, "install"]
+            for path in paths:
+                install += ["-r", path]
+            steps = [
+                ["python3", "-m", "venv", build_path],
+                [pip, "install", "--upgrade", "pip", "setuptools", "wheel"],
+                install,
+            ]
+            if all(self._run(cmd) for cmd in steps):
+                venv_cache.store(build_path, key)
+                build_path = None
+                self.status = "built"
+            else:
+                self.status = "cancelled" if self._cancelled.is_set() else "failed"
+        except Exception:
+            self.status = "failed"
+        finally:
+            if build_path is not None:
+                shutil.rmtree(build_path, ignore_errors=True)
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def _run(self, cmd):
+        """Runs one build step; returns True on success."""
+        with self._lock:
+            if self._cancelled.is_set():
+                return False
+            self._proc = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        return self._proc.wait() == 0 and not self._cancelled.is_set()
+
+    def cancel(self):
+        """Terminates the running step; the build then cleans up."""
+        with self._lock:
+            self._cancelled.set()
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.terminate()
+
+
+def _load(template_name):
+    """Loads (and compiles, without precompiled templates) one template."""
+    from . import engine
+
+    try:
+        engine.env.get_template(template_name)
+    except Exception:
+        pass
+
+
+def _render(template_name, jinja_context, digest):
+    """Renders one template into the render cache."""
+    from . import engine
+
+    try:
+        engine.render_file(template_name, jinja_context, digest)
+    except Exception:
+        pass
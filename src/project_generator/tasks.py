@@ -0,0 +1,181 @@
+"""Dependency-graph scheduler for the work that follows rendering.
+
+Once the files are written, setting up the environment, committing the
+baseline and installing hooks are mostly independent. Each step is a
+Task naming the tasks it needs; run_tasks starts every task as soon as
+its dependencies succeed, runs independent ones concurrently in threads
+(they are all subprocess-bound), and skips everything downstream of a
+failure without stopping unrelated branches.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+
+from . import timing
+
+# Task statuses
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass
+class Task:
+    """A unit of post-render work.
+
+    func returning False, raising, or calling sys.exit counts as a
+    failure. A task runs only once all of deps succeeded, and after the
+    tasks in `after` finished whatever their outcome (ordering only).
+    Failures of tasks that are not required are reported but do not
+    fail the run.
+    """
+    name: str
+    func: object
+    deps: tuple = ()
+    required: bool = True
+    after: tuple = ()
+
+
+@dataclass
+class TaskResult:
+    """Outcome and timing (seconds from the start of the run) of a task."""
+    name: str
+    status: str
+    start: float = 0.0
+    end: float = 0.0
+    error: str = ""
+
+    @property
+    def seconds(self):
+        """How long the task ran."""
+        return self.end - self.start
+
+
+def validate(tasks):
+    """Raises ValueError for duplicate names, unknown deps or cycles."""
+    by_name = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate task {task.name!r}")
+        by_name[task.name] = task
+    for task in tasks:
+        unknown = [d for d in task.deps + task.after if d not in by_name]
+        if unknown:
+            raise ValueError(f"Task {task.name!r} depends on unknown {unknown}")
+
+    visiting, done = set(), set()
+
+    def visit(name, path):
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Task cycle: {' -> '.join(path + (name,))}")
+        visiting.add(name)
+        for dep in by_name[name].deps + by_name[name].after:
+            visit(dep, path + (name,))
+        visiting.discard(name)
+        done.add(name)
+
+    for task in tasks:
+        visit(task.name, ())
+    return by_name
+
+
+def _run(task, origin):
+    """Runs one task in a worker thread and times it."""
+    start = time.perf_counter() - origin
+    error = ""
+    try:
+        with timing.span(task.name, "task"):
+            ok = task.func() is not False
+    except SystemExit as e:
+        # git_ops reports failed commands via sys.exit
+        ok, error = False, f"exited with status {e.code}"
+    except Exception as e:
+        ok, error = False, f"{type(e).__name__}: {e}"
+    status = OK if ok else FAILED
+    return TaskResult(task.name, status, start, time.perf_counter() - origin, error)
+
+
+def run_tasks(tasks, max_workers=None):
+    """Runs tasks respecting dependencies, as concurrently as possible.
+
+    Returns:
+        {name: TaskResult} in the order the tasks were given.
+    """
+    by_name = validate(tasks)
+    results = {}
+    origin = time.perf_counter()
+    pending = list(tasks)
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(tasks))) as pool:
+        running = {}
+        while pending or running:
+            for task in list(pending):
+                statuses = [results[d].status if d in results else None for d in task.deps]
+                if any(s in (FAILED, SKIPPED) for s in statuses):
+                    blocked = [d for d in task.deps if results.get(d) and results[d].status != OK]
+                    now = time.perf_counter() - origin
+                    results[task.name] = TaskResult(
+                        task.name, SKIPPED, now, now, f"blocked by {', '.join(blocked)}"
+                    )
+                    pending.remove(task)
+                elif all(s == OK for s in statuses) and all(a in results for a in task.after):
+                    running[pool.submit(_run, task, origin)] = task
+                    pending.remove(task)
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                results[result.name] = result
+                del running[future]
+
+    return {name: results[name] for name in by_name}
+
+
+def critical_path(tasks, results):
+    """Returns the chain of task names that determined the total time.
+
+    Walks back from the task that finished last, each time through the
+    dependency that finished last (the one it was waiting on).
+    """
+    by_name = {t.name: t for t in tasks}
+    finished = [r for r in results.values() if r.status != SKIPPED]
+    if not finished:
+        return []
+    current = max(finished, key=lambda r: r.end).name
+    path = [current]
+    while True:
+        waited_on = by_name[current].deps + by_name[current].after
+        deps = [results[d] for d in waited_on if results[d].status != SKIPPED]
+        if not deps:
+            break
+        current = max(deps, key=lambda r: r.end).name
+        path.append(current)
+    return path[::-1]
+
+
+def print_summary(tasks, results):
+    """Prints each task's outcome and the critical path."""
+    if not results:
+        return
+    wall = max(r.end for r in results.values())
+    print(f"\n⏱  Post-render tasks ({wall:.1f}s wall)")
+    icons = {OK: "✔", FAILED: "❌", SKIPPED: "⏭ "}
+    for result in sorted(results.values(), key=lambda r: r.start):
+        detail = f"  {result.error}" if result.error else ""
+        print(
+            f"   {icons[result.status]} {result.name:<16} "
+            f"{result.start:>6.1f}s +{result.seconds:>5.1f}s{detail}"
+        )
+    path = critical_path(tasks, results)
+    if path:
+        chain = " → ".join(f"{name} {results[name].seconds:.1f}s" for name in path)
+        print(f"   Critical path: {chain}")
+
+
+def failed_required(tasks, results):
+    """Returns the names of required tasks that did not succeed."""
+    return [t.name for t in tasks if t.required and results[t.name].status != OK]
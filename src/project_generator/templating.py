@@ -0,0 +1,384 @@
+"""Jinja2 environment setup and build-time template compilation."""
+import functools
+import hashlib
+import json
+import os
+import py_compile
+import tempfile
+import zipfile
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    ModuleLoader,
+    PackageLoader,
+    PrefixLoader,
+    meta,
+    select_autoescape,
+)
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(PACKAGE_DIR, "templates")
+
+# Written next to the package by the build hook in setup.py
+COMPILED_ARCHIVE = os.path.join(PACKAGE_DIR, "_compiled_templates.zip")
+INDEX_FILE = os.path.join(PACKAGE_DIR, "_template_index.json")
+# Prebuilt output of templates without Jinja syntax, copied as-is
+STATIC_DIR = os.path.join(PACKAGE_DIR, "_static_templates")
+
+
+def get_override_dir():
+    """Returns the directory where users may override bundled templates."""
+    # Imported lazily so the build hook can load this module standalone
+    from . import config_manager
+
+    return config_manager.config_dir("templates")
+
+
+class PackLoader(PrefixLoader):
+    """Loads "<pack>:<name>" templates from the template packs.
+
+    Without an explicit mapping the pack registry is only read on the
+    first lookup of a pack template, so building an environment (or
+    importing the engine) never discovers or imports packs.
+    """
+
+    def __init__(self, packs=None):
+        super().__init__(None, delimiter=":")
+        if packs is not None:
+            self.mapping = {name: FileSystemLoader(path) for name, path in packs.items()}
+
+    @property
+    def mapping(self):
+        if self._mapping is None:
+            from . import packs as pack_registry
+            self._mapping = {
+                name: FileSystemLoader(path)
+                for name, path in pack_registry.template_dirs().items()
+            }
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, value):
+        self._mapping = value
+
+
+def create_environment(compiled_archive=None, override_dir=None, packs=None):
+    """Builds the template environment.
+
+    Bundled templates are loaded from the precompiled archive when the
+    package was built with one, so nothing is lexed or parsed at runtime.
+    Source templates are only compiled for user overrides, template packs
+    ("<pack>:<name>"), or when running from a source checkout without a
+    compiled archive.
+
+    Args:
+        compiled_archive: Path to a compiled template zip
+            (default: COMPILED_ARCHIVE if it exists; pass "" to force
+            source templates).
+        override_dir: Directory of user template overrides
+            (default: get_override_dir(); pass "" to disable).
+        packs: {pack name: template directory} (default: from the pack
+            registry, read on first use; pass {} to disable).
+    """
+    if override_dir is None:
+        override_dir = get_override_dir()
+    if compiled_archive is None and os.path.exists(COMPILED_ARCHIVE):
+        compiled_archive = COMPILED_ARCHIVE
+
+    loaders = []
+    if override_dir and os.path.isdir(override_dir):
+        loaders.append(FileSystemLoader(override_dir))
+    if packs is None or packs:
+        loaders.append(PackLoader(packs))
+    if compiled_archive:
+        loaders.append(ModuleLoader(compiled_archive))
+    else:
+        loaders.append(PackageLoader("project_generator", "templates"))
+
+    return Environment(
+        loader=loaders[0] if len(loaders) == 1 else ChoiceLoader(loaders),
+        autoescape=select_autoescape()
+    )
+
+
+def compile_templates(target, source_dir=SOURCE_DIR):
+    """Compiles every .j2 template under source_dir into a zip of modules.
+
+    Each template is stored as Python source plus unchecked hash-based
+    bytecode, so zipimport loads it without compiling anything. On an
+    interpreter with a different bytecode magic the .pyc is rejected and
+    zipimport falls back to the source module.
+
+    Raises on the first template that fails to compile so a broken
+    template fails the build instead of the user's scaffold.
+    """
+    env = Environment(
+        loader=FileSystemLoader(source_dir),
+        autoescape=select_autoescape()
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env.compile_templates(
+            tmpdir,
+            extensions=["j2"],
+            zip=None,
+            ignore_errors=False
+        )
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            for module in sorted(os.listdir(tmpdir)):
+                module_path = os.path.join(tmpdir, module)
+                py_compile.compile(
+                    module_path,
+                    cfile=module_path + "c",
+                    dfile=module,
+                    doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+                )
+                archive.write(module_path, module)
+                archive.write(module_path + "c", module + "c")
+    return target
+
+
+def build_index(source_dir=SOURCE_DIR):
+    """Indexes every .j2 template under source_dir.
+
+    Returns:
+        {template name: {"digest": ..., "includes": [...], "variables": [...]}},
+        where digest covers the template's source and everything it
+        includes/extends, so it changes whenever the rendered output
+        could, and variables lists the context variables it (or anything
+        it includes) reads; None when an include is dynamic. Templates
+        without any Jinja syntax are also marked "static", with the
+        content_hash of their (context-independent) output.
+    """
+    env = Environment(loader=FileSystemLoader(source_dir))
+    sources = {}
+    includes = {}
+    own_variables = {}
+    statics = {}
+    for name in env.list_templates(extensions=["j2"]):
+        source = env.loader.get_source(env, name)[0]
+        sources[name] = source
+        ast = env.parse(source)
+        refs = list(meta.find_referenced_templates(ast))
+        includes[name] = sorted(ref for ref in refs if ref)
+        own_variables[name] = (
+            None if None in refs else meta.find_undeclared_variables(ast)
+        )
+        static = _is_static(env, source)
+        if static:
+            statics[name] = hashlib.sha256(static_output(source)).hexdigest()
+
+    def digest(name, seen=()):
+        h = hashlib.sha256(sources.get(name, "").encode())
+        for ref in includes.get(name, []):
+            if ref not in seen:
+                h.update(digest(ref, seen + (name,)).encode())
+        return h.hexdigest()
+
+    def variables(name, seen=()):
+        found = own_variables.get(name, set())
+        if found is None:
+            return None
+        found = set(found)
+        for ref in includes.get(name, []):
+            if ref not in seen:
+                nested = variables(ref, seen + (name,))
+                if nested is None:
+                    return None
+                found |= nested
+        return found
+
+    index = {}
+    for name in sorted(sources):
+        found = variables(name)
+        index[name] = {
+            "digest": digest(name),
+            "includes": includes[name],
+            "variables": None if found is None else sorted(found),
+        }
+        if name in statics:
+            index[name].update(static=True, content_hash=statics[name])
+    return index
+
+
+def _is_static(env, source):
+    """True if rendering source cannot change it beyond stripping.
+
+    Jinja normalizes line endings, so sources with carriage returns are
+    left to the renderer.
+    """
+    return "\r" not in source and all(token == "data" for _, token, _ in env.lex(source))
+
+
+def static_output(source):
+    """Returns what the engine writes for a static template's source."""
+    return source.strip().encode("utf-8")
+
+
+def write_static(target_dir, source_dir=SOURCE_DIR):
+    """Writes the output of every static template under target_dir (build hook)."""
+    env = Environment(loader=FileSystemLoader(source_dir))
+    for name, entry in build_index(source_dir).items():
+        if not entry.get("static"):
+            continue
+        path = os.path.join(target_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(static_output(env.loader.get_source(env, name)[0]))
+    return target_dir
+
+
+def write_index(target, source_dir=SOURCE_DIR):
+    """Writes build_index() as JSON (used by the build hook)."""
+    with open(target, "w") as f:
+        json.dump(build_index(source_dir), f, indent=1, sort_keys=True)
+    return target
+
+
+@functools.lru_cache(maxsize=None)
+def bundled_index():
+    """Returns the template index, from the build or computed on first use."""
+    if os.path.exists(INDEX_FILE):
+        with open(INDEX_FILE) as f:
+            return json.load(f)
+    return build_index()
+
+
+def template_digest(name, override_dir=None):
+    """Returns a digest identifying the version of a template.
+
+    Bundled templates use the index. A user override or pack template is
+    identified by its own source plus the digests of everything it
+    includes/extends (resolved as the loader would: overrides, packs,
+    then bundled), so editing a partial changes the digest too. A custom
+    template with a dynamic include gets a fresh VOLATILE digest on every
+    call: it is always re-rendered and never cached. Returns None for
+    unknown templates.
+    """
+    if override_dir is None:
+        override_dir = get_override_dir()
+    return _digest(name, override_dir, ())
+
+
+# Prefix of digests that never match (templates with dynamic includes)
+VOLATILE = "volatile:"
+
+
+def is_volatile(digest):
+    """True for a digest that identifies no stable template version."""
+    return bool(digest) and digest.startswith(VOLATILE)
+
+
+def _digest(name, override_dir, seen):
+    """template_digest() for one template, skipping include cycles."""
+    custom = _custom_source(name, override_dir)
+    if custom is None:
+        if ":" in name:
+            return None
+        entry = bundled_index().get(name)
+        return entry["digest"] if entry else None
+
+    kind, source = custom
+    refs = _source_refs(source)
+    if refs is None:
+        return VOLATILE + os.urandom(16).hex()
+    h = hashlib.sha256(source)
+    for ref in refs:
+        if ref in seen or ref == name:
+            continue
+        nested = _digest(ref, override_dir, seen + (name,))
+        if is_volatile(nested):
+            return nested
+        h.update(f"\0{ref}\0{nested or 'missing'}".encode())
+    return f"{kind}:{h.hexdigest()}"
+
+
+def _custom_source(name, override_dir):
+    """Returns ("override"|"pack", source bytes) for a non-bundled template."""
+    path = None
+    kind = "override"
+    if override_dir and os.path.isfile(os.path.join(override_dir, name)):
+        path = os.path.join(override_dir, name)
+    elif ":" in name:
+        path, kind = _pack_template(name), "pack"
+    if path is None:
+        return None
+    with open(path, "rb") as f:
+        return kind, f.read()
+
+
+@functools.lru_cache(maxsize=256)
+def _source_refs(source):
+    """Returns the templates a source includes/extends, or None if dynamic."""
+    refs = list(meta.find_referenced_templates(Environment().parse(source.decode())))
+    if None in refs:
+        return None
+    return tuple(dict.fromkeys(refs))
+
+
+def _pack_template(name):
+    """Returns the file behind a template pack's "<pack>:<name>" template."""
+    from . import packs
+
+    return packs.template_path(name)
+
+
+def template_variables(name, override_dir=None):
+    """Returns the context variables a template reads, as a tuple.
+
+    Returns None when that cannot be determined statically (a dynamic
+    include, an override or pack template that includes other templates,
+    or an index built before variables were recorded): callers must then
+    assume the template depends on the whole context.
+    """
+    if override_dir is None:
+        override_dir = get_override_dir()
+    if override_dir:
+        path = os.path.join(override_dir, name)
+        if os.path.isfile(path):
+            with open(path) as f:
+                return _source_variables(f.read())
+    if ":" in name:
+        path = _pack_template(name)
+        if path is None:
+            return None
+        with open(path) as f:
+            return _source_variables(f.read())
+    entry = bundled_index().get(name) or {}
+    found = entry.get("variables")
+    return None if found is None else tuple(found)
+
+
+@functools.lru_cache(maxsize=256)
+def _source_variables(source):
+    """Finds the variables an override template reads."""
+    env = Environment()
+    ast = env.parse(source)
+    if any(True for _ in meta.find_referenced_templates(ast)):
+        return None
+    return tuple(sorted(meta.find_undeclared_variables(ast)))
+
+
+def static_source(name, override_dir=None, static_dir=None):
+    """Returns (path, content hash) of a static template's prebuilt output.
+
+    Returns None for templates that need rendering, are overridden by
+    the user, or when the package was not built with static outputs.
+    """
+    entry = bundled_index().get(name)
+    if not entry or not entry.get("static"):
+        return None
+    if override_dir is None:
+        override_dir = get_override_dir()
+    if override_dir and os.path.isfile(os.path.join(override_dir, name)):
+        return None
+    path = os.path.join(static_dir or STATIC_DIR, name)
+    return (path, entry["content_hash"]) if os.path.isfile(path) else None
+
+
+def missing_templates(names, override_dir=None):
+    """Returns the names that are neither bundled nor overridden."""
+    if override_dir is None:
+        override_dir = get_override_dir()
+    return [name for name in names if template_digest(name, override_dir) is None]
@@ -0,0 +1,166 @@
+"""Lightweight span recording for `--timings` and `--trace`.
+
+Code wraps phases and sub-steps in `span()`; nothing is recorded (and a
+span costs one global lookup) unless recording was enabled. Recorded
+spans can be summarised as a table or exported in Chrome's trace-event
+format, which chrome://tracing and https://ui.perfetto.dev load directly.
+Spans are kept per process, so batch workers are not included.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+# Recorded spans while enabled, None otherwise
+_events = None
+_origin = 0.0
+
+_DISABLED = contextlib.nullcontext()
+
+
+def enable():
+    """Starts recording spans, discarding any previous ones."""
+    global _events, _origin
+    _events = []
+    _origin = time.perf_counter()
+
+
+def disable():
+    """Stops recording and returns the recorded spans."""
+    global _events
+    events, _events = _events or [], None
+    return events
+
+
+def is_enabled():
+    """Returns True while spans are being recorded."""
+    return _events is not None
+
+
+def span(name, category="phase", **args):
+    """Context manager timing a block as a named span.
+
+    Args:
+        name: What ran, e.g. a phase, template or command line.
+        category: Groups spans in the summary ("phase", "render",
+            "write", "subprocess", ...).
+        **args: Extra details stored on the trace event.
+    """
+    if _events is None:
+        return _DISABLED
+    return _record(name, category, args)
+
+
+@contextlib.contextmanager
+def _record(name, category, args):
+    events = _events
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        events.append({
+            "name": name,
+            "cat": category,
+            "start": start - _origin,
+            "dur": time.perf_counter() - start,
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+
+def summarize(events):
+    """Aggregates spans by (category, name), slowest total first.
+
+    Returns:
+        A list of (category, name, count, total seconds, max seconds).
+    """
+    rows = {}
+    for event in events:
+        key = (event["cat"], event["name"])
+        count, total, longest = rows.get(key, (0, 0.0, 0.0))
+        rows[key] = (count + 1, total + event["dur"], max(longest, event["dur"]))
+    return sorted(
+        ((cat, name, *stats) for (cat, name), stats in rows.items()),
+        key=lambda row: row[3],
+        reverse=True
+    )
+
+
+def print_summary(events, limit=25):
+    """Prints per-category totals and the slowest spans.
+
+    Phases nest, so only the other (leaf) categories get a total; those
+    are summed across threads and can exceed the wall time.
+    """
+    if not events:
+        return
+    totals = {}
+    for event in events:
+        if event["cat"] != "phase":
+            totals[event["cat"]] = totals.get(event["cat"], 0.0) + event["dur"]
+    wall = max(e["start"] + e["dur"] for e in events) - min(e["start"] for e in events)
+
+    print(f"\n⏱  Timings ({len(events)} spans, {wall * 1000:.1f}ms wall)")
+    print("   " + " | ".join(f"{cat} {total * 1000:.1f}ms" for cat, total in totals.items()))
+    rows = summarize(events)
+    width = min(60, max(len(row[1]) for row in rows))
+    print(f"   {'category':<10} {'span':<{width}} {'count':>6} {'total':>10} {'max':>10}")
+    for cat, name, count, total, longest in rows[:limit]:
+        print(
+            f"   {cat:<10} {name[:width]:<{width}} {count:>6} "
+            f"{total * 1000:>8.1f}ms {longest * 1000:>8.1f}ms"
+        )
+    if len(rows) > limit:
+        print(f"   ... {len(rows) - limit} more")
+
+
+def trace_events(events):
+    """Converts spans to Chrome trace-event "complete" (X) events."""
+    pid = os.getpid()
+    return [
+        {
+            "name": event["name"],
+            "cat": event["cat"],
+            "ph": "X",
+            "ts": round(event["start"] * 1e6, 3),
+            "dur": round(event["dur"] * 1e6, 3),
+            "pid": pid,
+            "tid": event["tid"],
+            "args": event["args"],
+        }
+        for event in events
+    ]
+
+
+def write_trace(events, path):
+    """Writes spans to path as a Chrome trace file."""
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace_events(events), "displayTimeUnit": "ms"}, f)
+
+
+@contextlib.contextmanager
+def recording(summary=False, trace=None):
+    """Records spans for the duration of the block, then reports them.
+
+    Args:
+        summary: Print the timing table when the block exits.
+        trace: Write a Chrome trace file to this path when the block exits.
+
+    The report is produced even if the block exits with an error.
+    """
+    if not summary and not trace:
+        yield
+        return
+
+    enable()
+    try:
+        with span("total"):
+            yield
+    finally:
+        events = disable()
+        if summary:
+            print_summary(events)
+        if trace:
+            write_trace(events, trace)
+            print(f"   Trace written to {trace}")
@@ -0,0 +1,151 @@
+"""Local cache of pre-built virtualenvs that new projects are cloned from.
+
+Entries are keyed by the interpreter and the exact requirements file
+contents (which already encode the profile and package manager), so two
+projects with the same dependencies share one pip run. Cloning hardlinks
+everything except the few files that embed the venv's absolute path.
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import uuid
+
+from . import timing
+
+# Records the path an entry was built at, so clones can rewrite it
+MARKER = "forge-venv.json"
+
+# Bump to invalidate every cached venv after a layout change
+CACHE_VERSION = 1
+
+
+def get_cache_dir():
+    """Returns the directory holding cached virtualenvs."""
+    from . import config_manager
+
+    return config_manager.cache_dir("venvs")
+
+
+def is_enabled():
+    """Returns False if the user disabled the cache (`venv_cache = false`)."""
+    from . import config_manager
+
+    return config_manager.get_flag("venv_cache")
+
+
+def interpreter_id(python="python3"):
+    """Identifies the interpreter venvs are created with."""
+    executable = shutil.which(python)
+    if not executable:
+        return None
+    with timing.span(f"{python} --version", "subprocess"):
+        proc = subprocess.run(
+            [executable, "-c", "import sys; print(sys.version)"],
+            capture_output=True,
+            text=True
+        )
+    return f"{os.path.realpath(executable)}\n{proc.stdout.strip()}"
+
+
+def cache_key(requirement_files, python="python3"):
+    """Hashes the interpreter and requirements into a cache entry name."""
+    interpreter = interpreter_id(python)
+    if interpreter is None:
+        return None
+
+    digest = hashlib.sha256(f"v{CACHE_VERSION}\n{interpreter}\n".encode())
+    for path in requirement_files:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()[:24]
+
+
+def lookup(key):
+    """Returns the cached venv path for key, or None on a miss."""
+    path = os.path.join(get_cache_dir(), key)
+    return path if os.path.exists(os.path.join(path, MARKER)) else None
+
+
+def new_build_path(key):
+    """Returns a unique scratch path to build a cache entry in."""
+    os.makedirs(get_cache_dir(), exist_ok=True)
+    return os.path.join(get_cache_dir(), f".build-{key}-{uuid.uuid4().hex[:8]}")
+
+
+def store(build_path, key):
+    """Publishes a freshly built venv as the entry for key.
+
+    Concurrent builders race on the final rename; the loser discards its
+    copy and uses the winner's.
+    """
+    with open(os.path.join(build_path, MARKER), "w") as f:
+        json.dump({"prefix": build_path, "key": key}, f)
+
+    final_path = os.path.join(get_cache_dir(), key)
+    try:
+        os.rename(build_path, final_path)
+    except OSError:
+        shutil.rmtree(build_path, ignore_errors=True)
+    return final_path
+
+
+def clone(source, target):
+    """Clones a cached venv into target and fixes up its absolute paths.
+
+    Regular files are hardlinked (falling back to a copy across devices);
+    scripts in bin/ and pyvenv.cfg that mention the build path are
+    rewritten as new files so the cache entry is never modified.
+    """
+    prefix = source
+    marker = os.path.join(source, MARKER)
+    if os.path.exists(marker):
+        with open(marker) as f:
+            prefix = json.load(f)["prefix"]
+    old, new = prefix.encode(), os.path.abspath(target).encode()
+
+    for root, dirs, files in os.walk(source):
+        rel = os.path.relpath(root, source)
+        dest_root = os.path.normpath(os.path.join(target, rel))
+        os.makedirs(dest_root, exist_ok=True)
+
+        for name in list(dirs):
+            src = os.path.join(root, name)
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), os.path.join(dest_root, name))
+                dirs.remove(name)
+
+        for name in files:
+            if rel == "." and name == MARKER:
+                continue
+            src = os.path.join(root, name)
+            dest = os.path.join(dest_root, name)
+            if os.path.islink(src):
+                os.symlink(os.readlink(src), dest)
+            elif rel == "bin" or (rel == "." and name == "pyvenv.cfg"):
+                _copy_rewritten(src, dest, old, new)
+            else:
+                _link_or_copy(src, dest)
+
+
+def _copy_rewritten(src, dest, old, new):
+    """Copies src to dest, replacing old with new if present."""
+    with open(src, "rb") as f:
+        data = f.read()
+    if old not in data:
+        _link_or_copy(src, dest)
+        return
+    with open(dest, "wb") as f:
+        f.write(data.replace(old, new))
+    shutil.copymode(src, dest)
+
+
+def _link_or_copy(src, dest):
+    """Hardlinks src to dest, copying when linking is not possible."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
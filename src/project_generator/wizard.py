@@ -8,17 +8,39 @@ from . import config_manager
 
 class Wizard:
     """Handles interactive user prompts for project configuration."""
-    def __init__(self, console=None):
+    def __init__(self, console=None, speculator=None):
         self.console = console or Console()
         self.defaults = {}
+        self.speculator = speculator
+        self.answers = {}
+        self.guesses = {}
+
+    def record(self, key, value):
+        """Stores an answer and lets the speculator start what it allows.
+
+        An aborted prompt (None) is not recorded, so nothing is speculated
+        on the strength of it.
+        """
+        if value is None:
+            return value
+        self.answers[key] = value
+        if self.speculator is not None:
+            self.speculator.update(self.answers, self.guesses)
+        return value
 
     def fetch_defaults(self):
         """Loads default settings from config manager."""
+        settings = config_manager.get_settings({
+            "author_name": "User",
+            "python_version": "3.10",
+            "package_manager": "pip",
+            "license": "MIT",
+        })
         self.defaults = {
-            "author": config_manager.get_setting("author_name", "User"),
-            "python": config_manager.get_setting("python_version", "3.10"),
-            "manager": config_manager.get_setting("package_manager", "pip"),
-            "license": config_manager.get_setting("license", "MIT")
+            "author": settings["author_name"],
+            "python": settings["python_version"],
+            "manager": settings["package_manager"],
+            "license": settings["license"]
         }
 
     def ask_project_name(self, current_name):
@@ -43,7 +65,7 @@ class Wizard:
 
         profile_choices = []
         for p in profiles:
-            desc = configs.get_profile(p).get("description", "")
+            desc = configs.describe_profile(p)
             profile_choices.append(questionary.Choice(
                 title=f"{p}: {desc}",
                 value=p
@@ -103,42 +125,54 @@ class Wizard:
         """Main entry point for the wizard."""
         self.console.print(Panel.fit("🧙 Forge Project Wizard", style="bold blue"))
         self.fetch_defaults()
+        # Stand-ins for unanswered questions while speculating
+        self.guesses = {
+            "__PROFILE__": default_profile or "fullstack",
+            "__PYTHON_VERSION__": self.defaults["python"],
+            "__PACKAGE_MANAGER__": self.defaults["manager"],
+            "__LICENSE__": self.defaults["license"],
+        }
+        self.answers = {}
+        if self.speculator is not None:
+            self.speculator.update(self.answers, self.guesses)
 
         # 1. Project Name
         default_name = os.path.basename(os.getcwd())
-        project_name = self.ask_project_name(default_name)
+        project_name = self.record("__PROJECT_NAME__", self.ask_project_name(default_name))
 
         # 2. Author
-        author_name = self.ask_author()
+        author_name = self.record("__AUTHOR_NAME__", self.ask_author())
 
         # 3. Profile
-        profile_type = self.ask_profile(default_profile)
+        profile_type = self.record("__PROFILE__", self.ask_profile(default_profile))
 
         # 3b. AI Persona
-        ai_persona = self.ask_ai_persona()
+        ai_persona = self.record("__AI_PERSONA__", self.ask_ai_persona())
 
         # 3c. Project Description
-        project_description = self.ask_project_description(ai_persona)
+        project_description = self.record(
+            "__PROJECT_DESCRIPTION__", self.ask_project_description(ai_persona)
+        )
 
         # 4. Tech Stack (Simplified for now, assuming standard defaults per profile)
         # But we still let user choose Python/Manager/License universally
-        python_version = questionary.select(
+        python_version = self.record("__PYTHON_VERSION__", questionary.select(
             "Python Version:",
             choices=["3.10", "3.11"],
             default=self.defaults["python"]
-        ).ask()
+        ).ask())
 
-        package_manager = questionary.select(
+        package_manager = self.record("__PACKAGE_MANAGER__", questionary.select(
             "Which package manager to use?",
             choices=["pip", "poetry", "uv"],
             default=self.defaults["manager"]
-        ).ask()
+        ).ask())
 
-        license_type = questionary.select(
+        license_type = self.record("__LICENSE__", questionary.select(
             "Choose a License:",
             choices=["MIT", "Apache 2.0", "Proprietary", "None"],
             default=self.defaults["license"]
-        ).ask()
+        ).ask())
 
         # Summary
         self.console.print("[green]Configuration captured![/green]")
@@ -157,7 +191,7 @@ class Wizard:
         }
 
 
-def run_wizard(default_profile=None):
+def run_wizard(default_profile=None, speculator=None):
     """Legacy entry point wrapper."""
-    wizard = Wizard()
+    wizard = Wizard(speculator=speculator)
     return wizard.run(default_profile)
@@ -0,0 +1,83 @@
+import io
+import os
+import sys
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import archive, engine  # noqa: E402
+
+CONTEXT = {"__PROJECT_NAME__": "packed", "__PROFILE__": "system"}
+
+
+class _Unseekable(io.RawIOBase):
+    """A write-only stream like a pipe."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+class TestArchive(unittest.TestCase):
+    def test_tar_gz_is_deterministic(self):
+        """Test identical inputs produce identical bytes matching render_tree."""
+        first, second = io.BytesIO(), io.BytesIO()
+        count = archive.write_archive(first, CONTEXT)
+        archive.write_archive(second, dict(CONTEXT))
+        assert first.getvalue() == second.getvalue()
+
+        tree = engine.render_tree(CONTEXT)
+        with tarfile.open(fileobj=io.BytesIO(first.getvalue()), mode="r:gz") as tar:
+            members = tar.getmembers()
+            names = [m.name for m in members]
+            assert names[-1] == ".forge/manifest.json"
+            assert names[:-1] == sorted(names[:-1])
+            assert {m.mtime for m in members} == {archive.ARCHIVE_MTIME}
+            for member in members:
+                if member.isfile() and member.name in tree:
+                    assert tar.extractfile(member).read() == tree[member.name][0]
+        assert count == sum(data is not None for data, _ in tree.values()) + 1
+
+    def test_zip_to_unseekable_stream(self):
+        """Test zips stream to pipes and can be rooted in a directory."""
+        out = _Unseekable()
+        archive.write_archive(out, CONTEXT, fmt="zip", root="packed")
+        with zipfile.ZipFile(io.BytesIO(bytes(out.data))) as zf:
+            names = zf.namelist()
+            assert "packed/README.md" in names
+            assert all(name.startswith("packed/") for name in names)
+            assert zf.read("packed/README.md") == engine.render_tree(CONTEXT)["README.md"][0]
+
+    def test_root_cannot_escape(self):
+        """Test roots that would extract outside the target directory are rejected."""
+        for root in ["../../evil", "a/b", "a\\b", "..", "/abs", "a\0b"]:
+            with self.assertRaises(ValueError):
+                archive.write_archive(io.BytesIO(), CONTEXT, root=root)
+
+    def test_extracted_archive_updates_cleanly(self):
+        """Test the bundled manifest makes --update a no-op after extraction."""
+        buf = io.BytesIO()
+        archive.write_archive(buf, CONTEXT)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with tarfile.open(fileobj=io.BytesIO(buf.getvalue()), mode="r:gz") as tar:
+                tar.extractall(tmpdir)
+            with redirect_stdout(io.StringIO()):
+                report = engine.create_structure(
+                    tmpdir, update=True, workers=1, setup_venv=False
+                )
+            assert {r.status for r in report} == {engine.UNCHANGED}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import batch, cli  # noqa: E402
+
+TOML_MANIFEST = """
+[defaults]
+author = "Platform Team"
+profile = "web"
+
+[[project]]
+target = "billing"
+
+[[project]]
+target = "infra"
+profile = "system"
+persona = "architect"
+"""
+
+
+class TestBatch(unittest.TestCase):
+    def test_load_manifest_toml(self):
+        """Test defaults are merged and targets resolved against the manifest."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = os.path.join(tmpdirname, "manifest.toml")
+            with open(path, "w") as f:
+                f.write(TOML_MANIFEST)
+
+            projects = batch.load_manifest(path)
+
+            assert [p["target"] for p in projects] == [
+                os.path.join(tmpdirname, "billing"),
+                os.path.join(tmpdirname, "infra"),
+            ]
+            assert projects[0]["profile"] == "web"
+            assert projects[1]["profile"] == "system"
+            context = batch.build_context(projects[1])
+            assert context["__AUTHOR_NAME__"] == "Platform Team"
+            assert context["__PROJECT_NAME__"] == "infra"
+            assert context["__AI_PERSONA__"] == "architect"
+
+    def test_load_manifest_jsonl_rejects_unknown_keys(self):
+        """Test JSONL manifests are validated per line."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = os.path.join(tmpdirname, "manifest.jsonl")
+            with open(path, "w") as f:
+                f.write('{"target": "a", "manager": "uv"}\n\n{"target": "b", "colour": "red"}\n')
+
+            with self.assertRaises(ValueError):
+                batch.load_manifest(path)
+
+    def test_load_manifest_rejects_bad_entries(self):
+        """Test non-object lines and duplicate targets are errors naming the line."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = os.path.join(tmpdirname, "manifest.jsonl")
+            for lines, expected in [
+                ('{"target": "a"}\n[1]\n', "line 2 is not an object"),
+                ('"x"\n', "line 1 is not an object"),
+                ('{"target": "a"}\n{"target": "./b/../a"}\n', "line 2 has the same target as line 1"),
+                ('{"target": "a"}\n{oops\n', "line 2: "),
+            ]:
+                with open(path, "w") as f:
+                    f.write(lines)
+                with self.assertRaises(ValueError) as ctx:
+                    batch.load_manifest(path)
+                assert expected in str(ctx.exception), (lines, ctx.exception)
+
+            with patch("project_generator.batch.run_batch") as mock_run, \
+                    redirect_stdout(io.StringIO()) as out, self.assertRaises(SystemExit):
+                batch.main([path])
+            mock_run.assert_not_called()
+            assert "Error reading manifest" in out.getvalue()
+
+    def test_run_batch_inline(self):
+        """Test projects are scaffolded and failures reported per project."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            occupied = os.path.join(tmpdirname, "occupied")
+            os.makedirs(occupied)
+            with open(os.path.join(occupied, "keep.txt"), "w") as f:
+                f.write("data")
+
+            projects = [
+                {"target": os.path.join(tmpdirname, "svc"), "profile": "mvc", "name": "svc"},
+                {"target": occupied, "name": "occupied"},
+            ]
+            results = batch.run_batch(projects, jobs=1, init_git=False, setup_venv=False)
+
+            ok, failed = results
+            assert ok.ok and ok.files > 0
+            assert os.path.exists(os.path.join(tmpdirname, "svc/src/app/controllers"))
+            assert not failed.ok
+            assert "not empty" in failed.error
+
+    @patch("project_generator.batch.run_batch")
+    def test_cli_dispatches_batch(self, mock_run):
+        """Test `forge-project batch` is routed to the batch module."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = os.path.join(tmpdirname, "manifest.toml")
+            with open(path, "w") as f:
+                f.write(TOML_MANIFEST)
+            mock_run.return_value = []
+
+            cli.main(["batch", path, "--jobs", "2", "--no-git"])
+
+            args, kwargs = mock_run.call_args
+            assert len(args[0]) == 2
+            assert kwargs == {"jobs": 2, "init_git": False, "setup_venv": True}
+
+
+if __name__ == "__main__":
+    unittest.main()
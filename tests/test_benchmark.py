@@ -0,0 +1,47 @@
+import importlib.util
+import os
+import sys
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "benchmark.py")
+
+
+def load_benchmark():
+    """Imports scripts/benchmark.py as a module."""
+    spec = importlib.util.spec_from_file_location("forge_benchmark", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.benchmark = load_benchmark()
+
+    def test_run_suite(self):
+        """Test one profile produces cold/warm entries with timings."""
+        results = self.benchmark.run_suite(repeat=1, profiles=["system"])
+        for name in ("scaffold/system/cold", "scaffold/system/warm", "render/system/warm",
+                     "config/roundtrip"):
+            assert results[name]["samples"] == 1
+            assert results[name]["median_ms"] > 0
+
+    def test_compare(self):
+        """Test only fastest samples slower than the threshold are regressions."""
+        baseline = {
+            "a": {"min_ms": 10.0}, "b": {"min_ms": 10.0}, "tiny": {"min_ms": 0.5},
+        }
+        results = {
+            "a": {"min_ms": 14.0},
+            "b": {"min_ms": 16.0},
+            "tiny": {"min_ms": 5.0},
+            "new": {"min_ms": 99.0},
+        }
+        assert self.benchmark.compare(results, baseline, 0.5) == [("b", 10.0, 16.0)]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,7 +29,14 @@ class TestCLI(unittest.TestCase):
                 update=False,
                 manager=None,
                 config_list=False,
-                config_set=None
+                config_set=None,
+                dry_run=False,
+                output_archive=None,
+                warm_hooks=None,
+                durable=False,
+                link_static=False,
+                timings=False,
+                trace=None
             )
         ):
             cli.main()
@@ -41,8 +48,27 @@ class TestCLI(unittest.TestCase):
         args, kwargs = mock_engine.create_structure.call_args
         assert args[0] == "/tmp/test"
         assert kwargs["update"] is False
+        assert kwargs["setup_venv"] is False
 
-        mock_git.init_git.assert_called_with("/tmp/test")
+        # Git and hooks run as post-render tasks
+        mock_git.init_repo.assert_called_with("/tmp/test")
+        mock_engine.baseline_files.assert_called_with(
+            "/tmp/test", mock_engine.create_structure.return_value
+        )
+        mock_git.commit_baseline.assert_called_with(
+            "/tmp/test", mock_engine.baseline_files.return_value
+        )
+        mock_git.install_hooks.assert_called_with("/tmp/test")
+        mock_git.warm_hooks.assert_not_called()
+
+    def test_profile_accepts_pack_profiles(self):
+        """Test --profile takes template pack profiles and rejects unknown ones."""
+        profiles = ["fullstack", "web", "system", "mvc", "data-platform"]
+        with patch('project_generator.assets.configs.list_profiles', return_value=profiles):
+            args = cli.build_parser().parse_args(["--profile", "data-platform"])
+            assert args.profile == "data-platform"
+            with patch('sys.stderr'), self.assertRaises(SystemExit):
+                cli.build_parser().parse_args(["--profile", "nope"])
 
 
 if __name__ == '__main__':
@@ -2,6 +2,11 @@ import unittest
 from unittest.mock import patch, mock_open
 import sys
 import os
+import tempfile
+from pathlib import Path
+
+import tomli
+import tomli_w
 
 # Add src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
@@ -11,7 +16,7 @@ from project_generator import config_manager  # noqa: E402
 
 class TestConfigManager(unittest.TestCase):
     @patch('project_generator.config_manager.get_config_path')
-    @patch('project_generator.config_manager.tomli.load')
+    @patch('tomli.load')
     @patch('builtins.open', new_callable=mock_open)
     def test_get_setting(self, mock_file, mock_toml, mock_path):
         mock_path.return_value.exists.return_value = True
@@ -21,7 +26,7 @@ class TestConfigManager(unittest.TestCase):
         assert val == "Test User"
 
     @patch('project_generator.config_manager.get_config_path')
-    @patch('project_generator.config_manager.tomli_w.dump')
+    @patch('tomli_w.dump')
     @patch('builtins.open', new_callable=mock_open)
     def test_set_setting(self, mock_file, mock_dump, mock_path):
         mock_path.return_value.exists.return_value = False  # New file
@@ -34,5 +39,91 @@ class TestConfigManager(unittest.TestCase):
         assert args[0] == {"license": "MIT"}
 
 
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "forge" / "config.toml"
+        patcher = patch(
+            'project_generator.config_manager.get_config_path', return_value=self.path
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_bulk_set_writes_once(self):
+        """Test set_settings does one atomic write and leaves no temp file."""
+        with patch('tomli_w.dump', wraps=tomli_w.dump) as mock_dump:
+            config_manager.set_settings({"author_name": "Ada", "license": "MIT"})
+        assert mock_dump.call_count == 1
+        assert os.listdir(self.path.parent) == ["config.toml"]
+        assert config_manager.get_settings({"author_name": "x", "missing": 1}) == {
+            "author_name": "Ada", "missing": 1
+        }
+
+    def test_concurrent_saves_from_threads(self):
+        """Test threads saving at once never share (and lose) a temp file."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def save(n):
+            for i in range(20):
+                config_manager.save_config({"writer": n, "round": i})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(save, range(8)))
+        assert os.listdir(self.path.parent) == ["config.toml"]
+        with open(self.path, "rb") as f:
+            assert tomli.load(f)["round"] == 19
+
+    def test_cache_invalidated_by_mtime(self):
+        """Test repeated reads parse once until the file changes."""
+        config_manager.set_settings({"author_name": "Ada"})
+        with patch('tomli.load', wraps=tomli.load) as mock_load:
+            for _ in range(4):
+                assert config_manager.get_setting("author_name") == "Ada"
+            assert mock_load.call_count == 0
+
+            # Another process edits the file
+            self.path.write_text('author_name = "Grace"\n')
+            os.utime(self.path, ns=(0, 1))
+            assert config_manager.get_setting("author_name") == "Grace"
+            assert mock_load.call_count == 1
+
+        # Callers get copies, not the cached dict
+        config_manager.load_config()["author_name"] = "changed"
+        assert config_manager.get_setting("author_name") == "Grace"
+
+
+class TestUserDirs(unittest.TestCase):
+    def test_matches_platformdirs(self):
+        """Test the XDG shortcut finds the same directories as platformdirs."""
+        import platformdirs
+
+        for env in ({}, {"XDG_CONFIG_HOME": "/x/conf", "XDG_CACHE_HOME": "/x/cache"},
+                    {"XDG_CONFIG_HOME": " ", "XDG_CACHE_HOME": ""}):
+            with patch.dict(os.environ, env):
+                for kind in ("config", "cache"):
+                    expected = getattr(platformdirs, f"user_{kind}_dir")(
+                        config_manager.APP_NAME, config_manager.APP_AUTHOR
+                    )
+                    assert config_manager._user_dir(kind) == expected, (env, kind)
+
+
+class TestHelpers(unittest.TestCase):
+    @patch('project_generator.config_manager.load_config')
+    def test_get_flag(self, mock_load):
+        """Test on/off settings accept TOML booleans and common strings."""
+        mock_load.return_value = {"a": False, "b": "off", "c": "0", "d": "yes", "e": True}
+        assert [config_manager.get_flag(k) for k in "abcde"] == [False, False, False, True, True]
+        assert config_manager.get_flag("missing") is True
+        assert config_manager.get_flag("missing", False) is False
+
+    @unittest.skipIf(sys.platform in ("win32", "darwin"), "XDG platforms only")
+    def test_dirs(self):
+        """Test named directories live under Forge's config and cache directories."""
+        with patch.dict(os.environ, {"XDG_CONFIG_HOME": "/x/conf", "XDG_CACHE_HOME": "/x/cache"}):
+            assert config_manager.config_dir("packs") == "/x/conf/forge/packs"
+            assert config_manager.cache_dir("venvs") == "/x/cache/forge/venvs"
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,58 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import doctor, engine, plan  # noqa: E402
+from project_generator.assets import configs  # noqa: E402
+
+BROKEN = {
+    "structure": [],
+    "files": {"README.md": "README.md.j2", "missing.txt": "does/not/exist.j2"},
+}
+
+
+class TestDoctor(unittest.TestCase):
+    def setUp(self):
+        self.override_patcher = patch(
+            "project_generator.templating.get_override_dir", return_value=""
+        )
+        self.override_patcher.start()
+
+    def tearDown(self):
+        self.override_patcher.stop()
+        plan.get_plan.cache_clear()
+
+    def test_bundled_profiles_pass(self):
+        """Test every shipped profile/manager resolves and renders."""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            doctor.main([])
+        assert "12 profile/manager combinations OK" in out.getvalue()
+
+    def test_missing_template_reported(self):
+        """Test a missing template is reported for every manager."""
+        with patch.dict(configs.PROFILES, {"broken": BROKEN}):
+            errors = doctor.check_plans(["broken"], "")
+        assert len(errors) == len(configs.PACKAGE_MANAGERS)
+        assert "'does/not/exist.j2' does not exist" in errors[0]
+
+    def test_create_structure_fails_before_writing(self):
+        """Test a scaffold with a missing template writes nothing."""
+        with patch.dict(configs.PROFILES, {"broken": BROKEN}), \
+                tempfile.TemporaryDirectory() as tmpdir, redirect_stdout(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                engine.create_structure(
+                    tmpdir, context={"__PROFILE__": "broken"}, setup_venv=False
+                )
+            assert os.listdir(tmpdir) == []
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,15 @@
+import io
 import os
 import tempfile
 import sys
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
-from project_generator import engine  # noqa: E402
+from project_generator import engine, templating  # noqa: E402
 
 
 class TestEngine(unittest.TestCase):
@@ -32,6 +34,20 @@ class TestEngine(unittest.TestCase):
             # Should not raise
             engine.check_greenfield(tmpdirname)
 
+    def test_check_greenfield_removes_stale_staging(self):
+        """Test staging left by an interrupted run does not block a new scaffold."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            stale = os.path.join(tmpdirname, engine.STAGING_DIR, "123-abc")
+            os.makedirs(stale)
+            open(os.path.join(stale, "README.md"), "w").close()
+            engine.check_greenfield(tmpdirname)
+            assert os.listdir(tmpdirname) == []
+
+            os.makedirs(os.path.join(tmpdirname, engine.STAGING_DIR))
+            open(os.path.join(tmpdirname, ".forge", "manifest.json"), "w").close()
+            with self.assertRaises(SystemExit), redirect_stdout(io.StringIO()):
+                engine.check_greenfield(tmpdirname)
+
     def test_check_greenfield_invalid(self):
         """Test greenfield check fails on non-empty dir."""
         with tempfile.TemporaryDirectory() as tmpdirname:
@@ -179,6 +195,103 @@ class TestEngine(unittest.TestCase):
                 content = f.read()
                 assert "[tool.poetry]" in content
 
+    def test_create_structure_report(self):
+        """Test the per-file report matches serial and concurrent runs."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            report = engine.create_structure(tmpdirname, workers=4)
+            assert report
+            assert {r.status for r in report} <= {engine.CREATED, engine.ERROR}
+            readme = next(r for r in report if r.path == "README.md")
+            assert readme.status == engine.CREATED
+
+            # Update without force leaves everything that was written alone
+            again = engine.create_structure(tmpdirname, update=True, workers=1)
+            assert [r.path for r in again] == [r.path for r in report]
+            assert {r.status for r in again} == {engine.UNCHANGED}
+
+            # Locally modified files are skipped unless forced
+            with open(os.path.join(tmpdirname, "README.md"), "w") as f:
+                f.write("# Mine")
+            skipped = engine.create_structure(tmpdirname, update=True)
+            assert next(r for r in skipped if r.path == "README.md").status == engine.SKIPPED
+            forced = engine.create_structure(tmpdirname, update=True, force=True)
+            assert next(r for r in forced if r.path == "README.md").status == engine.UPDATED
+
+    def test_create_structure_staged_writes(self):
+        """Test files are moved into place from staging, keeping modes."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            engine.create_structure(tmpdirname, workers=1)
+            assert not os.path.exists(os.path.join(tmpdirname, engine.STAGING_DIR))
+
+            readme = os.path.join(tmpdirname, "README.md")
+            os.chmod(readme, 0o600)
+            with open(readme, "w") as f:
+                f.write("# Mine")
+            with patch("project_generator.engine.os.fsync") as mock_fsync:
+                report = engine.create_structure(
+                    tmpdirname, update=True, force=True, durable=True
+                )
+            assert next(r for r in report if r.path == "README.md").status == engine.UPDATED
+            # Every written file once, then each directory they landed in once
+            written = [r.path for r in report if r.status in (engine.CREATED, engine.UPDATED)]
+            directories = {os.path.dirname(os.path.join(tmpdirname, p)) for p in written}
+            assert mock_fsync.call_count == len(written) + len(directories)
+            assert os.stat(readme).st_mode & 0o777 == 0o600
+            assert not os.path.exists(os.path.join(tmpdirname, engine.STAGING_DIR))
+
+            # A failed render leaves the existing file untouched
+            with open(readme, "w") as f:
+                f.write("# Mine again")
+            with patch("project_generator.engine.render_file", side_effect=OSError("boom")):
+                report = engine.create_structure(tmpdirname, update=True, force=True)
+            assert next(r for r in report if r.path == "README.md").status == engine.ERROR
+            with open(readme) as f:
+                assert f.read() == "# Mine again"
+
+    def test_create_structure_static_fast_path(self):
+        """Test static templates are copied (or linked) instead of rendered."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            static_dir = os.path.join(tmpdirname, "static")
+            templating.write_static(static_dir)
+            project = os.path.join(tmpdirname, "project")
+            expected = engine.render_tree({})
+
+            with patch("project_generator.templating.STATIC_DIR", static_dir), \
+                    patch("project_generator.engine.render_file", wraps=engine.render_file) as render:
+                report = engine.create_structure(project, link_static=True)
+            rendered = {c.args[0] for c in render.call_args_list}
+            assert "ansible/ansible.cfg.j2" not in rendered
+            assert "README.md.j2" in rendered
+
+            for result in report:
+                with open(os.path.join(project, result.path), "rb") as f:
+                    assert f.read() == expected[result.path][0], result.path
+            cfg = os.path.join(project, "ansible", "ansible.cfg")
+            assert os.stat(cfg).st_ino == os.stat(os.path.join(static_dir, "ansible/ansible.cfg.j2")).st_ino
+
+            # Manifest hashes of copied files match their content
+            again = engine.create_structure(project, update=True)
+            assert {r.status for r in again} == {engine.UNCHANGED}
+
+    def test_render_tree_matches_disk(self):
+        """Test the in-memory tree is exactly what create_structure writes."""
+        context = {"__PROJECT_NAME__": "dry", "__PACKAGE_MANAGER__": "uv"}
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            tree = engine.render_tree(context)
+            assert os.listdir(tmpdirname) == []
+
+            engine.create_structure(tmpdirname, context=context, workers=1)
+            for path, (data, mode) in tree.items():
+                full_path = os.path.join(tmpdirname, path)
+                if data is None:
+                    assert mode == engine.DIR_MODE
+                    assert os.path.isdir(full_path), path
+                else:
+                    with open(full_path, "rb") as f:
+                        assert f.read() == data, path
+            assert "requirements.txt" not in tree
+            assert tree[".python-version"][0] == b"3.10"
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,187 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from concurrent.futures import Future
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, fleet, templating  # noqa: E402
+
+
+class TestFleet(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "repos")
+        self.overrides = os.path.join(self.tmp.name, "overrides")
+        os.makedirs(self.overrides)
+        patcher = patch(
+            "project_generator.templating.get_override_dir", return_value=self.overrides
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # The engine's loader reads overrides from the directory it was built with
+        patcher = patch(
+            "project_generator.engine.env",
+            templating.create_environment(override_dir=self.overrides)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "project_generator.fleet.get_state_path",
+            return_value=os.path.join(self.tmp.name, "state.jsonl")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def scaffold(self, name, profile):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        with redirect_stdout(io.StringIO()):
+            engine.create_structure(
+                path, context={"__PROJECT_NAME__": os.path.basename(name), "__PROFILE__": profile},
+                workers=1, setup_venv=False
+            )
+        return path
+
+    def override(self, name, extra):
+        source = templating.create_environment().loader.get_source(None, name)[0]
+        with open(os.path.join(self.overrides, name), "w") as f:
+            f.write(source + extra)
+
+    def run_main(self, *argv):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            fleet.main(["--all", self.root, "--jobs", "1", *argv])
+        return out.getvalue()
+
+    def test_find_projects(self):
+        """Test projects are found by manifest (legacy markers on request), not inside venvs."""
+        web = self.scaffold("web", "web")
+        nested = self.scaffold("team/api", "mvc")
+        legacy = os.path.join(self.root, "legacy")
+        shutil.copytree(web, legacy)
+        shutil.rmtree(os.path.join(legacy, ".forge"))
+        shutil.copytree(web, os.path.join(web, "venv", "copy"))
+        assert fleet.find_projects(self.root) == sorted([web, nested])
+        assert fleet.find_projects(self.root, adopt_legacy=True) == sorted([web, nested, legacy])
+
+    def test_infer_context(self):
+        """Test a project without a manifest gets its profile from its directories."""
+        path = self.scaffold("legacy", "web")
+        open(os.path.join(path, "uv.lock"), "w").close()
+        context = fleet.infer_context(path)
+        assert context["__PROFILE__"] == "web"
+        assert context["__PACKAGE_MANAGER__"] == "uv"
+        assert context["__PROJECT_NAME__"] == "legacy"
+
+    def test_update_project_diff_summary(self):
+        """Test template changes are applied with per-file line counts."""
+        path = self.scaffold("web", "web")
+        with open(os.path.join(path, "README.md"), "a") as f:
+            f.write("\nlocal notes\n")
+        self.override("AI_DIRECTIVES.md.j2", "\n## Fleet rule\nAlways lint.\n")
+
+        result = fleet.update_project(path)
+        assert result.ok
+        changes = {c.path: c for c in result.changes}
+        assert changes["AI_DIRECTIVES.md"].status == engine.UPDATED
+        assert (changes["AI_DIRECTIVES.md"].added, changes["AI_DIRECTIVES.md"].removed) == (3, 0)
+        assert changes["README.md"].status == engine.SKIPPED
+        with open(os.path.join(path, "AI_DIRECTIVES.md")) as f:
+            assert "Always lint." in f.read()
+        assert "+3 -0" in fleet.format_result(result, self.root)
+
+    def test_update_adopts_legacy_project(self):
+        """Test files matching their template are recorded for a project without a manifest."""
+        path = self.scaffold("legacy", "web")
+        shutil.rmtree(os.path.join(path, ".forge"))
+        result = fleet.update_project(path)
+        assert not result.ok and "--adopt-legacy" in result.error
+        assert not os.path.exists(os.path.join(path, ".forge"))
+        assert "No scaffolded projects" in self.run_main()
+
+        result = fleet.update_project(path, adopt_legacy=True)
+        assert result.adopted
+        assert result.counts.get(fleet.ADOPTED)
+        assert not result.counts.get(engine.SKIPPED)
+
+        self.override("AI_DIRECTIVES.md.j2", "\nNew rule\n")
+        result = fleet.update_project(path)
+        assert not result.adopted
+        assert [c.path for c in result.changes] == ["AI_DIRECTIVES.md"]
+
+    def test_resume_after_interruption(self):
+        """Test a rerun skips projects an interrupted run finished."""
+        first = self.scaffold("a", "web")
+        second = self.scaffold("b", "mvc")
+        self.override("AI_DIRECTIVES.md.j2", "\nNew rule\n")
+        key = fleet.run_key(self.root, False)
+        with open(fleet.get_state_path(self.root), "w") as f:
+            f.write(json.dumps({"key": key}) + "\n")
+            f.write(json.dumps({"path": first, "ok": True}) + "\n")
+            f.write('{"path": "' + second)  # cut short by the interruption
+
+        output = self.run_main()
+        assert "Updating 1 of 2 projects" in output
+        assert "b (mvc)" in output and "a (web)" not in output
+        assert not os.path.exists(fleet.get_state_path(self.root))
+
+        # A state file from other templates (or options) is not resumed
+        with open(fleet.get_state_path(self.root), "w") as f:
+            f.write(json.dumps({"key": "stale"}) + "\n")
+            f.write(json.dumps({"path": first, "ok": True}) + "\n")
+        assert "Updating 2 of 2 projects" in self.run_main()
+
+    def test_failed_project_is_retried(self):
+        """Test failures exit non-zero and only they are redone on the next run."""
+        good = self.scaffold("good", "web")
+        bad = self.scaffold("bad", "web")
+        real = fleet.update_project
+
+        def flaky(path, force=False, adopt_legacy=False):
+            if path == bad:
+                return fleet.UpdateResult(path, "web", False, 0.0, error="boom")
+            return real(path, force, adopt_legacy)
+
+        with patch("project_generator.fleet.update_project", side_effect=flaky):
+            with self.assertRaises(SystemExit):
+                self.run_main()
+        state = fleet.load_state(fleet.get_state_path(self.root), fleet.run_key(self.root, False))
+        assert list(state) == [good]
+        assert "Updating 1 of 2 projects" in self.run_main()
+
+    def test_interrupt_cancels_queued_projects(self):
+        """Test Ctrl-C stops the pool without waiting for queued projects."""
+        shutdowns = []
+
+        class Pool:
+            def __init__(self, **kwargs):
+                pass
+
+            def submit(self, func, *args):
+                future = Future()
+                future.set_result(fleet.UpdateResult(args[0], "web", True, 0.0))
+                return future
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+
+        def on_result(result):
+            raise KeyboardInterrupt
+
+        with patch("project_generator.fleet.ProcessPoolExecutor", Pool):
+            with self.assertRaises(KeyboardInterrupt):
+                fleet.run_updates(["a", "b", "c"], jobs=2, on_result=on_result)
+        assert shutdowns == [(False, True)]
+
+
+if __name__ == "__main__":
+    unittest.main()
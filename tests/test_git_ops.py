@@ -2,6 +2,7 @@ import os
 import sys
 import unittest
 import subprocess
+import tempfile
 from unittest.mock import patch, call
 
 # Add src to path
@@ -32,23 +33,57 @@ class TestGitOps(unittest.TestCase):
         with self.assertRaises(SystemExit):
             git_ops.run_command("fail")
 
+    @patch('project_generator.git_ops.hook_cache.is_enabled', return_value=False)
     @patch('project_generator.git_ops.run_command')
-    def test_init_git(self, mock_run_cmd):
-        """Test git initialization sequence."""
+    def test_init_git(self, mock_run_cmd, mock_enabled):
+        """Test git initialization sequence without a file list."""
         git_ops.init_git("/tmp/test")
 
         expected_calls = [
-            call("git init", cwd="/tmp/test"),
-            call("git add .", cwd="/tmp/test"),
+            call(["git", "init", "-q", "--initial-branch=develop"], cwd="/tmp/test"),
+            call(["git", "add", "-A"], cwd="/tmp/test"),
             call(
-                'git commit -m "Initial commit: Complete AI project scaffold"',
+                ["git", "commit", "-q", "-m", "Initial commit: Complete AI project scaffold"],
                 cwd="/tmp/test"
             ),
-            call("git checkout -b develop", cwd="/tmp/test"),
-            call("pip install pre-commit && pre-commit install", cwd="/tmp/test")
+            call(["git", "branch", "main"], cwd="/tmp/test"),
+            call(["pip", "install", "pre-commit"], cwd="/tmp/test"),
+            call(["pre-commit", "install"], cwd="/tmp/test", env=None)
         ]
         mock_run_cmd.assert_has_calls(expected_calls)
 
+    @patch('project_generator.git_ops.install_hooks')
+    def test_init_git_fast_import(self, mock_hooks):
+        """Test the baseline commit is built from in-memory files."""
+        files = [
+            ("README.md", b"# Demo"),
+            ("src/__init__.py", b""),
+            ("docs/my notes.md", b"spaces are fine"),
+        ]
+        env = {
+            "GIT_COMMITTER_NAME": "Forge", "GIT_COMMITTER_EMAIL": "forge@example.com",
+            "GIT_AUTHOR_NAME": "Forge", "GIT_AUTHOR_EMAIL": "forge@example.com",
+        }
+        with tempfile.TemporaryDirectory() as tmpdirname, patch.dict(os.environ, env):
+            for path, data in files:
+                os.makedirs(os.path.dirname(os.path.join(tmpdirname, path)), exist_ok=True)
+                with open(os.path.join(tmpdirname, path), "wb") as f:
+                    f.write(data)
+
+            git_ops.init_git(tmpdirname, files=files)
+
+            def git(*args):
+                return subprocess.run(
+                    ["git", *args], cwd=tmpdirname, capture_output=True, text=True, check=True
+                ).stdout.strip()
+
+            assert git("symbolic-ref", "--short", "HEAD") == "develop"
+            assert git("rev-parse", "main") == git("rev-parse", "develop")
+            assert git("log", "-1", "--format=%s") == git_ops.BASELINE_MESSAGE
+            assert sorted(git("ls-files").splitlines()) == sorted(p for p, _ in files)
+            assert git("status", "--porcelain") == ""
+            mock_hooks.assert_called_with(tmpdirname)
+
 
 if __name__ == '__main__':
     unittest.main()
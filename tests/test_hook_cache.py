@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import git_ops, hook_cache  # noqa: E402
+
+
+class TestHookCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = os.path.join(self.tmp.name, "cache")
+        self.project = os.path.join(self.tmp.name, "project")
+        for patcher in [
+            patch("project_generator.hook_cache.get_cache_dir", return_value=self.cache),
+            patch("project_generator.hook_cache.is_enabled", return_value=True),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def make_venv(self, with_pre_commit):
+        """Creates a venv-shaped tree in the project."""
+        venv_bin = os.path.join(self.project, "venv", "bin")
+        os.makedirs(venv_bin)
+        names = ["python", "pip"] + (["pre-commit"] if with_pre_commit else [])
+        for name in names:
+            open(os.path.join(venv_bin, name), "w").close()
+        return venv_bin
+
+    def test_parse_version(self):
+        """Test versions are read from `pre-commit --version` output."""
+        assert hook_cache.parse_version(b"pre-commit 3.7.1\n") == "3.7.1"
+        assert hook_cache.parse_version("pre-commit 4.0.0rc1") == "4.0.0rc1"
+        assert hook_cache.parse_version(b"") is None
+
+    def test_patch_hook_script(self):
+        """Test the hook exports the cache once, after the shebang."""
+        hooks = os.path.join(self.project, ".git", "hooks")
+        os.makedirs(hooks)
+        with open(os.path.join(hooks, "pre-commit"), "w") as f:
+            f.write("#!/usr/bin/env bash\nexec pre-commit\n")
+
+        home = os.path.join(self.cache, "3.7.1")
+        assert hook_cache.patch_hook_script(self.project, home)
+        assert hook_cache.patch_hook_script(self.project, home)
+        with open(os.path.join(hooks, "pre-commit")) as f:
+            lines = f.read().splitlines()
+        assert lines[0] == "#!/usr/bin/env bash"
+        assert lines[1].startswith("export PRE_COMMIT_HOME=${PRE_COMMIT_HOME:-")
+        assert home in lines[1]
+        assert lines[2] == "exec pre-commit"
+        assert not hook_cache.patch_hook_script(self.tmp.name, home)
+
+    @patch("project_generator.git_ops.run_command", return_value=b"pre-commit 3.7.1\n")
+    def test_install_hooks_uses_venv_and_cache(self, mock_run):
+        """Test the venv's pre-commit is installed against the shared cache."""
+        venv_bin = self.make_venv(with_pre_commit=True)
+        pre_commit = os.path.join(venv_bin, "pre-commit")
+        git_ops.install_hooks(self.project)
+
+        commands = [c.args[0] for c in mock_run.call_args_list]
+        assert commands == [[pre_commit, "--version"], [pre_commit, "install"]]
+        env = mock_run.call_args.kwargs["env"]
+        assert env["PRE_COMMIT_HOME"] == os.path.join(self.cache, "3.7.1")
+        assert os.path.isdir(env["PRE_COMMIT_HOME"])
+
+    @patch("project_generator.git_ops.run_command", return_value=b"pre-commit 3.7.1\n")
+    def test_install_hooks_installs_into_venv(self, mock_run):
+        """Test pre-commit is installed with the venv's pip, not the one on PATH."""
+        venv_bin = self.make_venv(with_pre_commit=False)
+        git_ops.install_hooks(self.project)
+        assert mock_run.call_args_list[0].args[0] == [
+            os.path.join(venv_bin, "python"), "-m", "pip", "install", "pre-commit"
+        ]
+
+    @patch("project_generator.git_ops.subprocess.Popen")
+    @patch("project_generator.git_ops.run_command", return_value=b"pre-commit 3.7.1\n")
+    def test_warm_hooks_background(self, mock_run, mock_popen):
+        """Test a background warm-up is detached and logs inside .git."""
+        os.makedirs(os.path.join(self.project, ".git"))
+        git_ops.warm_hooks(self.project, background=True)
+
+        args, kwargs = mock_popen.call_args
+        assert args[0] == ["pre-commit", "install-hooks"]
+        assert kwargs["start_new_session"] is True
+        assert kwargs["env"]["PRE_COMMIT_HOME"] == os.path.join(self.cache, "3.7.1")
+        assert os.path.exists(os.path.join(self.project, ".git", "forge-hooks-warmup.log"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+
+# Import time allowed for the project's own modules on `--config-list`
+# (best of RUNS). Interpreter start-up and stdlib modules like argparse
+# are excluded: they vary with machine load, not with this code.
+IMPORT_BUDGET_MS = float(os.environ.get("FORGE_IMPORT_BUDGET_MS", "30"))
+RUNS = 5
+
+# Modules the config subcommands must never pull in
+HEAVY_MODULES = {
+    "jinja2", "rich", "questionary", "yaml", "tomli_w", "project_generator.engine",
+}
+# platformdirs is only needed where the user directories are not XDG ones
+if sys.platform not in ("win32", "darwin"):
+    HEAVY_MODULES.add("platformdirs")
+
+
+def import_profile(*cli_args):
+    """Runs the CLI under -X importtime and returns {module: cumulative_us}."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        env = dict(
+            os.environ,
+            PYTHONPATH=SRC_DIR,
+            XDG_CONFIG_HOME=tmpdirname,
+            HOME=tmpdirname,
+        )
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "project_generator.cli", *cli_args],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Only top-level entries; nested imports are included in their parent
+        if name.startswith("  "):
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules, proc.stderr
+
+
+class TestImportTime(unittest.TestCase):
+    def test_config_list_is_lightweight(self):
+        """Test --config-list skips heavy modules and its own imports fit the budget."""
+        modules, raw = import_profile("--config-list")
+        imported = {line.split("|")[-1].strip() for line in raw.splitlines()}
+
+        assert not HEAVY_MODULES & imported, HEAVY_MODULES & imported
+        assert "project_generator.config_manager" in imported
+
+        def own_ms(modules):
+            return sum(
+                us for name, us in modules.items() if name.startswith("project_generator")
+            ) / 1000
+
+        best = min(own_ms(import_profile("--config-list")[0]) for _ in range(RUNS))
+        assert best < IMPORT_BUDGET_MS, (
+            f"--config-list spent {best:.1f}ms importing project_generator "
+            f"(budget {IMPORT_BUDGET_MS}ms): {sorted(modules, key=modules.get)[-5:]}"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch, MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import cli, engine  # noqa: E402
+
+
+class TestInstall(unittest.TestCase):
+    @patch("project_generator.engine.venv_cache.is_enabled", return_value=False)
+    @patch("project_generator.engine.subprocess.run")
+    def test_pip_environment_single_resolve(self, mock_run, _):
+        """Test all requirements files go to one pip install."""
+        mock_run.return_value = MagicMock(returncode=0)
+        timings = {}
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            for name in ("requirements.txt", "requirements-dev.txt"):
+                open(os.path.join(tmpdirname, name), "w").close()
+
+            with redirect_stdout(io.StringIO()):
+                environment = engine.PipEnvironment(tmpdirname, timings)
+                assert environment.create()
+                assert environment.install()
+
+        venv = os.path.join(tmpdirname, "venv")
+        pip = os.path.join(venv, "bin", "pip")
+        commands = [c.args[0] for c in mock_run.call_args_list]
+        assert commands == [
+            ["python3", "-m", "venv", venv],
+            [pip, "install", "--upgrade", "pip", "setuptools", "wheel"],
+            [
+                pip, "install",
+                "-r", os.path.join(tmpdirname, "requirements.txt"),
+                "-r", os.path.join(tmpdirname, "requirements-dev.txt"),
+            ],
+        ]
+        assert set(timings) == {"venv", "bootstrap", "install"}
+
+    @patch("project_generator.engine.shutil.which", return_value="/usr/bin/uv")
+    @patch("project_generator.engine.subprocess.run")
+    def test_post_render_uv_resolves_once(self, mock_run, mock_which):
+        """Test the uv tasks share one lookup of the uv executable."""
+        mock_run.return_value = MagicMock(returncode=0)
+        graph = cli.post_render_tasks("/tmp/p", [], "uv")
+        by_name = {task.name: task for task in graph}
+        for name in ("venv", "lock", "deps"):
+            with redirect_stdout(io.StringIO()):
+                assert by_name[name].func() is not False
+        mock_which.assert_called_once_with("uv")
+        assert [c.args[0][0] for c in mock_run.call_args_list] == ["/usr/bin/uv"] * 3
+
+        mock_which.return_value = None
+        with redirect_stdout(io.StringIO()) as out:
+            graph = cli.post_render_tasks("/tmp/p", [], "uv")
+        assert not {"venv", "lock", "deps"} & {task.name for task in graph}
+        assert "uv not found" in out.getvalue()
+
+    @patch("project_generator.engine.shutil.which", return_value="/usr/bin/uv")
+    @patch("project_generator.engine.subprocess.run")
+    def test_setup_virtualenv_uv(self, mock_run, mock_which):
+        """Test uv projects are created, locked and synced into venv/."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        timings = engine.setup_virtualenv("/tmp/p", "uv")
+
+        commands = [c.args[0] for c in mock_run.call_args_list]
+        assert commands == [
+            ["/usr/bin/uv", "venv", "venv"],
+            ["/usr/bin/uv", "lock"],
+            ["/usr/bin/uv", "sync", "--frozen", "--no-install-project"],
+        ]
+        assert all(c.kwargs["cwd"] == "/tmp/p" for c in mock_run.call_args_list)
+        assert mock_run.call_args.kwargs["env"]["UV_PROJECT_ENVIRONMENT"] == "venv"
+        assert list(timings) == ["venv", "lock", "install"]
+        mock_which.assert_called_once_with("uv")
+
+    @patch("project_generator.engine.setup_virtualenv")
+    def test_uv_scaffold_files(self, mock_venv):
+        """Test uv projects pin the Python version and declare dev deps."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            context = {"__PACKAGE_MANAGER__": "uv", "__PYTHON_VERSION__": "3.11"}
+            engine.create_structure(tmpdirname, context=context)
+
+            with open(os.path.join(tmpdirname, ".python-version")) as f:
+                assert f.read() == "3.11"
+            with open(os.path.join(tmpdirname, "pyproject.toml")) as f:
+                assert "[dependency-groups]" in f.read()
+            assert not os.path.exists(os.path.join(tmpdirname, "requirements.txt"))
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            engine.create_structure(tmpdirname)
+            assert not os.path.exists(os.path.join(tmpdirname, ".python-version"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, manifest  # noqa: E402
+
+
+@patch("project_generator.engine.setup_virtualenv")
+class TestManifest(unittest.TestCase):
+    def statuses(self, report):
+        return {r.path: r.status for r in report}
+
+    def test_manifest_written(self, mock_venv):
+        """Test every written file is recorded, without stat data."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            context = {"__PROJECT_NAME__": "Tracked", "__PROFILE__": "system"}
+            report = engine.create_structure(tmpdirname, context=context)
+
+            with open(os.path.join(tmpdirname, manifest.MANIFEST_PATH)) as f:
+                data = json.load(f)
+            assert data["profile"] == "system"
+            assert data["context"] == context
+            assert set(data["files"]) == {r.path for r in report}
+            assert "mtime_ns" not in data["files"]["README.md"]
+            assert os.path.exists(os.path.join(tmpdirname, manifest.STAT_CACHE_PATH))
+
+    def test_update_skips_unchanged_without_rendering(self, mock_venv):
+        """Test a no-op update renders nothing and keeps the original context."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            engine.create_structure(tmpdirname, context={"__PROJECT_NAME__": "Keep"})
+
+            with patch.object(engine.env, "get_template") as mock_get:
+                report = engine.create_structure(tmpdirname, update=True)
+                mock_get.assert_not_called()
+
+            assert set(self.statuses(report).values()) == {engine.UNCHANGED}
+            with open(os.path.join(tmpdirname, "README.md")) as f:
+                assert "# Keep" in f.read()
+
+    def test_update_rerenders_changed_templates(self, mock_venv):
+        """Test template changes reach clean files but not modified ones."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            engine.create_structure(tmpdirname)
+            with open(os.path.join(tmpdirname, "CONTEXT.md"), "a") as f:
+                f.write("\nlocal notes")
+
+            # Pretend every template changed since the scaffold
+            with patch(
+                "project_generator.engine.templating.template_digest",
+                return_value="new-version"
+            ):
+                report = engine.create_structure(tmpdirname, update=True)
+
+            statuses = self.statuses(report)
+            assert statuses["README.md"] == engine.UPDATED
+            assert statuses["CONTEXT.md"] == engine.SKIPPED
+            with open(os.path.join(tmpdirname, "CONTEXT.md")) as f:
+                assert f.read().endswith("local notes")
+
+            # The modified file keeps its old record, so it stays protected
+            again = engine.create_structure(tmpdirname, update=True)
+            assert self.statuses(again)["CONTEXT.md"] == engine.SKIPPED
+            assert self.statuses(again)["README.md"] == engine.UPDATED
+
+    def test_file_state_uses_stat_before_hashing(self, mock_venv):
+        """Test touched-but-identical files are re-verified and refreshed."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            path = os.path.join(tmpdirname, "a.txt")
+            with open(path, "wb") as f:
+                f.write(b"hello")
+            entry = manifest.make_entry(path, "a.j2", "d", "c", b"hello")
+
+            assert manifest.file_state(path, entry) == manifest.CLEAN
+            os.utime(path, ns=(0, 0))
+            assert manifest.file_state(path, entry) == manifest.CLEAN
+            assert entry["mtime_ns"] == 0
+
+            with open(path, "wb") as f:
+                f.write(b"HELLO")
+            assert manifest.file_state(path, entry) == manifest.MODIFIED
+            os.remove(path)
+            assert manifest.file_state(path, entry) == manifest.MISSING
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, monorepo  # noqa: E402
+
+
+class TestMonorepo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "platform")
+        patcher = patch(
+            "project_generator.config_manager.get_settings",
+            side_effect=lambda defaults: dict(defaults)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def add(self, *args):
+        """Runs add-package against the test root without venv or git."""
+        with redirect_stdout(io.StringIO()):
+            monorepo.main([*args, "--root", self.root, "--no-venv", "--no-git"])
+
+    def test_add_packages(self):
+        """Test the root is created once and packages share its tooling."""
+        self.add("billing", "--profile", "web")
+        self.add("ledger", "--profile", "system")
+
+        state = monorepo.load(self.root)
+        assert sorted(state["packages"]) == ["billing", "ledger"]
+        assert state["packages"]["billing"] == {"path": "services/billing", "profile": "web"}
+
+        for shared in [".gitignore", ".pre-commit-config.yaml", "requirements-dev.txt", "ansible"]:
+            assert os.path.exists(os.path.join(self.root, shared)), shared
+        billing = os.path.join(self.root, "services", "billing")
+        assert os.path.isfile(os.path.join(billing, "README.md"))
+        for shared in [".gitignore", "requirements-dev.txt", "ansible", ".github"]:
+            assert not os.path.exists(os.path.join(billing, shared)), shared
+        assert engine.load_context(billing)["__LAYOUT__"] == "package"
+
+        with open(os.path.join(self.root, ".github", "workflows", "packages.yml")) as f:
+            workflow = f.read()
+        assert "- 'services/billing/**'" in workflow
+        assert "- 'services/ledger/**'" in workflow
+
+    def test_requirements_are_merged(self):
+        """Test the root requirements are the deduplicated union."""
+        self.add("billing")
+        self.add("ledger")
+        with open(os.path.join(self.root, "services", "ledger", "requirements.txt"), "a") as f:
+            f.write("\nhttpx  # client\nPANDAS\n")
+
+        changed = monorepo.sync_root(self.root, monorepo.load(self.root), "3.10")
+        assert changed == ["requirements.txt"]
+        requirements = monorepo.merged_requirements(self.root, monorepo.load(self.root))
+        assert requirements == ["httpx", "numpy<2", "pandas", "scikit-learn"]
+        # Nothing changed, nothing rewritten
+        assert monorepo.sync_root(self.root, monorepo.load(self.root), "3.10") == []
+
+    def test_rejects_duplicates_and_bad_names(self):
+        """Test invalid or duplicate package names fail without side effects."""
+        self.add("billing")
+        for name in ["billing", "../escape"]:
+            with self.assertRaises(SystemExit), redirect_stdout(io.StringIO()):
+                monorepo.main([name, "--root", self.root, "--no-venv", "--no-git"])
+        with open(os.path.join(self.root, monorepo.MONOREPO_FILE)) as f:
+            assert list(json.load(f)["packages"]) == ["billing"]
+
+    def test_packages_dir_stays_inside_root(self):
+        """Test --packages-dir cannot point at or outside the monorepo root."""
+        for bad in ["../elsewhere", "/tmp/abs", ".", "libs/../..", ""]:
+            with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+                self.add("billing", "--packages-dir", bad)
+            assert not os.path.exists(self.root), bad
+
+        self.add("billing", "--packages-dir", "libs/./py/")
+        assert monorepo.load(self.root)["packages"]["billing"]["path"] == "libs/py/billing"
+
+    def test_post_render_tasks(self):
+        """Test the shared venv and git tasks are only added when needed."""
+        names = [t.name for t in monorepo.post_render_tasks(self.root, True, True)]
+        assert names == ["venv", "deps", "git init", "git baseline", "hooks"]
+        assert monorepo.post_render_tasks(self.root, False, False) == []
+
+
+if __name__ == "__main__":
+    unittest.main()
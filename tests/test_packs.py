@@ -0,0 +1,175 @@
+import os
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, packs, plan, render_cache, templating  # noqa: E402
+from project_generator.assets import configs  # noqa: E402
+
+PACK_TOML = """
+[profiles.data-platform]
+description = "Spark jobs and dbt models"
+structure = ["jobs"]
+
+[profiles.data-platform.files]
+"README.md" = "README.md.j2"
+"jobs/__init__.py" = ""
+"""
+
+
+class TestPacks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.packs_dir = os.path.join(self.tmp.name, "packs")
+        pack_dir = os.path.join(self.packs_dir, "acme")
+        os.makedirs(os.path.join(pack_dir, "templates"))
+        self.pack_toml = os.path.join(pack_dir, "pack.toml")
+        with open(self.pack_toml, "w") as f:
+            f.write(PACK_TOML)
+        with open(os.path.join(pack_dir, "templates", "README.md.j2"), "w") as f:
+            f.write("# {{ project_name }} on the data platform")
+
+        for patcher in [
+            patch("project_generator.packs.get_packs_dir", return_value=self.packs_dir),
+            patch(
+                "project_generator.packs.get_registry_path",
+                return_value=os.path.join(self.tmp.name, "cache", "packs.json")
+            ),
+            patch("importlib.metadata.entry_points", return_value=[]),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.reset()
+        self.addCleanup(self.reset)
+
+    def reset(self):
+        """Forgets the in-process registry, as a new process would."""
+        packs._registry = None
+        packs.load_pack.cache_clear()
+        plan.get_plan.cache_clear()
+
+    def test_registry_is_cached(self):
+        """Test listing profiles reads the registry without loading packs."""
+        assert "data-platform" in configs.list_profiles()
+        assert configs.list_profiles()[:4] == list(configs.PROFILES)
+        self.reset()
+
+        with patch("project_generator.packs._load_directory") as mock_load:
+            assert "data-platform" in configs.list_profiles()
+            assert configs.describe_profile("data-platform") == "Spark jobs and dbt models"
+        mock_load.assert_not_called()
+
+        # Editing pack.toml invalidates the registry
+        with open(self.pack_toml, "a") as f:
+            f.write('\n[profiles.lake]\ndescription = "Lakehouse"\n')
+        self.reset()
+        assert "lake" in configs.list_profiles()
+
+    def test_pack_profile_scaffolds(self):
+        """Test a pack profile resolves to qualified templates and renders."""
+        profile = configs.get_profile("data-platform")
+        assert profile["files"] == {"README.md": "acme:README.md.j2", "jobs/__init__.py": ""}
+        assert templating.template_digest("acme:README.md.j2").startswith("pack:")
+        assert templating.template_variables("acme:README.md.j2") == ("project_name",)
+        assert templating.template_digest("acme:missing.j2") is None
+
+        pack_env = templating.create_environment(override_dir="")
+        context = {"__PROFILE__": "data-platform", "__PROJECT_NAME__": "lake"}
+        with patch.object(engine, "env", pack_env), tempfile.TemporaryDirectory() as target:
+            engine.create_structure(target, context=context, workers=1, setup_venv=False)
+            with open(os.path.join(target, "README.md")) as f:
+                assert f.read() == "# lake on the data platform"
+            assert os.path.isfile(os.path.join(target, "jobs", "__init__.py"))
+
+    def test_environment_reads_registry_lazily(self):
+        """Test building an environment loads no pack until a pack template is used."""
+        with patch("project_generator.packs.build_registry") as mock_build:
+            env = templating.create_environment(override_dir="")
+            env.get_template("README.md.j2")
+        mock_build.assert_not_called()
+        assert packs._registry is None
+
+        assert "on the data platform" in env.get_template("acme:README.md.j2").render()
+        assert packs._registry is not None
+
+    def test_importing_engine_loads_no_pack(self):
+        """Test a fresh process importing the engine leaves the registry unread."""
+        code = (
+            "import project_generator.engine, project_generator.packs as p, sys; "
+            "sys.exit(p._registry is not None or 'forge_test_pack' in sys.modules)"
+        )
+        env = dict(
+            os.environ,
+            PYTHONPATH=os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")),
+            XDG_CONFIG_HOME=self.tmp.name,
+            XDG_CACHE_HOME=self.tmp.name,
+        )
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        assert not os.path.exists(os.path.join(self.tmp.name, "forge", "template-packs.json"))
+
+    def test_entry_point_pack(self):
+        """Test packs exposed through entry points are discovered."""
+        module = types.ModuleType("forge_test_pack")
+        module.TEMPLATE_DIR = os.path.join(self.packs_dir, "acme", "templates")
+        module.PROFILES = {"ml-service": {"description": "Model serving", "files": {}}}
+        entry_point = EntryPoint("widgets", "forge_test_pack", packs.ENTRY_POINT_GROUP)
+        with patch.dict(sys.modules, {"forge_test_pack": module}), \
+                patch("importlib.metadata.entry_points", return_value=[entry_point]):
+            registry = packs.load_registry(refresh=True)
+            assert registry["widgets"]["source"] == "entry_point"
+            assert configs.describe_profile("ml-service") == "Model serving"
+            assert configs.get_profile("ml-service")["description"] == "Model serving"
+
+    def test_digest_covers_includes(self):
+        """Test editing a partial changes the digest of the pack template using it."""
+        templates = os.path.join(self.packs_dir, "acme", "templates")
+        with open(os.path.join(templates, "README.md.j2"), "w") as f:
+            f.write('{% include "acme:partials/intro.j2" %}')
+        os.makedirs(os.path.join(templates, "partials"))
+        partial = os.path.join(templates, "partials", "intro.j2")
+        with open(partial, "w") as f:
+            f.write("Hello")
+        self.reset()
+        before = templating.template_digest("acme:README.md.j2", "")
+        with open(partial, "w") as f:
+            f.write("Hello again")
+        assert templating.template_digest("acme:README.md.j2", "") != before
+
+    def test_override_digest_covers_includes(self):
+        """Test override digests follow includes, and dynamic includes are never cached."""
+        overrides = os.path.join(self.tmp.name, "overrides")
+        os.makedirs(os.path.join(overrides, "partials"))
+        with open(os.path.join(overrides, "README.md.j2"), "w") as f:
+            f.write('{% include "partials/footer.j2" %}')
+        with open(os.path.join(overrides, "partials", "footer.j2"), "w") as f:
+            f.write("v1")
+        before = templating.template_digest("README.md.j2", overrides)
+        assert before.startswith("override:")
+        with open(os.path.join(overrides, "partials", "footer.j2"), "w") as f:
+            f.write("v2")
+        assert templating.template_digest("README.md.j2", overrides) != before
+
+        with open(os.path.join(overrides, "README.md.j2"), "w") as f:
+            f.write("{% include footer_name %}")
+        digest = templating.template_digest("README.md.j2", overrides)
+        assert templating.is_volatile(digest)
+        assert templating.template_digest("README.md.j2", overrides) != digest
+
+        env = templating.create_environment(override_dir=overrides, packs={})
+        context = {"footer_name": "partials/footer.j2"}
+        with patch("project_generator.engine.env", env):
+            entries = render_cache.get_cache().stats()["entries"]
+            assert engine.render_file("README.md.j2", context, digest) == b"v2"
+            assert render_cache.get_cache().stats()["entries"] == entries
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import plan  # noqa: E402
+from project_generator.assets import configs  # noqa: E402
+
+
+class TestPlan(unittest.TestCase):
+    def tearDown(self):
+        plan.get_plan.cache_clear()
+
+    def test_plan_directories(self):
+        """Test directories are deduplicated and collapsed to leaves."""
+        dirs = plan.plan_directories(
+            ["tests", "tests", "src/app", "src/app/models", ".github/workflows"],
+            ["README.md", "src/app/main.py", "docs/features/stub.txt"],
+        )
+        assert dirs == [".github/workflows", "docs/features", "src/app/models", "tests"]
+
+    def test_monorepo_layouts(self):
+        """Test packages leave shared tooling to the root plan."""
+        package = plan.get_plan("fullstack", "pip", plan.PACKAGE)
+        files = dict(package.files)
+        assert "README.md" in files and "requirements.txt" in files
+        assert ".gitignore" not in files and "requirements-dev.txt" not in files
+        assert not any(f.startswith((".github/", "ansible/")) for f in files)
+        assert not any(d.startswith("ansible") for d in package.directories)
+
+        root = plan.get_plan("fullstack", "pip", plan.ROOT)
+        assert dict(root.files)["README.md"] == "monorepo/README.md.j2"
+        assert "requirements-dev.txt" in dict(root.files)
+        with self.assertRaises(ValueError):
+            plan.get_plan("fullstack", "pip", "nested")
+
+    def test_get_plan_is_cached_and_frozen(self):
+        """Test plans are built once per (profile, manager) and immutable."""
+        first = plan.get_plan("fullstack", "pip")
+        assert plan.get_plan("fullstack", "pip") is first
+        assert plan.get_plan("fullstack", "uv") is not first
+        with self.assertRaises(AttributeError):
+            first.files = ()
+
+        # The shared config dicts are never mutated
+        assert configs.PROFILES["fullstack"]["structure"].count("tests") == 2
+        assert len(first.directories) == len(set(first.directories))
+
+    def test_get_plan_filters_manager_files(self):
+        """Test manager-specific files only appear for their manager."""
+        pip_files = dict(plan.get_plan("web", "pip").files)
+        uv_files = dict(plan.get_plan("web", "uv").files)
+        poetry_files = dict(plan.get_plan("web", "poetry").files)
+        assert "requirements.txt" in pip_files and ".python-version" not in pip_files
+        assert "requirements.txt" not in uv_files and ".python-version" in uv_files
+        assert "requirements.txt" not in poetry_files
+        assert list(pip_files)[0] == list(configs.get_profile("web")["files"])[0]
+
+    def test_get_plan_validates(self):
+        """Test unknown managers and escaping paths are rejected."""
+        with self.assertRaises(ValueError):
+            plan.get_plan("fullstack", "conda")
+
+        broken = {"structure": ["../outside"], "files": {}}
+        with patch.dict(configs.PROFILES, {"broken": broken}):
+            with self.assertRaises(ValueError):
+                plan.get_plan("broken", "pip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, render_cache, templating  # noqa: E402
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("project_generator.templating.get_override_dir", return_value="")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        render_cache.get_cache().clear()
+        self.addCleanup(render_cache.get_cache().clear)
+
+    def test_lru_bounds(self):
+        """Test entries are evicted least recently used first, by count and size."""
+        cache = render_cache.RenderCache(max_entries=2, max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") == b"1234"
+        cache.put("c", b"1234")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+
+        cache.put("d", b"12345678")
+        assert cache.size <= 10
+        cache.put("huge", b"x" * 11)
+        assert cache.get("huge") is None
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["evictions"] == 3
+
+    def test_template_variables(self):
+        """Test the index records only the variables a template reads."""
+        assert templating.template_variables("ansible/ansible.cfg.j2") == ()
+        assert templating.template_variables("README.md.j2") == ("license", "project_name")
+        assert templating.template_variables("missing.j2") is None
+
+    def test_key_ignores_unused_variables(self):
+        """Test contexts differing only in unread variables share a key."""
+        digest = templating.template_digest("README.md.j2")
+        a = engine.build_jinja_context({"__PROJECT_NAME__": "one", "__PROFILE__": "web"})
+        b = engine.build_jinja_context({"__PROJECT_NAME__": "one", "__PROFILE__": "system"})
+        c = engine.build_jinja_context({"__PROJECT_NAME__": "two"})
+        key = render_cache.cache_key("README.md.j2", digest, a)
+        assert key == render_cache.cache_key("README.md.j2", digest, b)
+        assert key != render_cache.cache_key("README.md.j2", digest, c)
+
+    def test_render_file_reuses_output(self):
+        """Test a context-independent template renders once across projects."""
+        cache = render_cache.get_cache()
+        for name in ["one", "two", "three"]:
+            context = engine.build_jinja_context({"__PROJECT_NAME__": name})
+            data = engine.render_file("docs/feature_template.md.j2", context)
+            readme = engine.render_file("README.md.j2", context)
+            assert name.encode() in readme
+        assert data == engine.render_file("docs/feature_template.md.j2", {})
+        stats = cache.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 4
+
+
+if __name__ == "__main__":
+    unittest.main()
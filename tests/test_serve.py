@@ -0,0 +1,185 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import tarfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, serve  # noqa: E402
+
+
+class TestServe(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        serve.warm()
+        cls.executor = ThreadPoolExecutor(max_workers=2)
+        cls.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        address = []
+
+        def on_ready(addr):
+            address.extend(addr)
+            ready.set()
+
+        cls.task = cls.loop.create_task(
+            serve.serve("127.0.0.1", 0, cls.executor, 2, 4, on_ready)
+        )
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+        assert ready.wait(10)
+        cls.base = f"http://{address[0]}:{address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        async def stop():
+            cls.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await cls.task
+
+        asyncio.run_coroutine_threadsafe(stop(), cls.loop).result(10)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join(10)
+        cls.executor.shutdown()
+
+    def request(self, path, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        with urllib.request.urlopen(f"{self.base}{path}", data=data, timeout=10) as resp:
+            return resp.status, resp.headers, resp.read()
+
+    def test_scaffold_tar_gz(self):
+        """Test a context renders to the same files as render_tree."""
+        context = {"__PROFILE__": "web", "__PROJECT_NAME__": "portal"}
+        status, headers, body = self.request("/scaffold", context)
+        assert status == 200
+        assert headers["Content-Type"] == "application/gzip"
+        with tarfile.open(fileobj=io.BytesIO(body), mode="r:gz") as tar:
+            readme = tar.extractfile("README.md").read()
+        assert readme == engine.render_tree(context)["README.md"][0]
+
+    def test_scaffold_zip_and_metrics(self):
+        """Test zip output and that scaffolds show up in the metrics."""
+        status, _, body = self.request("/scaffold?format=zip&root=svc", {"__PROFILE__": "system"})
+        assert status == 200
+        assert "svc/README.md" in zipfile.ZipFile(io.BytesIO(body)).namelist()
+
+        _, _, body = self.request("/metrics")
+        metrics = json.loads(body)
+        assert metrics["scaffold_latency_ms"]["count"] >= 1
+        assert metrics["scaffold_latency_ms"]["p50"] > 0
+        assert metrics["in_flight"] == 0
+        assert metrics["render_cache"]["lookups"] >= 1
+
+    def test_bad_requests(self):
+        """Test invalid contexts and routes are rejected with 4xx."""
+        for path, body, expected in [
+            ("/scaffold", {"__PROFILE__": "nope"}, 400),
+            ("/scaffold", {"profile": "web"}, 400),
+            ("/scaffold", ["not", "an", "object"], 400),
+            ("/missing", None, 404),
+        ]:
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                self.request(path, body)
+            assert ctx.exception.code == expected, path
+
+    def raw_request(self, data):
+        host, port = self.base.rsplit("/", 1)[1].split(":")
+        with socket.create_connection((host, int(port)), timeout=10) as sock:
+            sock.sendall(data)
+            return sock.makefile("rb").readline()
+
+    def test_bad_root_and_content_length(self):
+        """Test path-like roots and bad Content-Length values are 400s."""
+        for root in ["../../evil", "a/b", "a%5Cb", "..", "%00", "/abs"]:
+            with self.assertRaises(urllib.error.HTTPError) as ctx:
+                self.request(f"/scaffold?root={root}", {})
+            assert ctx.exception.code == 400, root
+
+        for length in [b"-1", b"abc", b"\xc2\xb2"]:
+            status = self.raw_request(
+                b"POST /scaffold HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}"
+            )
+            assert status.startswith(b"HTTP/1.1 400 "), (length, status)
+
+    def test_slow_client_times_out(self):
+        """Test a client that stops sending gets a 408 instead of holding the connection."""
+        async def run(data):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            with self.assertRaises(serve.RequestError) as ctx:
+                await serve.read_request(reader, timeout=0.05)
+            return ctx.exception.status
+
+        assert asyncio.run(run(b"GET /healthz HTTP/1.1\r\n")) == 408
+        assert asyncio.run(run(b"POST /scaffold HTTP/1.1\r\nContent-Length: 10\r\n\r\n{")) == 408
+
+    def test_project_name_in_filename(self):
+        """Test CR/LF and non-ASCII project names cannot break the headers."""
+        for name in ['x"\r\nSet-Cookie: a=b', "项目"]:
+            status, headers, body = self.request("/scaffold", {"__PROJECT_NAME__": name})
+            assert status == 200, name
+            assert headers["Set-Cookie"] is None
+            disposition = headers["Content-Disposition"]
+            assert disposition.isascii() and "\r" not in disposition and "\n" not in disposition
+            assert quote(f"{name}.tar.gz", safe="") in disposition
+            assert body
+
+    def test_bad_header_is_500(self):
+        """Test a header that cannot be encoded becomes a 500, not a dropped connection."""
+        with self.assertRaises(ValueError):
+            serve.encode_response(200, {"X-Name": "项目"}, b"")
+        with self.assertRaises(ValueError):
+            serve.encode_response(200, {"X-Name": "a\r\nb: c"}, b"")
+
+        service = serve.ScaffoldService(self.executor, 1, 1)
+
+        async def route(method, url, body):
+            return 200, {"X-Name": "项目"}, b"{}"
+
+        class Writer:
+            data = b""
+
+            def write(self, data):
+                Writer.data += data
+
+            async def drain(self):
+                pass
+
+            def close(self):
+                pass
+
+            async def wait_closed(self):
+                pass
+
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"GET /healthz HTTP/1.1\r\n\r\n")
+        service.route = route
+        asyncio.run(service.handle(reader, Writer()))
+        assert Writer.data.startswith(b"HTTP/1.1 500 ")
+
+    def test_busy_server_rejects(self):
+        """Test requests beyond the concurrency and queue limits get 503."""
+        service = serve.ScaffoldService(self.executor, max_concurrent=1, max_queue=0)
+
+        async def run():
+            await service.slots.acquire()
+            with self.assertRaises(serve.RequestError) as ctx:
+                await service.scaffold({}, b"{}")
+            return ctx.exception.status
+
+        assert asyncio.run(run()) == 503
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, render_cache, speculate, venv_cache  # noqa: E402
+
+GUESSES = {"__PROFILE__": "fullstack", "__PACKAGE_MANAGER__": "pip"}
+
+
+def fake_run(cmd):
+    """Stands in for VenvBuild._run: `python3 -m venv` creates the directory."""
+    if cmd[1:3] == ["-m", "venv"]:
+        os.makedirs(cmd[3])
+    return True
+
+
+class TestSpeculate(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("project_generator.templating.get_override_dir", return_value="")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch("project_generator.venv_cache.is_enabled", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        render_cache.get_cache().clear()
+        self.addCleanup(render_cache.get_cache().clear)
+
+    def test_renders_only_answered_templates(self):
+        """Test renders wait for every variable they read to be answered."""
+        speculator = speculate.Speculator()
+        self.addCleanup(speculator.cancel)
+        speculator.update({"__PROJECT_NAME__": "demo"}, GUESSES)
+        speculator.wait()
+        rendered = {key[0] for key in speculator._renders}
+        assert "docs/index.md.j2" in rendered
+        assert "README.md.j2" not in rendered  # reads license
+
+        answers = {
+            "__PROJECT_NAME__": "demo", "__AUTHOR_NAME__": "Ada", "__PROFILE__": "fullstack",
+            "__AI_PERSONA__": "standard", "__PROJECT_DESCRIPTION__": "Demo",
+            "__PYTHON_VERSION__": "3.11", "__PACKAGE_MANAGER__": "pip", "__LICENSE__": "MIT",
+        }
+        speculator.update(answers)
+        speculator.wait()
+        assert {key[0] for key in speculator._renders} >= {"README.md.j2", "pyproject.toml.j2"}
+
+        before = render_cache.get_cache().stats()
+        with tempfile.TemporaryDirectory() as tmp:
+            with patch("builtins.print"):
+                engine.create_structure(tmp, context=answers, setup_venv=False)
+        after = render_cache.get_cache().stats()
+        assert after["misses"] == before["misses"]
+
+    def test_venv_build_follows_answers(self):
+        """Test the venv build starts with the profile and stops for another manager."""
+        with patch("project_generator.venv_cache.is_enabled", return_value=True), \
+                patch("project_generator.speculate.VenvBuild") as build:
+            speculator = speculate.Speculator()
+            self.addCleanup(speculator.cancel)
+            speculator.update({"__PROJECT_NAME__": "demo"}, GUESSES)
+            build.assert_not_called()
+
+            speculator.update({"__PROFILE__": "web"}, GUESSES)
+            build.assert_called_once()
+            names = [name for name, _ in build.call_args[0][0]]
+            assert names == ["requirements.txt", "requirements-dev.txt"]
+            build.return_value.start.assert_called_once()
+
+            speculator.update({"__PROFILE__": "web", "__PACKAGE_MANAGER__": "uv"}, GUESSES)
+            build.return_value.cancel.assert_called_once()
+            assert speculator._venv is None
+
+    def test_no_venv_build_without_venv(self):
+        """Test dry runs and archives (build_venv=False) never start a venv build."""
+        with patch("project_generator.venv_cache.is_enabled", return_value=True), \
+                patch("project_generator.speculate.VenvBuild") as build:
+            speculator = speculate.Speculator(build_venv=False)
+            self.addCleanup(speculator.cancel)
+            speculator.update({"__PROFILE__": "web"}, GUESSES)
+            build.assert_not_called()
+
+    def test_venv_build_stores_cache_entry(self):
+        """Test a finished build is published under the project's cache key."""
+        with tempfile.TemporaryDirectory() as tmp, patch(
+            "project_generator.venv_cache.get_cache_dir", return_value=os.path.join(tmp, "cache")
+        ), patch("project_generator.venv_cache.interpreter_id", return_value="python"):
+            requirements = (("requirements.txt", b"requests\n"),)
+            build = speculate.VenvBuild(requirements)
+            with patch.object(build, "_run", side_effect=fake_run):
+                build.run()
+            assert build.status == "built"
+
+            with open(os.path.join(tmp, "requirements.txt"), "wb") as f:
+                f.write(b"requests\n")
+            key = venv_cache.cache_key([os.path.join(tmp, "requirements.txt")])
+            assert venv_cache.lookup(key) is not None
+
+            cancelled = speculate.VenvBuild((("requirements.txt", b"flask\n"),))
+            cancelled.cancel()
+            cancelled.run()
+            assert cancelled.status == "cancelled"
+            assert not [n for n in os.listdir(os.path.join(tmp, "cache")) if n.startswith(".build-")]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import tasks  # noqa: E402
+
+
+class TestTasks(unittest.TestCase):
+    def test_independent_tasks_overlap(self):
+        """Test tasks without dependencies between them run concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+        order = []
+
+        def step(name):
+            def run():
+                if name in ("a", "b"):
+                    barrier.wait()
+                order.append(name)
+            return run
+
+        graph = [
+            tasks.Task("a", step("a")),
+            tasks.Task("b", step("b")),
+            tasks.Task("c", step("c"), ("a", "b")),
+        ]
+        results = tasks.run_tasks(graph)
+        assert all(r.status == tasks.OK for r in results.values())
+        assert order[-1] == "c"
+
+    def test_failure_propagation(self):
+        """Test dependents of a failure are skipped, other branches run."""
+        def fail():
+            sys.exit(1)
+
+        ran = []
+        graph = [
+            tasks.Task("venv", lambda: False, required=False),
+            tasks.Task("deps", lambda: ran.append("deps"), ("venv",), required=False),
+            tasks.Task("git init", fail),
+            tasks.Task("baseline", lambda: ran.append("baseline"), ("git init",), after=("venv",)),
+            tasks.Task("other", lambda: ran.append("other")),
+        ]
+        results = tasks.run_tasks(graph)
+
+        assert results["venv"].status == tasks.FAILED
+        assert results["deps"].status == tasks.SKIPPED
+        assert results["deps"].error == "blocked by venv"
+        assert results["git init"].error == "exited with status 1"
+        assert results["baseline"].status == tasks.SKIPPED
+        assert ran == ["other"]
+        assert tasks.failed_required(graph, results) == ["git init", "baseline"]
+
+    def test_after_orders_without_blocking(self):
+        """Test `after` waits for a task even when it fails."""
+        graph = [
+            tasks.Task("lock", lambda: False, required=False),
+            tasks.Task("baseline", lambda: None, after=("lock",)),
+        ]
+        results = tasks.run_tasks(graph)
+        assert results["baseline"].status == tasks.OK
+        assert results["baseline"].start >= results["lock"].end
+
+    def test_critical_path(self):
+        """Test the critical path follows the slowest chain."""
+        graph = [
+            tasks.Task("venv", lambda: time.sleep(0.05)),
+            tasks.Task("deps", lambda: time.sleep(0.1), ("venv",)),
+            tasks.Task("git", lambda: None),
+            tasks.Task("hooks", lambda: None, ("git",)),
+        ]
+        results = tasks.run_tasks(graph)
+        assert tasks.critical_path(graph, results) == ["venv", "deps"]
+
+    def test_validate(self):
+        """Test unknown dependencies and cycles are rejected up front."""
+        with self.assertRaises(ValueError):
+            tasks.run_tasks([tasks.Task("a", lambda: None, ("missing",))])
+        with self.assertRaises(ValueError):
+            tasks.run_tasks([
+                tasks.Task("a", lambda: None, ("b",)),
+                tasks.Task("b", lambda: None, ("a",)),
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
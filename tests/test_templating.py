@@ -0,0 +1,80 @@
+import os
+import sys
+import hashlib
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import templating  # noqa: E402
+
+CONTEXT = {
+    "project_name": "Compiled",
+    "author_name": "Alice",
+    "license": "MIT",
+    "python_version": "3.11",
+    "package_manager": "poetry",
+    "profile": "fullstack",
+}
+
+
+class TestTemplating(unittest.TestCase):
+    def test_compiled_matches_source(self):
+        """Test precompiled templates render identically to source."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            archive = templating.compile_templates(
+                os.path.join(tmpdirname, "templates.zip")
+            )
+            compiled = templating.create_environment(
+                compiled_archive=archive, override_dir=""
+            )
+            source = templating.create_environment(compiled_archive="", override_dir="")
+
+            for name in ["pyproject.toml.j2", "README.md.j2", ".agent/rules/ai_behavior.md.j2"]:
+                assert (
+                    compiled.get_template(name).render(**CONTEXT)
+                    == source.get_template(name).render(**CONTEXT)
+                )
+
+    def test_override_takes_precedence(self):
+        """Test a user override is compiled from source ahead of the archive."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            archive = templating.compile_templates(
+                os.path.join(tmpdirname, "templates.zip")
+            )
+            override_dir = os.path.join(tmpdirname, "overrides")
+            os.makedirs(override_dir)
+            with open(os.path.join(override_dir, "README.md.j2"), "w") as f:
+                f.write("# {{ project_name }} (custom)")
+
+            env = templating.create_environment(
+                compiled_archive=archive, override_dir=override_dir
+            )
+            assert env.get_template("README.md.j2").render(**CONTEXT) == "# Compiled (custom)"
+            # Templates without an override still come from the archive
+            assert "[tool.poetry]" in env.get_template("pyproject.toml.j2").render(**CONTEXT)
+
+    def test_static_outputs_match_render(self):
+        """Test prebuilt static outputs are exactly what rendering writes."""
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            templating.write_static(tmpdirname)
+            env = templating.create_environment(compiled_archive="", override_dir="")
+            index = templating.build_index()
+            static = [name for name, entry in index.items() if entry.get("static")]
+            assert "ansible/ansible.cfg.j2" in static
+            assert not index["README.md.j2"].get("static")
+
+            for name in static:
+                rendered = env.get_template(name).render(**CONTEXT).strip().encode()
+                with open(os.path.join(tmpdirname, name), "rb") as f:
+                    assert f.read() == rendered, name
+                assert hashlib.sha256(rendered).hexdigest() == index[name]["content_hash"]
+                assert templating.static_source(name, "", tmpdirname)[0] == (
+                    os.path.join(tmpdirname, name)
+                )
+            assert templating.static_source("README.md.j2", "", tmpdirname) is None
+
+
+if __name__ == "__main__":
+    unittest.main()
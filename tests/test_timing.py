@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, render_cache, timing  # noqa: E402
+
+
+class TestTiming(unittest.TestCase):
+    def tearDown(self):
+        timing.disable()
+
+    def test_span_disabled(self):
+        """Test spans record nothing unless recording is enabled."""
+        with timing.span("idle"):
+            pass
+        assert not timing.is_enabled()
+        assert timing.disable() == []
+
+    def test_summarize(self):
+        """Test spans aggregate by category and name, slowest first."""
+        timing.enable()
+        for _ in range(3):
+            with timing.span("a.j2", "render"):
+                pass
+        with timing.span("slow", "phase"):
+            with timing.span("b.j2", "render", size=1):
+                pass
+        events = timing.disable()
+        assert len(events) == 5
+        rows = timing.summarize(events)
+        assert rows[0][:3] == ("phase", "slow", 1)
+        assert ("render", "a.j2", 3) in [row[:3] for row in rows]
+        assert next(e for e in events if e["name"] == "b.j2")["args"] == {"size": 1}
+
+    def test_recording_trace(self):
+        """Test a scaffold writes per-template spans to a Chrome trace."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            trace = os.path.join(tmpdir, "trace.json")
+            target = os.path.join(tmpdir, "project")
+            # Renders served from the cache record no render span
+            render_cache.get_cache().clear()
+            with timing.recording(trace=trace):
+                engine.create_structure(target, workers=1, setup_venv=False)
+            assert not timing.is_enabled()
+
+            with open(trace) as f:
+                events = json.load(f)["traceEvents"]
+            assert {e["ph"] for e in events} == {"X"}
+            names = {(e["cat"], e["name"]) for e in events}
+            assert ("phase", "total") in names
+            assert ("render", "README.md.j2") in names
+            assert ("write", "README.md") in names
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+from project_generator import engine, venv_cache  # noqa: E402
+
+
+def fake_create(venv_path, timings=None):
+    """Stands in for create_venv: a tiny venv-shaped tree."""
+    os.makedirs(os.path.join(venv_path, "bin"))
+    os.makedirs(os.path.join(venv_path, "lib/site-packages"))
+    os.symlink("lib", os.path.join(venv_path, "lib64"))
+    with open(os.path.join(venv_path, "bin/activate"), "w") as f:
+        f.write(f'VIRTUAL_ENV="{venv_path}"\n')
+    os.chmod(os.path.join(venv_path, "bin/activate"), 0o755)
+    with open(os.path.join(venv_path, "lib/site-packages/mod.py"), "w") as f:
+        f.write("X = 1\n")
+    return True
+
+
+class TestVenvCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch(
+            "project_generator.venv_cache.get_cache_dir",
+            return_value=os.path.join(self.tmp.name, "cache")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_cache_key_tracks_requirements(self):
+        """Test the key changes with requirements content, not location."""
+        paths = []
+        for name in ["a", "b"]:
+            os.makedirs(os.path.join(self.tmp.name, name))
+            path = os.path.join(self.tmp.name, name, "requirements.txt")
+            with open(path, "w") as f:
+                f.write("numpy\n")
+            paths.append(path)
+
+        assert venv_cache.cache_key([paths[0]]) == venv_cache.cache_key([paths[1]])
+
+        with open(paths[1], "a") as f:
+            f.write("pandas\n")
+        assert venv_cache.cache_key([paths[0]]) != venv_cache.cache_key([paths[1]])
+
+    @patch("project_generator.engine.venv_cache.is_enabled", return_value=True)
+    @patch("project_generator.engine.venv_cache.cache_key", return_value="k1")
+    @patch("project_generator.engine.install_requirements", return_value=True)
+    @patch("project_generator.engine.create_venv", side_effect=fake_create)
+    def test_setup_virtualenv_builds_once_and_clones(self, mock_build, mock_install, *_):
+        """Test pip only runs on a miss and clones fix up absolute paths."""
+        first = os.path.join(self.tmp.name, "first")
+        second = os.path.join(self.tmp.name, "second")
+        os.makedirs(first)
+        os.makedirs(second)
+
+        engine.setup_virtualenv(first, "pip")
+        engine.setup_virtualenv(second, "pip")
+
+        assert mock_build.call_count == 1
+        assert mock_install.call_count == 1
+        cached = venv_cache.lookup("k1")
+        assert cached
+
+        venv = os.path.join(second, "venv")
+        with open(os.path.join(venv, "bin/activate")) as f:
+            assert f.read() == f'VIRTUAL_ENV="{venv}"\n'
+        assert os.access(os.path.join(venv, "bin/activate"), os.X_OK)
+        assert os.path.islink(os.path.join(venv, "lib64"))
+        assert not os.path.exists(os.path.join(venv, venv_cache.MARKER))
+
+        # Library files are shared with the cache, scripts are not
+        src = os.path.join(cached, "lib/site-packages/mod.py")
+        dest = os.path.join(venv, "lib/site-packages/mod.py")
+        assert os.stat(src).st_ino == os.stat(dest).st_ino
+        assert os.stat(os.path.join(cached, "bin/activate")).st_ino != os.stat(
+            os.path.join(venv, "bin/activate")
+        ).st_ino
+
+    @patch("project_generator.engine.venv_cache.is_enabled", return_value=True)
+    @patch("project_generator.engine.venv_cache.clone")
+    @patch("project_generator.engine.install_requirements", return_value=True)
+    @patch("project_generator.engine.create_venv", side_effect=fake_create)
+    def test_setup_virtualenv_existing_venv(self, mock_build, mock_install, mock_clone, _):
+        """Test an existing venv is updated in place instead of cloned over."""
+        project = os.path.join(self.tmp.name, "project")
+        os.makedirs(os.path.join(project, "venv"))
+
+        engine.setup_virtualenv(project, "pip")
+
+        mock_clone.assert_not_called()
+        assert mock_build.call_args.args[0] == os.path.join(project, "venv")
+        assert mock_install.call_args.args[0] == os.path.join(project, "venv")
+
+
+if __name__ == "__main__":
+    unittest.main()
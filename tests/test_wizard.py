@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import sys
 import os
 
@@ -67,6 +67,18 @@ class TestWizard(unittest.TestCase):
         assert context["__LICENSE__"] == "MIT"
         assert context["__PROFILE__"] == "fullstack"
 
+    def test_record_skips_aborted_answers(self):
+        """Test an aborted prompt (None) is neither recorded nor speculated on."""
+        speculator = MagicMock()
+        w = wizard.Wizard(console=MagicMock(), speculator=speculator)
+
+        assert w.record("__PROFILE__", None) is None
+        assert w.answers == {}
+        speculator.update.assert_not_called()
+
+        assert w.record("__PROFILE__", "web") == "web"
+        speculator.update.assert_called_once_with({"__PROFILE__": "web"}, {})
+
 
 if __name__ == '__main__':
     unittest.main()